@@ -1,6 +1,10 @@
 import pygame
 import json
+import Constants
 from typing import List
+from collections import OrderedDict
+from AssetController import surfaceBytes
+from AssetBundle import getBundle
 """
 Tutorial References and Credits: 
     CDcodes: "Pygame Sprite Sheet Tutorial: How to Load, Parse, and Use Sprite Sheets"
@@ -18,6 +22,13 @@ def obtainSpriteAnimationImages(filename: str) -> List[pygame.Surface]:
     Return: 
         List[pygame.Surface]: list of animation images pulled from the sprite sheet. 
     """
+    # frames baked into the asset bundle are already sliced, with transparency instead of a colorkey
+    bundle = getBundle()
+    if bundle is not None:
+        animation_images = bundle.getAnimationImages(filename)
+        if animation_images is not None:
+            return animation_images
+
     sprite_sheet = pygame.image.load(filename).convert()
     sprite_sheet_meta_data_file_name = filename.replace("png", "json")
 
@@ -50,4 +61,79 @@ def obtainSpriteAnimationImages(filename: str) -> List[pygame.Surface]:
     
     except Exception as e: 
         print(e)
-        return None
\ No newline at end of file
+        return None
+
+# (id(animation_images), size_bucket, angle_bucket) -> [animation_images, frames, size_in_bytes]
+_frame_cache = OrderedDict()
+_frame_cache_bytes = 0
+frame_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+def _bucketKey(animation_images: List[pygame.Surface], dimmensions: tuple, angle: float) -> tuple:
+    """Return the cache key for the size and angle buckets a sprite falls into."""
+    size_step = Constants.ANIMATION_SIZE_STEP
+    angle_step = Constants.ANIMATION_ANGLE_STEP
+    size_bucket = tuple(max(size_step, round(dimmension / size_step) * size_step) for dimmension in dimmensions)
+    angle_bucket = (round(angle / angle_step) * angle_step) % 360
+    return (id(animation_images), size_bucket, angle_bucket)
+
+def getAnimationFrames(animation_images: List[pygame.Surface], dimmensions: tuple, angle: float) -> List[pygame.Surface]:
+    """Obtain animation frames rotated and scaled for a sprite, preparing them only on a cache miss.
+    Sizes and angles are bucketed by ANIMATION_SIZE_STEP and ANIMATION_ANGLE_STEP so that
+    sprites of similar size and orientation share one prepared sequence.
+    Args:
+        animation_images (List[pygame.Surface]): frames from obtainSpriteAnimationImages
+        dimmensions (tuple): (width, height) of the sprite playing the animation
+        angle (float): rotation of the sprite in degrees
+    Returns:
+        List[pygame.Surface]: the prepared frames, shared between every sprite using them
+    """
+    global _frame_cache_bytes
+    key = _bucketKey(animation_images, dimmensions, angle)
+    entry = _frame_cache.get(key)
+    # The cached list is kept alive by the entry, so a matching id is the same list
+    if entry is not None and entry[0] is animation_images:
+        frame_cache_stats["hits"] += 1
+        _frame_cache.move_to_end(key)
+        return entry[1]
+
+    frame_cache_stats["misses"] += 1
+    _, size_bucket, angle_bucket = key
+    frames = [
+        pygame.transform.scale(pygame.transform.rotate(image, angle_bucket), size_bucket)
+        for image in animation_images
+    ]
+    size = sum(surfaceBytes(frame) for frame in frames)
+    if entry is not None:
+        _frame_cache_bytes -= entry[2]
+    _frame_cache[key] = [animation_images, frames, size]
+    _frame_cache_bytes += size
+
+    while _frame_cache_bytes > Constants.ANIMATION_FRAME_CACHE_MAX_BYTES and len(_frame_cache) > 1:
+        _, (_, _, evicted_size) = _frame_cache.popitem(last=False)
+        _frame_cache_bytes -= evicted_size
+        frame_cache_stats["evictions"] += 1
+    return frames
+
+def warmAnimationFrames(animation_images: List[pygame.Surface], sizes: List[int]) -> None:
+    """Prepare the frames of every angle bucket for the given square sizes ahead of time.
+    Args:
+        animation_images (List[pygame.Surface]): frames from obtainSpriteAnimationImages
+        sizes (List[int]): sprite sizes to prepare, bucketed like getAnimationFrames
+    """
+    if not animation_images:
+        return
+    for size in sizes:
+        for angle in range(0, 360, Constants.ANIMATION_ANGLE_STEP):
+            getAnimationFrames(animation_images, (size, size), angle)
+
+def getCommonAnimationSizes() -> List[int]:
+    """Return the size buckets asteroids and the ship play their explosion at."""
+    size_step = Constants.ANIMATION_SIZE_STEP
+    smallest, largest = Constants.ASTEROID_DIMMENSIONS
+    sizes = set(range(round(smallest / size_step) * size_step, largest + 1, size_step))
+    sizes.add(round(Constants.SHIP_DIMMENSION[0] / size_step) * size_step)
+    return sorted(sizes)
+
+def getAnimationFrameCacheStats() -> dict:
+    """Return animation frame cache counters along with the current entry count and memory usage."""
+    return dict(frame_cache_stats, entries=len(_frame_cache), bytes=_frame_cache_bytes)
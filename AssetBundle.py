@@ -0,0 +1,253 @@
+"""
+Asset Bundle Module
+Bakes every image under images/ into a single memory-mappable file holding raw
+BGRA pixel buffers, already scaled to the Constants.*_DIMMENSIONS sizes, with
+sprite sheets sliced into their frames. At runtime surfaces are created from the
+mapped file with pygame.image.frombuffer without copying or decoding anything.
+If any source image changed since baking, the bundle is ignored and assets are
+loaded from their PNG files instead.
+
+Usage:
+    python AssetBundle.py
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import threading
+import pygame
+import Constants
+from typing import List
+
+BUNDLE_MAGIC = b"GRAB"
+BUNDLE_VERSION = 1
+# magic, version, length of the JSON index
+BUNDLE_HEADER = struct.Struct("<4sII")
+PIXEL_FORMAT = "BGRA"
+BYTES_PER_PIXEL = 4
+ALIGNMENT = 16
+
+def normalizePath(path: str) -> str:
+    """Return the form of a path used as a bundle key."""
+    return os.path.normpath(path)
+
+def imageKey(image_file: str, dimmensions: tuple) -> str:
+    """Return the bundle key of an image scaled to the given dimmensions."""
+    return "{}@{}x{}".format(normalizePath(image_file), *dimmensions)
+
+def frameKey(sheet_file: str, index: int) -> str:
+    """Return the bundle key of a frame sliced from a sprite sheet."""
+    return "{}#{}".format(normalizePath(sheet_file), index)
+
+def getImageDimmensions() -> dict:
+    """Return the sizes each image is used at, according to Constants."""
+    smallest, largest = Constants.ASTEROID_DIMMENSIONS
+    dimmensions = {
+        normalizePath(Constants.SHIP_IMAGE_FILE): [Constants.SHIP_DIMMENSION],
+        normalizePath(Constants.BULLET_IMAGE_FILE): [Constants.BULLET_DIMMENSIONS],
+        normalizePath(Constants.CROSSHAIR_IMAGE_FILE): [Constants.CROSSHAIR_DIMMENSIONS],
+        normalizePath(Constants.RESET_BUTTON_IMAGE): [Constants.RESET_BUTTON_DIMMENSION],
+    }
+    for image_file in Constants.ASTEROID_IMAGE_FILES:
+        dimmensions[normalizePath(image_file)] = [(size, size) for size in range(smallest, largest + 1)]
+    return dimmensions
+
+def findSourceFiles(image_directory: str) -> List[str]:
+    """Return every PNG under a directory, along with the JSON metadata of sprite sheets."""
+    source_files = []
+    for directory, _, file_names in os.walk(image_directory):
+        for file_name in sorted(file_names):
+            if file_name.endswith(".png") or file_name.endswith(".json"):
+                source_files.append(normalizePath(os.path.join(directory, file_name)))
+    return sorted(source_files)
+
+def describeSource(path: str) -> list:
+    """Return the [modification time, size] pair used to detect changed sources."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def toAlphaSurface(surface: pygame.Surface) -> pygame.Surface:
+    """Copy a surface onto a per-pixel alpha surface, turning a colorkey into transparency.
+    Unlike convert_alpha this works before a display exists.
+    """
+    alpha_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    alpha_surface.blit(surface, (0, 0))
+    return alpha_surface
+
+def sliceSpriteSheet(sheet_file: str) -> List[pygame.Surface]:
+    """Slice a sprite sheet into frames the same way obtainSpriteAnimationImages does,
+    turning the black colorkey into transparency so frames can be stored as BGRA.
+    """
+    sprite_sheet = pygame.image.load(sheet_file)
+    # Drop the sheet's alpha channel like the convert() call at runtime does, without needing a display
+    sprite_sheet = pygame.image.frombytes(pygame.image.tobytes(sprite_sheet, "RGB"), sprite_sheet.get_size(), "RGB")
+    with open(sheet_file.replace("png", "json")) as json_file:
+        data = json.load(json_file)
+
+    frames = []
+    for frame_name in data["frames"]:
+        sprite_data = data["frames"][frame_name]["frame"]
+        x_pos, y_pos, width, height = sprite_data["x"], sprite_data["y"], sprite_data["w"], sprite_data["h"]
+        sprite = pygame.Surface((width, height))
+        sprite.set_colorkey((0, 0, 0))
+        sprite.blit(sprite_sheet, (0, 0), (x_pos, y_pos, width, height))
+        frames.append(toAlphaSurface(sprite))
+    return frames
+
+def bakeAssets(image_directory: str = Constants.IMAGE_DIRECTORY, bundle_file: str = Constants.ASSET_BUNDLE_FILE) -> dict:
+    """Decode, scale and slice every image under a directory and write them to a bundle.
+    Args:
+        image_directory (str): directory holding the source images
+        bundle_file (str): path of the bundle to write
+    Returns:
+        dict: the bundle index
+    """
+    source_files = findSourceFiles(image_directory)
+    image_dimmensions = getImageDimmensions()
+    entries = {}
+    animations = {}
+    pixel_buffers = []
+    offset = 0
+
+    def addSurface(key, surface):
+        nonlocal offset
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        entries[key] = {"offset": offset, "size": list(surface.get_size())}
+        pixel_buffers.append(pixels)
+        offset += len(pixels)
+        padding = -offset % ALIGNMENT
+        pixel_buffers.append(b"\0" * padding)
+        offset += padding
+
+    for source_file in source_files:
+        if not source_file.endswith(".png"):
+            continue
+        if os.path.exists(source_file.replace("png", "json")):
+            frames = sliceSpriteSheet(source_file)
+            animations[source_file] = len(frames)
+            for index, frame in enumerate(frames):
+                addSurface(frameKey(source_file, index), frame)
+            continue
+
+        image = pygame.image.load(source_file)
+        for dimmensions in image_dimmensions.get(source_file, [image.get_size()]):
+            addSurface(imageKey(source_file, dimmensions), toAlphaSurface(pygame.transform.scale(image, dimmensions)))
+
+    index = {
+        "format": PIXEL_FORMAT,
+        "sources": {source_file: describeSource(source_file) for source_file in source_files},
+        "entries": entries,
+        "animations": animations,
+    }
+    index_bytes = json.dumps(index).encode("utf-8")
+    header_length = BUNDLE_HEADER.size + len(index_bytes)
+    header_padding = -header_length % ALIGNMENT
+
+    with open(bundle_file, "wb") as output_file:
+        output_file.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)))
+        output_file.write(index_bytes)
+        output_file.write(b"\0" * header_padding)
+        for pixels in pixel_buffers:
+            output_file.write(pixels)
+    return index
+
+class AssetBundle():
+    """
+    Read-only view of a baked bundle. Surfaces share memory with the mapped file.
+
+    Attributes:
+        index (dict): Entry offsets and sizes, source descriptions and animation frame counts
+        data (memoryview): The mapped pixel data following the header
+    """
+
+    def __init__(self, bundle_file: str):
+        """Map a bundle file into memory.
+        Raises:
+            ValueError: if the file is not a bundle of the supported version
+        """
+        with open(bundle_file, "rb") as input_file:
+            # Copy-on-write keeps the file untouched should a surface ever be drawn on
+            self.mapping = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, index_length = BUNDLE_HEADER.unpack_from(self.mapping)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"{bundle_file} is not a version {BUNDLE_VERSION} asset bundle")
+        index_end = BUNDLE_HEADER.size + index_length
+        self.index = json.loads(bytes(self.mapping[BUNDLE_HEADER.size:index_end]))
+        self.data = memoryview(self.mapping)[index_end + (-index_end % ALIGNMENT):]
+
+    def isStale(self) -> bool:
+        """Return True if any source image changed, appeared or disappeared since baking."""
+        sources = self.index["sources"]
+        for source_file, description in sources.items():
+            if not os.path.exists(source_file) or describeSource(source_file) != description:
+                return True
+        return set(findSourceFiles(Constants.IMAGE_DIRECTORY)) != set(sources)
+
+    def getSurface(self, key: str) -> pygame.Surface:
+        """Return a surface backed by the bundle's memory, or None if the key was not baked."""
+        entry = self.index["entries"].get(key)
+        if entry is None:
+            return None
+        width, height = entry["size"]
+        start = entry["offset"]
+        pixels = self.data[start:start + width * height * BYTES_PER_PIXEL]
+        return pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+
+    def getImage(self, image_file: str, dimmensions: tuple) -> pygame.Surface:
+        """Return a baked image scaled to the given dimmensions, or None if it was not baked."""
+        return self.getSurface(imageKey(image_file, dimmensions))
+
+    def getAnimationImages(self, sheet_file: str) -> List[pygame.Surface]:
+        """Return the frames of a baked sprite sheet, or None if it was not baked."""
+        frame_count = self.index["animations"].get(normalizePath(sheet_file))
+        if frame_count is None:
+            return None
+        return [self.getSurface(frameKey(sheet_file, index)) for index in range(frame_count)]
+
+_bundle = None
+_bundle_checked = False
+# Loader threads ask for the bundle concurrently, only the first one opens it
+_bundle_lock = threading.Lock()
+
+def getBundle() -> AssetBundle:
+    """Return the game's asset bundle, loading it on first use.
+    Returns:
+        AssetBundle: the bundle, or None if it is disabled, missing, unreadable or stale
+    """
+    global _bundle, _bundle_checked
+    if _bundle_checked:
+        return _bundle
+    with _bundle_lock:
+        if not _bundle_checked:
+            _bundle = openBundle()
+            _bundle_checked = True
+    return _bundle
+
+def openBundle() -> AssetBundle:
+    """Open ASSET_BUNDLE_FILE.
+    Returns:
+        AssetBundle: the bundle, or None if it is disabled, missing, unreadable or stale
+    """
+    if not Constants.USE_ASSET_BUNDLE or not os.path.exists(Constants.ASSET_BUNDLE_FILE):
+        return None
+    try:
+        bundle = AssetBundle(Constants.ASSET_BUNDLE_FILE)
+    except (OSError, ValueError) as e:
+        print(e, "Falling back to loading images from their files")
+        return None
+    if bundle.isStale():
+        print(f"{Constants.ASSET_BUNDLE_FILE} is stale, run 'python AssetBundle.py' to rebake it. "
+              "Falling back to loading images from their files")
+        return None
+    return bundle
+
+def main():
+    index = bakeAssets()
+    size = os.path.getsize(Constants.ASSET_BUNDLE_FILE)
+    print(f"Baked {len(index['entries'])} surfaces into {Constants.ASSET_BUNDLE_FILE} ({size / 2 ** 20:.1f} MiB)")
+
+if __name__ == "__main__":
+    sys.exit(main())
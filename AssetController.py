@@ -0,0 +1,258 @@
+"""
+Asset Controller Module
+Provides a process-wide image cache so that sprites never decode or scale an
+image file from disk once it has been loaded, serving baked images from the
+asset bundle when one is available, a rotation cache that reuses
+rotated surfaces for angles quantized to a configurable step, a cache of
+the collision masks of those surfaces and a cache of images scaled for
+rendering at a reduced resolution.
+"""
+
+import weakref
+import pygame
+import Constants
+from AssetBundle import getBundle
+from collections import OrderedDict
+
+# (image_file, dimmensions) -> [surface, is_converted, size_in_bytes]
+_image_cache = OrderedDict()
+_image_cache_bytes = 0
+image_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+# (image, size, quantized_angle) -> [rotated_surface, size_in_bytes]
+_rotation_cache = OrderedDict()
+_rotation_cache_bytes = 0
+rotation_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+# id(surface) -> [weak reference to the surface, mask, size_in_bytes]. Surfaces are unique per
+# (image, size, quantized_angle) and only referenced weakly, so a mask is dropped along with its
+# surface when the rotation or animation cache evicts it instead of keeping the surface alive
+_mask_cache = OrderedDict()
+_mask_cache_bytes = 0
+mask_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "released": 0}
+
+# (id(image), scale) -> [weak reference to the image, scaled_surface, size_in_bytes]. Source images
+# are only referenced weakly, so the cache holds nothing but the scaled surfaces it counts
+_scaled_image_cache = OrderedDict()
+_scaled_image_cache_bytes = 0
+scaled_image_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "released": 0}
+
+def surfaceBytes(surface: pygame.Surface) -> int:
+    """Return the approximate amount of memory used by a surface's pixels."""
+    return surface.get_pitch() * surface.get_height()
+
+def _convertToDisplayFormat(surface: pygame.Surface) -> tuple:
+    """Convert a surface to the display's pixel format if a display exists.
+    Returns:
+        tuple: (surface, True if the surface was converted)
+    """
+    if pygame.display.get_surface() is None:
+        return surface, False
+    return surface.convert_alpha(), True
+
+def _evictImages() -> None:
+    """Drop the least recently used images until the cache fits its budget."""
+    global _image_cache_bytes
+    while _image_cache_bytes > Constants.IMAGE_CACHE_MAX_BYTES and len(_image_cache) > 1:
+        _, (_, _, size) = _image_cache.popitem(last=False)
+        _image_cache_bytes -= size
+        image_cache_stats["evictions"] += 1
+
+def loadImage(image_file: str, dimmensions: tuple) -> pygame.Surface:
+    """Obtain a scaled image from the cache, loading it from disk on a miss.
+    The returned surface is shared between every sprite using it and must not be drawn on.
+    Args:
+        image_file (str): path of the image file to load
+        dimmensions (tuple): (width, height) the image should be scaled to
+    Returns:
+        pygame.Surface: the scaled image, converted to the display format when possible
+    """
+    global _image_cache_bytes
+    key = (image_file, tuple(dimmensions))
+    entry = _image_cache.get(key)
+
+    if entry is not None:
+        image_cache_stats["hits"] += 1
+        _image_cache.move_to_end(key)
+        # Images loaded before the display was created get converted on first use after it.
+        if not entry[1]:
+            entry[0], entry[1] = _convertToDisplayFormat(entry[0])
+        return entry[0]
+
+    image_cache_stats["misses"] += 1
+    bundle = getBundle()
+    image = bundle.getImage(image_file, key[1]) if bundle is not None else None
+    if image is not None:
+        # Baked BGRA pixels already match the display's alpha format
+        is_converted = True
+    else:
+        image = pygame.transform.scale(pygame.image.load(image_file), key[1])
+        image, is_converted = _convertToDisplayFormat(image)
+    size = surfaceBytes(image)
+
+    _image_cache[key] = [image, is_converted, size]
+    _image_cache_bytes += size
+    _evictImages()
+    return image
+
+def clearImageCache() -> None:
+    """Remove every image from the cache."""
+    global _image_cache_bytes
+    _image_cache.clear()
+    _image_cache_bytes = 0
+
+def getImageCacheStats() -> dict:
+    """Return cache counters along with the current entry count and memory usage."""
+    return dict(image_cache_stats, entries=len(_image_cache), bytes=_image_cache_bytes)
+
+def quantizeAngle(angle: float, angle_step: float) -> float:
+    """Round an angle to the nearest multiple of a rotation step."""
+    return (round(angle / angle_step) * angle_step) % 360
+
+def getRotatedImage(image: pygame.Surface, angle: float, angle_step: float) -> pygame.Surface:
+    """Obtain a rotated copy of an image, rendering it only on a cache miss.
+    The angle is quantized to the rotation step before lookup.
+    Args:
+        image (pygame.Surface): the unrotated image
+        angle (float): rotation in degrees
+        angle_step (float): step in degrees to quantize to, e.g. the quality tier's rotation_angle_step
+    Returns:
+        pygame.Surface: the rotated image, shared between every sprite using it
+    """
+    global _rotation_cache_bytes
+    quantized_angle = quantizeAngle(angle, angle_step)
+    key = (image, image.get_size(), quantized_angle)
+    entry = _rotation_cache.get(key)
+
+    if entry is not None:
+        rotation_cache_stats["hits"] += 1
+        _rotation_cache.move_to_end(key)
+        return entry[0]
+
+    rotation_cache_stats["misses"] += 1
+    rotated_image = pygame.transform.rotate(image, quantized_angle)
+    size = surfaceBytes(rotated_image)
+    _rotation_cache[key] = [rotated_image, size]
+    _rotation_cache_bytes += size
+
+    while _rotation_cache_bytes > Constants.ROTATION_CACHE_MAX_BYTES and len(_rotation_cache) > 1:
+        _, (_, evicted_size) = _rotation_cache.popitem(last=False)
+        _rotation_cache_bytes -= evicted_size
+        rotation_cache_stats["evictions"] += 1
+    return rotated_image
+
+def prerenderRotations(image: pygame.Surface, angle_step: float) -> None:
+    """Render every rotation bucket of an image ahead of time, with its mask when mask collisions are on."""
+    for bucket in range(round(360 / angle_step)):
+        rotated_image = getRotatedImage(image, bucket * angle_step, angle_step)
+        if Constants.MASK_COLLISIONS:
+            getMask(rotated_image)
+
+def clearRotationCache() -> None:
+    """Remove every rotated surface from the cache."""
+    global _rotation_cache_bytes
+    _rotation_cache.clear()
+    _rotation_cache_bytes = 0
+
+def getRotationCacheStats() -> dict:
+    """Return rotation cache counters along with the current entry count and memory usage."""
+    return dict(rotation_cache_stats, entries=len(_rotation_cache), bytes=_rotation_cache_bytes)
+
+def maskBytes(mask: pygame.mask.Mask) -> int:
+    """Return the approximate amount of memory used by a mask's bits."""
+    width, height = mask.get_size()
+    return (width + 7) // 8 * height
+
+def _releaseMask(key: int):
+    """Return the callback dropping a surface's mask once the surface is garbage collected."""
+    def release(_):
+        global _mask_cache_bytes
+        entry = _mask_cache.pop(key, None)
+        if entry is not None:
+            _mask_cache_bytes -= entry[2]
+            mask_cache_stats["released"] += 1
+    return release
+
+def getMask(surface: pygame.Surface) -> pygame.mask.Mask:
+    """Obtain the collision mask of a surface, building it only on a cache miss.
+    Surfaces are shared through the image, rotation and animation caches, so a mask is
+    built once per image, size and angle bucket.
+    Args:
+        surface (pygame.Surface): a shared surface, e.g. a sprite's image
+    Returns:
+        pygame.mask.Mask: the mask of the surface's opaque pixels
+    """
+    global _mask_cache_bytes
+    key = id(surface)
+    entry = _mask_cache.get(key)
+
+    if entry is not None:
+        mask_cache_stats["hits"] += 1
+        _mask_cache.move_to_end(key)
+        return entry[1]
+
+    mask_cache_stats["misses"] += 1
+    mask = pygame.mask.from_surface(surface)
+    size = maskBytes(mask)
+    _mask_cache[key] = [weakref.ref(surface, _releaseMask(key)), mask, size]
+    _mask_cache_bytes += size
+
+    while _mask_cache_bytes > Constants.MASK_CACHE_MAX_BYTES and len(_mask_cache) > 1:
+        _, (_, _, evicted_size) = _mask_cache.popitem(last=False)
+        _mask_cache_bytes -= evicted_size
+        mask_cache_stats["evictions"] += 1
+    return mask
+
+def clearMaskCache() -> None:
+    """Remove every mask from the cache."""
+    global _mask_cache_bytes
+    _mask_cache.clear()
+    _mask_cache_bytes = 0
+
+def getMaskCacheStats() -> dict:
+    """Return mask cache counters along with the current entry count and memory usage."""
+    return dict(mask_cache_stats, entries=len(_mask_cache), bytes=_mask_cache_bytes)
+
+def _releaseScaledImage(key: tuple):
+    """Return the callback dropping a scaled image once its source image is garbage collected."""
+    def release(_):
+        global _scaled_image_cache_bytes
+        entry = _scaled_image_cache.pop(key, None)
+        if entry is not None:
+            _scaled_image_cache_bytes -= entry[2]
+            scaled_image_cache_stats["released"] += 1
+    return release
+
+def getScaledImage(image: pygame.Surface, scale: float) -> pygame.Surface:
+    """Obtain a copy of an image scaled by a factor, scaling it only on a cache miss.
+    Args:
+        image (pygame.Surface): a shared surface, e.g. a sprite's image
+        scale (float): factor applied to both sides
+    Returns:
+        pygame.Surface: the scaled image, shared between every sprite using it
+    """
+    global _scaled_image_cache_bytes
+    key = (id(image), scale)
+    entry = _scaled_image_cache.get(key)
+
+    if entry is not None:
+        scaled_image_cache_stats["hits"] += 1
+        _scaled_image_cache.move_to_end(key)
+        return entry[1]
+
+    scaled_image_cache_stats["misses"] += 1
+    width, height = image.get_size()
+    scaled_image = pygame.transform.scale(image, (max(1, round(width * scale)), max(1, round(height * scale))))
+    size = surfaceBytes(scaled_image)
+    _scaled_image_cache[key] = [weakref.ref(image, _releaseScaledImage(key)), scaled_image, size]
+    _scaled_image_cache_bytes += size
+
+    while _scaled_image_cache_bytes > Constants.SCALED_IMAGE_CACHE_MAX_BYTES and len(_scaled_image_cache) > 1:
+        _, (_, _, evicted_size) = _scaled_image_cache.popitem(last=False)
+        _scaled_image_cache_bytes -= evicted_size
+        scaled_image_cache_stats["evictions"] += 1
+    return scaled_image
+
+def getScaledImageCacheStats() -> dict:
+    """Return scaled image cache counters along with the current entry count and memory usage."""
+    return dict(scaled_image_cache_stats, entries=len(_scaled_image_cache), bytes=_scaled_image_cache_bytes)
@@ -1,37 +1,54 @@
 import pygame
 import Constants
-from Sprites import Sprite
+from Sprites import Sprite, rotate
 from ShipController import Ship
-from random import choice, randint
+from PoolController import SpritePool
+from ViewportController import getWorldSize
+import random
 class Asteroid(Sprite):
     """
     Represents an asteroid in the game. Asteroids are destructible objects that move across the screen
     and can be shot by the player. Their health and size are inversely proportional.
     """
-    def __init__(self, ship: Ship):
+    def __init__(self, ship: Ship, rng=random):
         """
         Initialize a new asteroid with random properties.
         Args:
             ship (Ship): The player's ship, used to calculate initial trajectory
+            rng: source of randomness, the random module or a seeded random.Random
         """
         super().__init__()
+        self.collision_rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(ship, rng)
+
+    def reset(self, ship: Ship, rng=random) -> None:
+        """
+        Reinitialize the asteroid in place with new random properties.
+        Args:
+            ship (Ship): The player's ship, used to calculate initial trajectory
+            rng: source of randomness, the random module or a seeded random.Random
+        """
+        self.resetState()
+        self.rng = rng
 
         # Initialize asteroid with random size and image
-        random_size = randint(*Constants.ASTEROID_DIMMENSIONS)
+        random_size = rng.randint(*Constants.ASTEROID_DIMMENSIONS)
         self.dimmensions = (random_size, random_size)
         self.initializeImage(
-            choice(Constants.ASTEROID_IMAGE_FILES), 
+            rng.choice(Constants.ASTEROID_IMAGE_FILES), 
             self.dimmensions, 
         )
         
         # Set initial position and movement properties
         self.positionOutsideOfScreen()
+        self.position = pygame.math.Vector2(self.rect.center)
         self.calculateTrajectoryToSprite(ship)
-        self.speed = randint(*Constants.ASTEROID_SPEED)
-        self.rotation_speed = randint(*Constants.ASTEROID_ROTATION_SPEED)
+        self.speed = rng.randint(*Constants.ASTEROID_SPEED)
+        self.rotation_speed = rng.randint(*Constants.ASTEROID_ROTATION_SPEED)
+        self.rotation_steps = 0
 
         # Create a smaller collision rectangle
-        self.collision_rect = pygame.Rect(0, 0, self.rect.width * 0.6, self.rect.height * 0.6)
+        self.collision_rect.size = (self.rect.width * 0.6, self.rect.height * 0.6)
         self.collision_rect.center = self.rect.center
 
         # Set health based on size (larger asteroids have more health)
@@ -47,8 +64,7 @@ class Asteroid(Sprite):
         Position the asteroid randomly outside the screen boundaries.
         This ensures asteroids enter the screen from the edges.
         """
-        screen = pygame.display.get_surface()
-        screen_width, screen_height = screen.get_size()
+        screen_width, screen_height = getWorldSize()
 
         # Define spawn areas outside screen boundaries, refer to PDF.
         left = (-Constants.ASTEROID_SPAWN_PADDING - self.rect.width, -self.rect.width)
@@ -57,26 +73,31 @@ class Asteroid(Sprite):
         down = (screen_height + self.rect.height, screen_height + self.rect.height + Constants.ASTEROID_SPAWN_PADDING)
 
         # Randomly choose spawn position from edges, can be improved.
-        self.rect.x = choice((randint(*left), randint(*right)))
-        self.rect.y = choice((randint(*up), randint(*down)))
+        rng = self.rng
+        self.rect.x = rng.choice((rng.randint(*left), rng.randint(*right)))
+        self.rect.y = rng.choice((rng.randint(*up), rng.randint(*down)))
 
-    def move(self) -> None:
+    def move(self, time_scale: float = 1.0) -> None:
         """
         Update asteroid position based on its trajectory and handle screen wrapping.
         Asteroids that move off-screen will wrap around to the opposite side.
+        Args:
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
         """
-        screen_width, screen_height = pygame.display.get_surface().get_size()
+        screen_width, screen_height = getWorldSize()
         v_x, v_y = self.trajectory_vx_vy
 
-        # Update position
-        self.rect.x += v_x * self.speed
-        self.rect.y += v_y * self.speed
-        self.rotateSprite(self.rotation_speed)
-        
-        # Update collision rectangle position
-        self.collision_rect.center = self.rect.center
+        # Update the sub-pixel position, the rect follows it rounded
+        self.position.x += v_x * self.speed * time_scale
+        self.position.y += v_y * self.speed * time_scale
+        self.rect.center = self.position
+        # Lower quality tiers only redraw the rotation every few steps
+        self.rotation_steps += 1
+        rotate(self, self.rotation_speed * time_scale,
+               update_image=self.rotation_steps % self.quality_settings["rotation_interval"] == 0)
 
         # Handle screen wrapping
+        wrapped_x, wrapped_y = self.rect.x, self.rect.y
         if self.rect.x < (0 - Constants.ASTEROID_SPAWN_PADDING): 
             self.rect.x = screen_width + self.rect.width
         if self.rect.x > (screen_width + Constants.ASTEROID_SPAWN_PADDING): 
@@ -85,25 +106,19 @@ class Asteroid(Sprite):
             self.rect.y = screen_height + self.rect.width 
         if self.rect.y > (screen_height + Constants.ASTEROID_SPAWN_PADDING): 
             self.rect.y = 0 - self.rect.height
+        if (wrapped_x, wrapped_y) != (self.rect.x, self.rect.y):
+            self.position.update(self.rect.center)
+
+        # Update collision rectangle position
+        self.collision_rect.center = self.rect.center
 
-# Timer for asteroid spawning
-asteroid_timer = 0
-def generateAsteroids(game, ship: Ship) -> None:
+asteroid_pool = SpritePool(Asteroid, Constants.ASTEROID_POOL_SIZE)
+
+def createAsteroid(ship: Ship, rng=random) -> Asteroid:
     """
-    Generates new asteroids at random intervals.
+    Obtain an asteroid from the pool, reusing a dead one when available.
     Args:
-        game (Game): The current game state containing all game objects
-        ship (Ship): The player's ship, used to calculate asteroid trajectories
+        ship (Ship): The player's ship, used to calculate initial trajectory
+        rng: source of randomness, the random module or a seeded random.Random
     """
-    time_limit = randint(*Constants.ASTEROID_SPAWN_TIMER_VALUES)
-    amount_to_spawn = randint(*Constants.ASTEROID_POSSIBLE_SPAWN_AMOUNT)
-    global asteroid_timer
-
-    asteroid_timer += 1
-    
-    if asteroid_timer >= time_limit: 
-        for _ in range(amount_to_spawn): 
-            game.addAsteroidSprite(Asteroid(ship))
-        asteroid_timer = 0
-    
-        
+    return asteroid_pool.acquire(ship, rng)
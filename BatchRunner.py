@@ -0,0 +1,249 @@
+"""
+Batch Runner Module
+Plays many independent headless games across every core with a process pool,
+each seeded and driven by a bot or idle input policy, and streams one JSONL
+record per game followed by one summary record per parameter set. Parameter
+sweeps override Constants in the worker processes, so every combination of the
+swept values is played with the same seeds.
+
+Usage:
+    python BatchRunner.py --games 200 --max-frames 36000 --output results.jsonl \\
+        --sweep MAX_LIVE_ASTEROIDS='[20, 40]' --sweep SHIP_HEALTH='[3, 5]'
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import itertools
+import Constants
+from statistics import mean
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from Simulation import createHeadlessGame, summarizeFrameTimes
+
+class BotPolicy():
+    """
+    Input policy that aims at and shoots the nearest asteroid, and steers away from it
+    when it gets close. Picklable so it can be sent to worker processes.
+
+    Attributes:
+        fire_interval (int): Frames between two shots
+        danger_distance (float): Distance at which the bot starts evading the nearest asteroid
+        random (random.Random): Source of the aiming jitter, seeded per game
+    """
+
+    def __init__(self, seed: int = 0, fire_interval: int = 10, danger_distance: float = 300, aim_jitter: float = 20):
+        """Initialize the bot.
+        Args:
+            seed (int): seed for the aiming jitter
+            fire_interval (int): frames between two shots
+            danger_distance (float): distance at which the nearest asteroid is evaded
+            aim_jitter (float): maximum aiming error in pixels
+        """
+        self.fire_interval = fire_interval
+        self.danger_distance = danger_distance
+        self.aim_jitter = aim_jitter
+        self.random = random.Random(seed)
+
+    def __call__(self, frame_index: int, game) -> dict:
+        """Return the input frame for the current state of the game."""
+        import pygame
+        from ViewportController import getViewport
+
+        ship_x, ship_y = game.player_ship.rect.center
+        nearest = None
+        nearest_distance = math.inf
+        for asteroid in game.asteroid_sprites:
+            if asteroid.should_animate:
+                continue
+            distance = math.hypot(asteroid.rect.centerx - ship_x, asteroid.rect.centery - ship_y)
+            if distance < nearest_distance:
+                nearest, nearest_distance = asteroid, distance
+
+        if nearest is None:
+            return {"keys": (), "clicks": ()}
+
+        target_x, target_y = nearest.rect.center
+        keys = []
+        if nearest_distance < self.danger_distance:
+            keys.append(pygame.K_a if target_x > ship_x else pygame.K_d)
+            keys.append(pygame.K_w if target_y > ship_y else pygame.K_s)
+        jitter = self.aim_jitter
+        aim = (target_x + self.random.uniform(-jitter, jitter), target_y + self.random.uniform(-jitter, jitter))
+        return {
+            "mouse_pos": getViewport().screenToWindow(getViewport().worldToScreen(aim)),
+            "keys": keys,
+            "clicks": (1,) if frame_index % self.fire_interval == 0 else (),
+        }
+
+def idlePolicy(frame_index: int, game) -> dict:
+    """Input policy that never touches the controls."""
+    return {}
+
+def applyParameters(parameters: dict) -> dict:
+    """Override Constants with the given values.
+    Only constants read while the game runs are affected, not ones bound as default
+    arguments when a module is imported.
+    Returns:
+        dict: the previous values, to pass back to applyParameters to restore them
+    """
+    for name in parameters:
+        if not hasattr(Constants, name):
+            raise ValueError(f"Constants has no parameter {name}")
+    previous = {}
+    for name, value in parameters.items():
+        previous[name] = getattr(Constants, name)
+        # JSON has no tuples, keep the type of the original constant
+        setattr(Constants, name, tuple(value) if isinstance(previous[name], tuple) else value)
+    return previous
+
+def runGame(seed: int, parameters: dict, max_frames: int, policy: str = "bot", render: bool = False) -> dict:
+    """Play one headless game until the ship is destroyed or max_frames is reached.
+    Runs in a worker process, which is reused for later games, so parameter overrides
+    are undone before returning.
+    Args:
+        seed (int): seed for spawning and for the bot
+        parameters (dict): Constants overrides for this game
+        max_frames (int): frame limit for games the bot survives
+        policy (str): "bot" or "idle"
+        render (bool): draw every frame, so frame times include rendering
+    Returns:
+        dict: the game's result record
+    """
+    from InputController import ScriptedInput
+
+    previous = applyParameters(parameters)
+    try:
+        input_policy = BotPolicy(seed) if policy == "bot" else idlePolicy
+        game = createHeadlessGame(seed, ScriptedInput(policy=input_policy))
+        game.render_enabled = render
+        frame_times = []
+        asteroid_high_water_mark = 0
+        bullet_high_water_mark = 0
+        frames = 0
+        while frames < max_frames and game.player_ship in game.player_sprites:
+            start = time.perf_counter()
+            game.runFrame()
+            frame_times.append(time.perf_counter() - start)
+            frames += 1
+            asteroid_high_water_mark = max(asteroid_high_water_mark, len(game.asteroid_sprites))
+            bullet_high_water_mark = max(bullet_high_water_mark, len(game.player_bullet_sprites))
+
+        frame_stats = summarizeFrameTimes(frame_times)
+        return {
+            "type": "game",
+            "seed": seed,
+            "parameters": parameters,
+            "policy": policy,
+            "render": render,
+            "survived": game.player_ship in game.player_sprites,
+            "frames": frames,
+            "survival_seconds": frames * game.simulation_step_ms / 1000,
+            "score": game.score,
+            "asteroid_high_water_mark": asteroid_high_water_mark,
+            "bullet_high_water_mark": bullet_high_water_mark,
+            "mean_frame_ms": frame_stats.get("mean_ms", 0.0),
+            "p95_frame_ms": frame_stats.get("p95_ms", 0.0),
+            "max_frame_ms": frame_stats.get("max_ms", 0.0),
+        }
+    finally:
+        applyParameters(previous)
+
+def expandSweep(sweep: dict) -> list:
+    """Return every combination of the swept values.
+    Args:
+        sweep (dict): parameter name -> list of values
+    Returns:
+        list: parameter dicts, a single empty dict when nothing is swept
+    """
+    names = sorted(sweep)
+    return [dict(zip(names, values)) for values in itertools.product(*(sweep[name] for name in names))]
+
+def summarizeResults(parameters: dict, results: list) -> dict:
+    """Aggregate the game records of one parameter set."""
+    return {
+        "type": "summary",
+        "parameters": parameters,
+        "games": len(results),
+        "survival_rate": mean(result["survived"] for result in results),
+        "mean_survival_seconds": mean(result["survival_seconds"] for result in results),
+        "min_survival_seconds": min(result["survival_seconds"] for result in results),
+        "max_survival_seconds": max(result["survival_seconds"] for result in results),
+        "mean_score": mean(result["score"] for result in results),
+        "asteroid_high_water_mark": max(result["asteroid_high_water_mark"] for result in results),
+        "bullet_high_water_mark": max(result["bullet_high_water_mark"] for result in results),
+        "mean_frame_ms": mean(result["mean_frame_ms"] for result in results),
+        "p95_frame_ms": max(result["p95_frame_ms"] for result in results),
+    }
+
+def runBatch(games: int, max_frames: int, sweep: dict = None, base_seed: int = 0, policy: str = "bot",
+             render: bool = False, workers: int = None, output=sys.stdout) -> list:
+    """Play games for every parameter set of a sweep on a process pool.
+    Args:
+        games (int): games per parameter set, seeded base_seed to base_seed + games - 1
+        max_frames (int): frame limit per game
+        sweep (dict): parameter name -> list of values to try
+        base_seed (int): first seed
+        policy (str): "bot" or "idle"
+        render (bool): draw every frame, so frame times include rendering
+        workers (int): worker processes, None uses every core
+        output: file the JSONL records are streamed to as games finish
+    Returns:
+        list: the summary record of every parameter set
+    """
+    parameter_sets = expandSweep(sweep or {})
+    results = {index: [] for index in range(len(parameter_sets))}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for index, parameters in enumerate(parameter_sets):
+            for seed in range(base_seed, base_seed + games):
+                futures[executor.submit(runGame, seed, parameters, max_frames, policy, render)] = index
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]].append(result)
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+
+    summaries = []
+    for index, parameters in enumerate(parameter_sets):
+        summary = summarizeResults(parameters, results[index])
+        output.write(json.dumps(summary) + "\n")
+        summaries.append(summary)
+    output.flush()
+    return summaries
+
+def parseSweep(arguments: list) -> dict:
+    """Parse NAME=JSON_LIST sweep arguments into a dict of parameter name -> values."""
+    sweep = {}
+    for argument in arguments or []:
+        name, _, values = argument.partition("=")
+        parsed = json.loads(values)
+        if not isinstance(parsed, list):
+            raise ValueError(f"Sweep values of {name} must be a JSON list")
+        sweep[name] = parsed
+    return sweep
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many seeded headless games in parallel and report the results as JSONL.")
+    parser.add_argument("--games", type=int, default=100, help="games per parameter set")
+    parser.add_argument("--max-frames", type=int, default=36000, help="frame limit per game")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--policy", choices=("bot", "idle"), default="bot", help="input policy driving the ship")
+    parser.add_argument("--render", action="store_true", help="draw every frame on the headless screen")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to every core")
+    parser.add_argument("--sweep", action="append", metavar="NAME=JSON_LIST",
+                        help="Constants parameter and the values to try, may be repeated")
+    parser.add_argument("--output", help="write the JSONL records to this file instead of stdout")
+    args = parser.parse_args()
+
+    sweep = parseSweep(args.sweep)
+    if args.output:
+        with open(args.output, "w") as output:
+            runBatch(args.games, args.max_frames, sweep, args.seed, args.policy, args.render, args.workers, output)
+    else:
+        runBatch(args.games, args.max_frames, sweep, args.seed, args.policy, args.render, args.workers)
+
+if __name__ == "__main__":
+    main()
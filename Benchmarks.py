@@ -0,0 +1,258 @@
+"""
+Benchmarks Module
+Times the game's hot paths in isolation (micro benchmarks) and whole frames run
+through Game.runFrame with fixed asteroid and bullet counts (macro benchmarks).
+Runs headless and writes machine-readable JSON so results can be compared
+between commits.
+
+Usage:
+    python Benchmarks.py --output bench.json
+    python Benchmarks.py --quick --filter rotate
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from math import atan2, degrees, hypot
+from Simulation import createHeadlessGame, summarizeFrameTimes
+
+MACRO_ASTEROID_COUNTS = (10, 100, 1000)
+MACRO_BULLET_COUNTS = (10, 100, 1000)
+# Asteroids spawn at least this far from the ship's center and head away from it, so the
+# ship is not hit and the timed frames stay in the playing state
+SHIP_SAFE_RADIUS = 400
+
+def timeCalls(func, setup=None, number: int = 1000, repeat: int = 5) -> dict:
+    """Time a function, running an optional untimed setup before every call.
+    Args:
+        func: function to time, called with the setup's return value if a setup is given
+        setup: function called before each call, excluded from the timing
+        number (int): calls per repeat
+        repeat (int): number of repeats
+    Returns:
+        dict: per-call best and mean times in nanoseconds
+    """
+    perf_counter_ns = time.perf_counter_ns
+    repeat_times = []
+    for _ in range(repeat):
+        total = 0
+        for _ in range(number):
+            argument = setup() if setup else None
+            start = perf_counter_ns()
+            func(argument)
+            total += perf_counter_ns() - start
+        repeat_times.append(total / number)
+    return {
+        "calls": number * repeat,
+        "best_ns": min(repeat_times),
+        "mean_ns": sum(repeat_times) / len(repeat_times),
+    }
+
+def populate(game, asteroid_count: int, bullet_count: int) -> None:
+    """Top the game up to the given number of asteroids and bullets.
+    Asteroids are scattered over the play area outside SHIP_SAFE_RADIUS, heading away
+    from the ship instead of all converging on it, and bullets are fired from random points.
+    """
+    from AsteroidController import createAsteroid
+    from BulletController import createBullet
+    from ViewportController import getWorldSize
+
+    rng = game.random
+    width, height = getWorldSize()
+    ship_x, ship_y = game.player_ship.rect.center
+    while len(game.asteroid_sprites) < asteroid_count:
+        x, y = rng.randint(0, width), rng.randint(0, height)
+        if hypot(x - ship_x, y - ship_y) < SHIP_SAFE_RADIUS:
+            continue
+        asteroid = createAsteroid(game.player_ship, rng)
+        asteroid.placeAt((x, y))
+        # Within 90 degrees of the direction away from the ship, y is negated as pygame's points down
+        away = degrees(atan2(ship_y - y, x - ship_x))
+        asteroid.calculateTrajectoryFromAngle(away + rng.uniform(-90, 90))
+        game.addAsteroidSprite(asteroid)
+    while len(game.player_bullet_sprites) < bullet_count:
+        game.addPlayerBulletSprite(createBullet((rng.randint(0, width), rng.randint(0, height)), rng.uniform(0, 360)))
+
+def runMicroBenchmarks(game, scale: float = 1.0, name_filter: str = None) -> dict:
+    """Time the individual hot paths of the game.
+    Args:
+        game (Game): a headless game providing the display and explosion frames
+        scale (float): multiplier applied to the number of calls
+        name_filter (str): only run benchmarks whose name contains this text
+    Returns:
+        dict: benchmark name -> timing results
+    """
+    import Constants
+    from Sprites import Sprite, rotate, calculateAngleToTarget, calculateTrajectoryVector
+    from AnimationController import obtainSpriteAnimationImages
+    from AsteroidController import Asteroid
+    from BulletController import Bullet
+
+    rotating_sprite = Sprite()
+    rotating_sprite.initializeImage(Constants.ASTEROID_IMAGE_FILES[0], (150, 150))
+
+    animating_sprite = Asteroid(game.player_ship, game.random)
+    animating_sprite.animation_images = game.getExplosionAnimationImage()
+
+    def animate(_):
+        if not animating_sprite.should_animate:
+            animating_sprite.should_animate = True
+            animating_sprite.should_destroy = False
+        animating_sprite.animate()
+
+    def collisionSetup():
+        for group in (game.asteroid_sprites, game.player_bullet_sprites):
+            for sprite in group:
+                sprite.kill()
+        populate(game, 100, 300)
+        # One step of motion gives the bullets a path for the swept tests
+        game.handleSpriteMotion()
+
+    def maskedCollisions(_):
+        mask_collisions = Constants.MASK_COLLISIONS
+        Constants.MASK_COLLISIONS = True
+        try:
+            game.handleCollisions()
+        finally:
+            Constants.MASK_COLLISIONS = mask_collisions
+
+    def particleSetup():
+        particles = game.particles
+        particles.clear()
+        while particles.count < particles.capacity:
+            particles.emit((950, 600), 1000, Constants.EXPLOSION_PARTICLE_SPEED, (60000, 60000),
+                           Constants.EXPLOSION_PARTICLE_COLORS, size=4)
+
+    benchmarks = {
+        "Sprites.rotate": (lambda _: rotate(rotating_sprite, 3), None, 20000, 5),
+        "calculateAngleToTarget": (
+            lambda _: calculateAngleToTarget(100, 200, 640, 480, 0, Constants.SHIP_ANGLE_OFFSET), None, 50000, 5
+        ),
+        "calculateTrajectoryVector": (lambda _: calculateTrajectoryVector(100, 200, 640, 480), None, 50000, 5),
+        "Sprite.animate": (animate, None, 5000, 5),
+        "AnimationController.obtainSpriteAnimationImages": (
+            lambda _: obtainSpriteAnimationImages(Constants.EXPLOSION_IMAGE_FILE), None, 20, 3
+        ),
+        "Asteroid.__init__": (lambda _: Asteroid(game.player_ship, game.random), None, 2000, 5),
+        "Bullet.__init__": (lambda _: Bullet((950, 600), 45), None, 5000, 5),
+        "Game.handleCollisions[100 asteroids x 300 bullets]": (
+            lambda _: game.handleCollisions(), collisionSetup, 50, 3
+        ),
+        "Game.handleCollisions[masks, 100 asteroids x 300 bullets]": (maskedCollisions, collisionSetup, 50, 3),
+    }
+    if game.particles is not None:
+        from ViewportController import getViewport
+        particle_count = game.particles.capacity
+        benchmarks[f"ParticleSystem.update[{particle_count} particles]"] = (
+            lambda _: game.particles.update(game.simulation_step_ms, game.time_scale), particleSetup, 200, 3
+        )
+        benchmarks[f"ParticleSystem.getBlitSequence[{particle_count} particles]"] = (
+            lambda _: game.particles.getBlitSequence(getViewport()), particleSetup, 50, 3
+        )
+
+    results = {}
+    for name, (func, setup, number, repeat) in benchmarks.items():
+        if name_filter is None or name_filter in name:
+            results[name] = timeCalls(func, setup, max(1, int(number * scale)), repeat)
+    collisionSetup()
+    if game.particles is not None:
+        game.particles.clear()
+    return results
+
+def runMacroBenchmark(asteroid_count: int, bullet_count: int, frames: int, seed: int) -> dict:
+    """Time whole frames run through Game.runFrame with fixed entity counts.
+    Entities destroyed during a frame are replaced before the next one, outside the timing.
+    The state every timed frame started in is counted, so frames spent dying or game over show up.
+    Args:
+        asteroid_count (int): asteroids present at the start of every frame
+        bullet_count (int): bullets present at the start of every frame
+        frames (int): number of timed frames
+        seed (int): seed for spawning and placement randomness
+    Returns:
+        dict: frame time statistics along with the number of frames run in each state
+    """
+    game = createHeadlessGame(seed)
+    populate(game, asteroid_count, bullet_count)
+    # Warm the image and rotation caches before timing
+    for _ in range(3):
+        game.runFrame()
+        populate(game, asteroid_count, bullet_count)
+
+    frame_times = []
+    frame_states = {}
+    for _ in range(frames):
+        state = game.states.current.name
+        frame_states[state] = frame_states.get(state, 0) + 1
+        start = time.perf_counter()
+        game.runFrame()
+        frame_times.append(time.perf_counter() - start)
+        populate(game, asteroid_count, bullet_count)
+    return dict(summarizeFrameTimes(frame_times), states=frame_states)
+
+def getCommit() -> str:
+    """Return the current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def runBenchmarks(quick: bool = False, name_filter: str = None, seed: int = 0) -> dict:
+    """Run the micro and macro benchmarks.
+    Args:
+        quick (bool): run far fewer iterations, for smoke testing
+        name_filter (str): only run benchmarks whose name contains this text
+        seed (int): seed for all randomness
+    Returns:
+        dict: metadata along with micro and macro results
+    """
+    import pygame
+
+    scale = 0.05 if quick else 1.0
+    frames = 5 if quick else 60
+
+    game = createHeadlessGame(seed)
+    micro = runMicroBenchmarks(game, scale, name_filter)
+    macro = {}
+    for asteroid_count in MACRO_ASTEROID_COUNTS:
+        for bullet_count in MACRO_BULLET_COUNTS:
+            name = f"frame[{asteroid_count} asteroids x {bullet_count} bullets]"
+            if name_filter is None or name_filter in name:
+                macro[name] = runMacroBenchmark(asteroid_count, bullet_count, frames, seed)
+
+    return {
+        "meta": {
+            "commit": getCommit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": seed,
+            "quick": quick,
+        },
+        "micro": micro,
+        "macro": macro,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths headless.")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--quick", action="store_true", help="run a reduced number of iterations")
+    parser.add_argument("--filter", dest="name_filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--seed", type=int, default=0, help="seed for all randomness")
+    args = parser.parse_args()
+
+    results = runBenchmarks(args.quick, args.name_filter, args.seed)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@ Handles bullet creation, movement, and cleanup in the game.
 import pygame
 import Constants
 from Sprites import Sprite
-from SoundController import playPlayerLaserShot
+from SoundManager import playPlayerLaserShot
+from PoolController import SpritePool
+from ViewportController import getWorldSize
 class Bullet(Sprite):
     """Represents a bullet in the game that can be fired by the player's ship."""
     
@@ -17,20 +19,34 @@ class Bullet(Sprite):
         """
         super().__init__()
         self.initializeImage(Constants.BULLET_IMAGE_FILE, Constants.BULLET_DIMMENSIONS)
-        self.rect.center = coord
+        self.reset(coord, angle)
+
+    def reset(self, coord: tuple, angle: int) -> None:
+        """Reinitialize the bullet in place at the given coordinates and angle.
+        Args:
+            coord (tuple): The (x, y) coordinates of the ship
+            angle (int): The angle in degrees at which the bullet should be fired
+        """
+        self.resetState()
+        self.image = self.original_image
+        self.rect = self.image.get_rect(center=coord)
         
         self.rotateSprite(angle + Constants.BULLET_ANGLE_OFFSET)
+        self.position = pygame.math.Vector2(self.rect.center)
         self.calculateTrajectoryFromAngle(angle) # TODO: Once enemy ships are added. Re-configure or make new bullet class
 
-    def move(self): 
+    def move(self, time_scale: float = 1.0): 
         """Update bullet position and check if it should be removed.
+        Args:
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
         """
         v_x, v_y = self.trajectory_vx_vy
-        self.rect.x += v_x * Constants.BULLET_VELOCITY
-        self.rect.y += v_y * Constants.BULLET_VELOCITY
+        self.position.x += v_x * Constants.BULLET_VELOCITY * time_scale
+        self.position.y += v_y * Constants.BULLET_VELOCITY * time_scale
+        self.rect.center = self.position
 
-        # Get screen dimensions
-        width_of_screen, height_of_screen = pygame.display.get_surface().get_size()
+        # Get world dimensions
+        width_of_screen, height_of_screen = getWorldSize()
         
         # Mark bullet for removal if it goes off screen.
         if (self.rect.y <= 0 or 
@@ -39,6 +55,16 @@ class Bullet(Sprite):
             self.rect.x >= width_of_screen):
             self.should_destroy = True
 
+bullet_pool = SpritePool(Bullet, Constants.BULLET_POOL_SIZE)
+
+def createBullet(coord: tuple, angle: int) -> Bullet:
+    """Obtain a bullet from the pool, reusing a dead one when available.
+    Args:
+        coord (tuple): The (x, y) coordinates where the bullet should spawn
+        angle (int): The angle in degrees at which the bullet should be fired
+    """
+    return bullet_pool.acquire(coord, angle)
+
 def addBullet(game, coord: tuple, angle: int) -> None:
     """Create and add a new bullet to the game.
     Args:
@@ -46,7 +72,7 @@ def addBullet(game, coord: tuple, angle: int) -> None:
         coord (tuple): The (x, y) coordinates where the bullet should spawn
         angle (int): The angle in degrees at which the bullet should be fired
     """
-    newBullet = Bullet(coord, angle)
+    newBullet = createBullet(coord, angle)
     game.addPlayerBulletSprite(newBullet)
     playPlayerLaserShot()
   
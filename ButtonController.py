@@ -1,22 +1,45 @@
 import pygame
 import Constants
 from Sprites import Sprite
+from InputController import getMousePressed
+from ViewportController import getViewport, getWorldMousePos
 #from GameField import GameStatus
 
 
 class Button(Sprite): 
 
+    clickable = True
+
     def __init__(self):
         super().__init__()
 
     def clicked(self) -> bool:
-        return pygame.mouse.get_pressed()[0] and self.rect.collidepoint(pygame.mouse.get_pos())
+        return getMousePressed()[0] and self.rect.collidepoint(getWorldMousePos())
     
 class ResetButton(Button): 
     def __init__(self):
         super().__init__()
         self.initializeImage(Constants.RESET_BUTTON_IMAGE, Constants.RESET_BUTTON_DIMMENSION)
-        self.rect.center = pygame.display.get_surface().get_rect().center
+        self.rect.center = getViewport().rect.center
+
+class QuitButton(Button): 
+    """Button below the ResetButton that ends the game. There is no image for it, so its label is drawn."""
+
+    def __init__(self):
+        super().__init__()
+        self.original_image = self.drawLabel("QUIT", Constants.QUIT_BUTTON_DIMMENSION)
+        self.image = self.original_image
+        self.rect = self.image.get_rect()
+        center_x, center_y = getViewport().rect.center
+        self.rect.center = (center_x, center_y + (Constants.RESET_BUTTON_DIMMENSION[1] + Constants.QUIT_BUTTON_DIMMENSION[1]) // 2
+                            + Constants.QUIT_BUTTON_SPACING)
 
-# TODO-OPTIONAL: 
-#    - Create a QuitButton class that inherits from Button, place it below ResetButton
\ No newline at end of file
+    @staticmethod
+    def drawLabel(label: str, dimmensions: tuple) -> pygame.Surface:
+        """Draw a framed button with a text label."""
+        image = pygame.Surface(dimmensions)
+        image.fill(Constants.QUIT_BUTTON_COLOR)
+        pygame.draw.rect(image, (0, 0, 0), image.get_rect(), 4)
+        text = pygame.font.Font(None, dimmensions[1] // 2).render(label, True, (0, 0, 0))
+        image.blit(text, text.get_rect(center=image.get_rect().center))
+        return image
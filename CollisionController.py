@@ -0,0 +1,170 @@
+"""
+Collision Controller Module
+Provides a uniform-grid spatial hash used as a broadphase so that only sprites
+sharing a grid cell are handed to the narrow-phase rect tests, swept tests
+that catch fast projectiles passing through a target between two steps, and
+an optional pixel-perfect mask test confirming the hits of the rect tests.
+"""
+
+import pygame
+from AssetController import getMask
+
+# Narrow-phase counters, mask hits out of mask tests is how often a rect hit was a real hit
+collision_stats = {"mask_tests": 0, "mask_hits": 0}
+
+class SpatialHash():
+    """Uniform grid that buckets items by the cells their rects overlap."""
+
+    def __init__(self, cell_size: int):
+        """Initialize an empty grid.
+        Args:
+            cell_size (int): width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.item_count = 0
+
+    def clear(self) -> None:
+        """Remove every item from the grid."""
+        self.cells.clear()
+        self.item_count = 0
+
+    def cellRange(self, rect: pygame.Rect) -> tuple:
+        """Return the column and row ranges of the cells a rect overlaps."""
+        size = self.cell_size
+        return (
+            range(rect.left // size, (rect.right - 1) // size + 1),
+            range(rect.top // size, (rect.bottom - 1) // size + 1)
+        )
+
+    def insert(self, item, rect: pygame.Rect) -> None:
+        """Add an item to every cell its rect overlaps.
+        Items remember their insertion order so queries can return them in that order.
+        Args:
+            item: the object to store
+            rect (pygame.Rect): the area the item occupies
+        """
+        entry = (self.item_count, item)
+        self.item_count += 1
+        columns, rows = self.cellRange(rect)
+        cells = self.cells
+        for column in columns:
+            for row in rows:
+                cell = cells.get((column, row))
+                if cell is None:
+                    cells[(column, row)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Return the items sharing at least one cell with a rect.
+        Args:
+            rect (pygame.Rect): the area to search
+        Returns:
+            list: candidate items without duplicates, in insertion order
+        """
+        columns, rows = self.cellRange(rect)
+        cells = self.cells
+        found = {}
+        for column in columns:
+            for row in rows:
+                cell = cells.get((column, row))
+                if cell is not None:
+                    found.update(cell)
+
+        if len(found) > 1:
+            return [found[index] for index in sorted(found)]
+        return list(found.values())
+
+def sweptRect(rect: pygame.Rect, previous_center: tuple) -> pygame.Rect:
+    """Return the area a rect covered moving from previous_center to its current center in one step."""
+    return rect.union(rect.move(previous_center[0] - rect.centerx, previous_center[1] - rect.centery))
+
+def findFirstSweptHit(rect: pygame.Rect, previous_center: tuple, candidates: list, target_rect_name: str = "collision_rect",
+                      swept: pygame.Rect = None, accept=None):
+    """Find the candidate a moving rect hit first on its way from previous_center to its current center.
+    The rect's center is swept as a segment against each candidate's target rect grown by the moving
+    rect's size, which is equivalent to sweeping the whole rect.
+    Args:
+        rect (pygame.Rect): the moving rect at its current position
+        previous_center (tuple): the (x, y) center the rect moved from
+        candidates (list): sprites from the broadphase, in insertion order
+        target_rect_name (str): attribute of the candidates holding the rect to test against
+        swept (pygame.Rect): the rect's sweptRect when the caller already computed it
+        accept (Callable): called as accept(candidate, entry, exit) with the part of the path inside
+            the candidate's grown rect, in path order, a candidate only counts as hit if it returns True
+    Returns:
+        the candidate entered closest to previous_center, the earliest inserted one on ties, or None
+    """
+    start_x, start_y = previous_center
+    end = rect.center
+    size = rect.size
+    if swept is None:
+        swept = sweptRect(rect, previous_center)
+    first = None
+    first_distance = None
+    entered = []
+    for candidate in candidates:
+        target = getattr(candidate, target_rect_name)
+        # Most candidates only share a grid cell, reject them before clipping
+        if not swept.colliderect(target):
+            continue
+        clipped = target.inflate(size).clipline(previous_center, end)
+        if clipped:
+            (entry_x, entry_y), _ = clipped
+            distance = (entry_x - start_x) ** 2 + (entry_y - start_y) ** 2
+            if accept is not None:
+                entered.append((distance, len(entered), candidate, clipped))
+            elif first is None or distance < first_distance:
+                first, first_distance = candidate, distance
+
+    # Only confirm candidates until the first one along the path is accepted
+    for _, _, candidate, (entry, exit) in sorted(entered, key=lambda hit: hit[:2]):
+        if accept(candidate, entry, exit):
+            return candidate
+    return first
+
+def masksOverlap(sprite, other, center: tuple = None) -> bool:
+    """Test whether the opaque pixels of two sprites' images overlap.
+    Args:
+        sprite: the first sprite
+        other: the second sprite
+        center (tuple): test the first sprite as if centered here instead of at its rect's center
+    Returns:
+        bool: True if at least one pixel overlaps
+    """
+    rect = sprite.rect if center is None else sprite.rect.copy()
+    if center is not None:
+        rect.center = center
+    collision_stats["mask_tests"] += 1
+    offset = (other.rect.x - rect.x, other.rect.y - rect.y)
+    if getMask(sprite.image).overlap(getMask(other.image), offset) is None:
+        return False
+    collision_stats["mask_hits"] += 1
+    return True
+
+def masksOverlapAlongPath(sprite, other, entry: tuple, exit: tuple) -> bool:
+    """Test whether a moving sprite's pixels overlap another sprite's anywhere between two centers.
+    The path is sampled at intervals no longer than the sprite's smaller side, so it cannot skip over
+    anything as thick as the sprite.
+    Args:
+        sprite: the moving sprite
+        other: the sprite it may hit
+        entry (tuple): first center of the moving sprite to test
+        exit (tuple): last center of the moving sprite to test
+    Returns:
+        bool: True if the pixels overlap at any sample
+    """
+    entry_x, entry_y = entry
+    delta_x, delta_y = exit[0] - entry_x, exit[1] - entry_y
+    samples = int(max(abs(delta_x), abs(delta_y)) // max(1, min(sprite.rect.size))) + 1
+    for sample in range(samples + 1):
+        fraction = sample / samples
+        if masksOverlap(sprite, other, (round(entry_x + delta_x * fraction), round(entry_y + delta_y * fraction))):
+            return True
+    return False
+
+def getCollisionStats() -> dict:
+    """Return the narrow-phase counters along with the fraction of mask tests that hit."""
+    tests = collision_stats["mask_tests"]
+    return dict(collision_stats, mask_hit_rate=collision_stats["mask_hits"] / tests if tests else 0.0)
@@ -1,9 +1,20 @@
+import pygame
+
 SHIP_VELOCITY = 10
 SHIP_DIMMENSION = (150,150)
 SHIP_ANGLE_OFFSET = 90
+SHIP_HEALTH = 3
 SHIP_IMAGE_FILE = "./images/ship.png"
 SCREEN_SIZE = (1900,1200)
 SCREEN_COLOR = (178, 190, 181)
+FRAME_RATE = 60
+
+# Simulation timing, velocities and timers are expressed per BASE_TICK_RATE tick:
+BASE_TICK_RATE = 60
+SIMULATION_RATE = 60
+MAX_SIMULATION_STEPS_PER_FRAME = 5
+INTERPOLATE_RENDERING = True
+INTERPOLATION_SNAP_DISTANCE = 100
 
 X_ENEMY_SHIP = 100
 Y_ENEMY_SHIP = 100
@@ -21,8 +32,16 @@ ASTEROID_DIMMENSIONS = (100, 200)
 ASTEROID_SPEED = (5, 8)
 ASTEROID_ROTATION_SPEED = (-5, 5)
 ASTEROID_SPAWN_PADDING = 300
-ASTEROID_SPAWN_TIMER_VALUES = (300, 800)
-ASTEROID_POSSIBLE_SPAWN_AMOUNT = (5, 10)
+ASTEROID_SCORE = 10
+
+# Asteroid waves, spawns beyond the live cap or while frames run over budget are deferred,
+# and shed once deferred for longer than SPAWN_MAX_DEFER_MS:
+WAVES_FILE = "./waves.json"
+MAX_LIVE_ASTEROIDS = 40
+SPAWNS_PER_STEP = 2
+SPAWN_FRAME_TIME_BUDGET_MS = 25
+SPAWN_FRAME_TIME_SMOOTHING = 0.1
+SPAWN_MAX_DEFER_MS = 3000
 
 CROSSHAIR_DIMMENSIONS = (100, 100)
 CROSSHAIR_IMAGE_FILE = "./images/crosshair.png"
@@ -30,7 +49,122 @@ CROSSHAIR_IMAGE_FILE = "./images/crosshair.png"
 PLAYER_LASER_SOUND_FILE = "./sounds/laser-2.wav"
 ENEMY_LASER_SOUND_FILE = "./sounds/laser-1.wav"
 EXPLOSION_SOUND_FILE = "./sounds/explosion.wav"
+AUDIO_INIT_TIMEOUT = 3.0
+
+# Sound mixing, per category: reserved channels, priority for voice stealing (higher wins),
+# minimum milliseconds between two plays and volume of a single play:
+SOUND_CATEGORIES = {
+    "laser": {"sound": "player_laser_sound", "channels": 3, "priority": 2, "min_interval_ms": 40, "volume": 0.7},
+    "explosion": {"sound": "explosion_sound", "channels": 4, "priority": 1, "min_interval_ms": 60, "volume": 0.6},
+}
+# Volume added for every extra request of a category coalesced into one play in the same frame:
+SOUND_COALESCE_VOLUME_STEP = 0.1
 EXPLOSION_IMAGE_FILE = './images/explosion/8BitExplosionData.png'
 
 RESET_BUTTON_IMAGE = "./images/resetbutton.png"
-RESET_BUTTON_DIMMENSION = (200, 100)
\ No newline at end of file
+RESET_BUTTON_DIMMENSION = (200, 100)
+QUIT_BUTTON_DIMMENSION = (200, 100)
+QUIT_BUTTON_SPACING = 20
+QUIT_BUTTON_COLOR = (220, 220, 220)
+
+# Game states, the pause keys toggle a paused state that ticks at a low frame rate:
+PAUSE_KEYS = (pygame.K_p, pygame.K_ESCAPE)
+PAUSED_FRAME_RATE = 10
+
+# Asset caching:
+IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+ROTATION_ANGLE_STEP = 2
+ROTATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SCALED_IMAGE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Asset bundle, baked with 'python AssetBundle.py' and ignored when any image changed:
+IMAGE_DIRECTORY = "./images"
+ASSET_BUNDLE_FILE = "./assets.bundle"
+USE_ASSET_BUNDLE = True
+
+# Explosion animation, frames are prepared per size and angle bucket:
+ANIMATION_FRAME_DURATION_MS = 1000 / 60
+ANIMATION_SIZE_STEP = 20
+ANIMATION_ANGLE_STEP = 90
+ANIMATION_FRAME_CACHE_MAX_BYTES = 64 * 1024 * 1024
+WARM_ANIMATION_FRAMES = True
+
+# Collision broadphase, and swept bullet tests so fast bullets cannot pass through asteroids between steps:
+COLLISION_GRID_CELL_SIZE = 128
+SWEPT_BULLET_COLLISIONS = True
+# Pixel-perfect narrow phase, the sprite rects are the broadphase and masks are cached per rotated image:
+MASK_COLLISIONS = False
+MASK_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Batched motion (requires numpy):
+USE_ENTITY_STORE = False
+ENTITY_STORE_CAPACITY = 256
+
+# Object pools:
+BULLET_POOL_SIZE = 512
+ASTEROID_POOL_SIZE = 256
+
+# Rendering:
+WORLD_SIZE = None  # (width, height) of a playfield larger than the window, None matches the window
+LOGICAL_SIZE = None  # (width, height) frames are drawn at and then scaled to the window, None draws at the window's size
+PRESENT_KEEP_ASPECT = True  # Letterbox scaled frames instead of stretching them to the window's aspect ratio
+SMOOTH_PRESENT = False  # Filter scaled frames with smoothscale, slower than a plain scale
+CAMERA_FOLLOWS_SHIP = True
+USE_DIRTY_RECT_RENDERING = True
+DIRTY_RECT_FULL_REDRAW_RATIO = 0.5
+
+# Adaptive quality, tiers from best to cheapest. The governor lowers the tier when the mean frame time
+# over QUALITY_WINDOW frames exceeds QUALITY_DOWNGRADE_RATIO of the frame budget and raises it once
+# below QUALITY_UPGRADE_RATIO, keeping every tier for at least QUALITY_HOLD_FRAMES. Headless, replayed
+# and recorded games keep the first tier since the tiers change how the simulation plays out:
+QUALITY_GOVERNOR = True
+QUALITY_WINDOW = 60
+QUALITY_HOLD_FRAMES = 120
+QUALITY_DOWNGRADE_RATIO = 0.9
+QUALITY_UPGRADE_RATIO = 0.5
+PRINT_QUALITY_CHANGES = True
+QUALITY_TIERS = (
+    {"rotation_angle_step": ROTATION_ANGLE_STEP, "rotation_interval": 1, "animation_frame_step": 1, "max_explosions": None, "render_scale": 1.0, "particle_density": 1.0},
+    {"rotation_angle_step": 4, "rotation_interval": 1, "animation_frame_step": 1, "max_explosions": 24, "render_scale": 1.0, "particle_density": 1.0},
+    {"rotation_angle_step": 6, "rotation_interval": 2, "animation_frame_step": 2, "max_explosions": 12, "render_scale": 1.0, "particle_density": 0.75},
+    {"rotation_angle_step": 10, "rotation_interval": 3, "animation_frame_step": 2, "max_explosions": 8, "render_scale": 0.75, "particle_density": 0.5},
+    {"rotation_angle_step": 15, "rotation_interval": 4, "animation_frame_step": 3, "max_explosions": 4, "render_scale": 0.5, "particle_density": 0.25},
+)
+
+# Particles, purely visual and skipped when numpy is not installed.
+# Speeds are in pixels per BASE_TICK_RATE tick:
+PARTICLES = True
+PARTICLE_CAPACITY = 4096
+PARTICLE_DRAG = 0.94
+PARTICLE_FADE_STEPS = 4
+EXPLOSION_PARTICLES = 40
+EXPLOSION_PARTICLE_SPEED = (2, 9)
+EXPLOSION_PARTICLE_LIFE_MS = (300, 900)
+EXPLOSION_PARTICLE_COLORS = ((255, 200, 60), (255, 120, 30), (90, 80, 70))
+HIT_PARTICLES = 8
+HIT_PARTICLE_SPEED = (3, 7)
+HIT_PARTICLE_LIFE_MS = (100, 250)
+HIT_PARTICLE_COLORS = ((255, 240, 180), (255, 200, 60))
+THRUST_PARTICLES = 3
+THRUST_PARTICLE_SPEED = (2, 5)
+THRUST_PARTICLE_SPREAD = 0.6
+THRUST_PARTICLE_LIFE_MS = (150, 350)
+THRUST_PARTICLE_COLORS = ((80, 160, 255), (255, 255, 255))
+STARFIELD_STARS = 250
+STAR_SIZES = (1, 3)
+STAR_COLORS = ((90, 95, 110), (130, 135, 150), (60, 60, 70))
+
+# Profiling (F3 toggles the overlay):
+PROFILER_ENABLED = False
+PROFILER_WINDOW = 300
+PROFILER_OVERLAY_REFRESH = 15
+PROFILER_OUTPUT_FILE = None
+
+# Startup, assets and audio load on a thread pool behind a loading screen:
+LOADING_THREADS = 4
+LOADING_SCREEN_FRAME_RATE = 30
+PRINT_STARTUP_TIMES = True
+
+# Replays, a file name here records every game started from main.py:
+REPLAY_RECORD_FILE = None
+REPLAY_CHECKPOINT_INTERVAL = 600
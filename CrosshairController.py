@@ -1,10 +1,15 @@
 from Sprites import Sprite
 import Constants
 import pygame
+from AssetController import loadImage
+from ViewportController import getWorldMousePos
 
 
 class Crosshair(Sprite): 
 
+    # Follows the mouse directly, drawing it between positions would only add lag
+    interpolate = False
+
     def __init__(self): 
         """Initializes the crosshair."""
         super().__init__()
@@ -12,14 +17,11 @@ class Crosshair(Sprite):
 
     def initalizeImage(self): 
         """Initalizes the image of the crosshair."""
-        self.image = pygame.transform.scale(
-            pygame.image.load(Constants.CROSSHAIR_IMAGE_FILE), 
-            Constants.CROSSHAIR_DIMMENSIONS
-        )
+        self.image = loadImage(Constants.CROSSHAIR_IMAGE_FILE, Constants.CROSSHAIR_DIMMENSIONS)
 
         self.rect = self.image.get_rect()
-        self.rect.center = pygame.mouse.get_pos()
+        self.rect.center = getWorldMousePos()
 
-    def move(self): 
+    def move(self, time_scale: float = 1.0): 
         """Moves the crosshair to the mouse position."""
-        self.rect.center = pygame.mouse.get_pos()
\ No newline at end of file
+        self.rect.center = getWorldMousePos()
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Entity Registry Module
+Indexes the game's sprites by type and by state, animating, pending destruction
+and clickable, so game phases visit only the sprites they act on instead of
+scanning whole groups. Sprites move between the state indexes themselves when
+their should_animate and should_destroy flags change.
+"""
+
+# Indexes kept in sync with sprite flags, see Sprite.should_animate and Sprite.should_destroy
+ANIMATING = "animating"
+DESTROYING = "destroying"
+CLICKABLE = "clickable"
+
+class EntityRegistry():
+    """
+    Per-type and per-state indexes of the registered sprites.
+
+    Indexes are dicts used as insertion-ordered sets, so iterating them is as
+    deterministic as iterating a sprite group.
+
+    Attributes:
+        by_type (dict): Sprite class -> {sprite: None} of the registered sprites of exactly that class
+        by_state (dict): State name -> {sprite: None} of the registered sprites in that state
+    """
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self.by_type = {}
+        self.by_state = {ANIMATING: {}, DESTROYING: {}, CLICKABLE: {}}
+
+    def register(self, sprite) -> None:
+        """Index a sprite by its type and current state."""
+        if sprite.registry is self:
+            return
+        sprite.registry = self
+        self.by_type.setdefault(type(sprite), {})[sprite] = None
+        if sprite.clickable:
+            self.by_state[CLICKABLE][sprite] = None
+        self.setState(sprite, ANIMATING, sprite.should_animate)
+        self.setState(sprite, DESTROYING, sprite.should_destroy)
+
+    def unregister(self, sprite) -> None:
+        """Remove a sprite from every index."""
+        if sprite.registry is not self:
+            return
+        sprite.registry = None
+        self.by_type[type(sprite)].pop(sprite, None)
+        for index in self.by_state.values():
+            index.pop(sprite, None)
+
+    def setState(self, sprite, state: str, active: bool) -> None:
+        """Add a sprite to or remove it from a state index, called when its flag changes."""
+        if active:
+            self.by_state[state][sprite] = None
+        else:
+            self.by_state[state].pop(sprite, None)
+
+    def getByType(self, sprite_type: type) -> list:
+        """Return the registered sprites of exactly the given class."""
+        return list(self.by_type.get(sprite_type, ()))
+
+    def hasType(self, sprite_type: type) -> bool:
+        """Return True if any sprite of exactly the given class is registered."""
+        return bool(self.by_type.get(sprite_type))
+
+    def getInState(self, state: str) -> list:
+        """Return the registered sprites in a state, as a list that is safe to modify the index while iterating."""
+        return list(self.by_state[state])
+
+    def countInState(self, state: str) -> int:
+        """Return the number of registered sprites in a state."""
+        return len(self.by_state[state])
+
+    def getCounts(self) -> dict:
+        """Return the number of sprites in every state index and of every type."""
+        counts = {state: len(index) for state, index in self.by_state.items()}
+        for sprite_type, index in self.by_type.items():
+            counts[sprite_type.__name__] = len(index)
+        return counts
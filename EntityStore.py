@@ -0,0 +1,180 @@
+"""
+Entity Store Module
+Optional structure-of-arrays backend that advances asteroid and bullet motion in
+a few vectorized NumPy operations per tick. Sprites attached to a store become
+thin views: they only receive their image and rect for rendering.
+Requires numpy; isAvailable() reports whether it can be used.
+"""
+
+import Constants
+from AssetController import getRotatedImage
+from QualityController import DEFAULT_QUALITY_SETTINGS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def isAvailable() -> bool:
+    """Return True if numpy is installed and an EntityStore can be created."""
+    return numpy is not None
+
+class EntityStore():
+    """
+    Keeps positions, velocities and rotation of asteroids and bullets in NumPy arrays.
+
+    Positions are stored as float rect centers, the rect size of a rotating asteroid is
+    derived from its angle, and asteroids keep the rect.width based vertical wrap of
+    Asteroid.move. Health stays on the sprites since collisions are resolved per pair.
+    """
+
+    FIELDS = (
+        "center_x", "center_y", "trajectory_x", "trajectory_y", "speed",
+        "angle", "rotation_speed", "base_width", "base_height", "width", "height"
+    )
+    FLAGS = ("is_bullet", "is_frozen")
+
+    def __init__(self, capacity: int = Constants.ENTITY_STORE_CAPACITY, quality_settings: dict = DEFAULT_QUALITY_SETTINGS):
+        """Allocate arrays for the given number of entities.
+        Args:
+            capacity (int): initial number of entity slots, grown as needed
+            quality_settings (dict): quality tier settings of the game, read when syncing rotations
+        """
+        self.quality_settings = quality_settings
+        self.count = 0
+        self.syncs = 0
+        self.capacity = capacity
+        self.sprites = []
+        self.culled = numpy.zeros(0, dtype=numpy.intp)
+        for field in self.FIELDS:
+            setattr(self, field, numpy.zeros(capacity, dtype=numpy.float64))
+        for flag in self.FLAGS:
+            setattr(self, flag, numpy.zeros(capacity, dtype=bool))
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+        self.capacity *= 2
+        for name in self.FIELDS + self.FLAGS:
+            old = getattr(self, name)
+            new = numpy.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, sprite, is_bullet: bool = False) -> None:
+        """Attach a sprite to the store, copying its motion state into the arrays.
+        Args:
+            sprite (Sprite): an Asteroid or Bullet
+            is_bullet (bool): True if the sprite follows Bullet.move rules
+        """
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.sprites.append(sprite)
+        sprite.entity_store = self
+        sprite.store_index = i
+
+        self.center_x[i], self.center_y[i] = sprite.rect.center
+        self.trajectory_x[i], self.trajectory_y[i] = sprite.trajectory_vx_vy
+        self.angle[i] = sprite.angle
+        self.is_bullet[i] = is_bullet
+        self.is_frozen[i] = sprite.should_animate
+        self.width[i], self.height[i] = sprite.rect.size
+        if is_bullet:
+            self.speed[i] = Constants.BULLET_VELOCITY
+            self.rotation_speed[i] = 0
+        else:
+            self.speed[i] = sprite.speed
+            self.rotation_speed[i] = sprite.rotation_speed
+            self.base_width[i], self.base_height[i] = sprite.original_image.get_size()
+
+    def remove(self, sprite) -> None:
+        """Detach a sprite, moving the last entity into its slot."""
+        i = sprite.store_index
+        last = self.count - 1
+        if i != last:
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.store_index = i
+            for name in self.FIELDS + self.FLAGS:
+                array = getattr(self, name)
+                array[i] = array[last]
+        self.sprites.pop()
+        self.count = last
+        sprite.entity_store = None
+        sprite.store_index = None
+
+    def step(self, screen_size: tuple, time_scale: float = 1.0) -> None:
+        """Advance every entity by one tick, wrapping asteroids and culling bullets.
+        Args:
+            screen_size (tuple): (width, height) of the play area
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
+        """
+        n = self.count
+        self.culled = numpy.zeros(0, dtype=numpy.intp)
+        if n == 0:
+            return
+        screen_width, screen_height = screen_size
+        padding = Constants.ASTEROID_SPAWN_PADDING
+        moving = ~self.is_frozen[:n]
+        is_bullet = self.is_bullet[:n]
+        center_x, center_y = self.center_x[:n], self.center_y[:n]
+        width, height = self.width[:n], self.height[:n]
+
+        center_x += numpy.where(moving, self.trajectory_x[:n] * self.speed[:n] * time_scale, 0)
+        center_y += numpy.where(moving, self.trajectory_y[:n] * self.speed[:n] * time_scale, 0)
+
+        # Asteroids rotate and their bounding rect grows and shrinks with the angle
+        rotating = moving & ~is_bullet
+        angle = self.angle[:n]
+        angle += numpy.where(rotating, self.rotation_speed[:n] * time_scale, 0)
+        angle %= 360
+        radians = numpy.radians(angle)
+        cos, sin = numpy.abs(numpy.cos(radians)), numpy.abs(numpy.sin(radians))
+        base_width, base_height = self.base_width[:n], self.base_height[:n]
+        width[:] = numpy.where(rotating, base_width * cos + base_height * sin, width)
+        height[:] = numpy.where(rotating, base_width * sin + base_height * cos, height)
+
+        # Screen wrapping, applied in the same order as Asteroid.move
+        left = center_x - width / 2
+        left = numpy.where(rotating & (left < -padding), screen_width + width, left)
+        left = numpy.where(rotating & (left > screen_width + padding), -width, left)
+        top = center_y - height / 2
+        top = numpy.where(rotating & (top < -padding), screen_height + width, top)
+        top = numpy.where(rotating & (top > screen_height + padding), -height, top)
+        center_x[:] = left + width / 2
+        center_y[:] = top + height / 2
+
+        # Bullets leaving the screen are marked for removal, as in Bullet.move
+        self.culled = numpy.flatnonzero(
+            is_bullet & ((top <= 0) | (top >= screen_height) | (left <= 0) | (left >= screen_width))
+        )
+
+    def syncSprites(self) -> None:
+        """Copy positions and rotations back into the sprite views for rendering."""
+        center_x = self.center_x[:self.count].tolist()
+        center_y = self.center_y[:self.count].tolist()
+        angle = self.angle[:self.count].tolist()
+        is_bullet = self.is_bullet[:self.count].tolist()
+        # Lower quality tiers only redraw rotations every few steps
+        self.syncs += 1
+        update_images = self.syncs % self.quality_settings["rotation_interval"] == 0
+        angle_step = self.quality_settings["rotation_angle_step"]
+
+        for i, sprite in enumerate(self.sprites):
+            if sprite.should_animate:
+                # The animation owns the image from now on, stop moving the entity
+                self.is_frozen[i] = True
+                continue
+            center = (center_x[i], center_y[i])
+            if is_bullet[i]:
+                sprite.rect.center = center
+            else:
+                sprite.angle = angle[i]
+                if update_images:
+                    sprite.image = getRotatedImage(sprite.original_image, angle[i], angle_step)
+                sprite.rect = sprite.image.get_rect(center=center)
+                sprite.collision_rect.center = sprite.rect.center
+
+        for i in self.culled.tolist():
+            self.sprites[i].should_destroy = True
@@ -4,18 +4,36 @@ This module contains the Game class which manages the game loop, sprite groups,
 collisions, animations, and other game-related functionality.
 """
 
-import pygame, sys
+import pygame, sys, random, math
 import Constants
 from pygame.locals import QUIT
 from typing import List
 from Sprites import Sprite
-from AnimationController import obtainSpriteAnimationImages
-from SoundController import playExplosionSound
-from ButtonController import ResetButton
+from AnimationController import getAnimationFrameCacheStats
+from AssetController import getMaskCacheStats
+from SoundManager import playExplosionSound, sound_manager
+from ButtonController import ResetButton, QuitButton
 from ShipController import Ship
 from CrosshairController import Crosshair
-from BulletController import addBullet
-from AsteroidController import generateAsteroids
+from BulletController import addBullet, bullet_pool
+from AsteroidController import asteroid_pool
+from WaveController import WaveScheduler, loadWaves
+from QualityController import QualityGovernor
+from CollisionController import SpatialHash, sweptRect, findFirstSweptHit, masksOverlap, masksOverlapAlongPath, getCollisionStats
+import EntityStore
+import ParticleController
+from EntityRegistry import EntityRegistry, ANIMATING, DESTROYING, CLICKABLE
+from GameStateController import GameStateMachine, PLAYING, DYING, GAME_OVER
+from RenderController import Renderer
+from ViewportController import getViewport, getWorldSize
+from InputController import getInputSource, getEvents, getMousePressed
+from ProfilerController import FrameProfiler
+# initiateGameScreen is re-exported for callers that create games
+from LoadingController import initiateGameScreen, loadExplosionAnimationImages
+from time import perf_counter_ns
+
+# Sprite groups saved by Game.captureSnapshot
+SNAPSHOT_GROUPS = ("player_sprites", "player_bullet_sprites", "enemy_sprites", "asteroid_sprites")
 
 class Game(): 
     """
@@ -29,70 +47,338 @@ class Game():
         score (int): Current game score
         isGameStillRunning (bool): Flag indicating if the game is still active
         clock (pygame.time.Clock): Game clock for controlling frame rate
+        frame_rate (int): Frame rate cap passed to clock.tick, 0 runs uncapped
+        dt (int): Milliseconds the last frame took according to the clock
+        fixed_frame_time (float): Milliseconds every frame is treated as taking, None uses dt
+        simulation_step_ms (float): Length of one fixed simulation step in milliseconds
+        time_scale (float): Length of one simulation step relative to a BASE_TICK_RATE tick
+        accumulator (float): Milliseconds of frame time not yet simulated
+        discard_frame_time (bool): Leave the current frame's time out of the accumulator, e.g. when it was spent paused
+        interpolation_alpha (float): Fraction of a step the rendered positions are ahead of the simulation
+        random (random.Random): Source of all spawning randomness, seeded per game
+        wave_scheduler (WaveScheduler): Spawns asteroids from the waves in WAVES_FILE
         screen (pygame.Surface): Main game screen surface
         explosion_animation_images (List): List of explosion animation frames
         player_ship (Ship): Player's ship instance
         crosshair (Crosshair): Crosshair instance for aiming
+        asteroid_grid (SpatialHash): Broadphase grid of asteroid collision rects
+        entity_store (EntityStore): Batched asteroid and bullet motion, None when disabled
+        particles (ParticleSystem): Explosion, hit and thrust particles, None when disabled
+        starfield (Starfield): Stars drawn behind the sprites, None when particles are disabled
+        last_ship_center (tuple): Ship position the thrust emitter compares against
+        registry (EntityRegistry): Sprites in the game indexed by type and by state
+        renderer (Renderer): Draws sprite groups using full or dirty-rectangle redraws
+        profiler (FrameProfiler): Per-phase frame timings and statistics overlay
+        input_phases (List[tuple]): (name, method) pairs run once at the start of every frame
+        simulation_phases (List[tuple]): (name, method) pairs run once per fixed simulation step
+        audio_phases (List[tuple]): (name, method) pairs run once every frame after the simulation,
+            whatever the state and whether or not rendering is enabled
+        render_phases (List[tuple]): (name, method) pairs run once at the end of every frame
+        states (GameStateMachine): Current game state, which picks the phases that run in it
+        render_enabled (bool): Whether the render phases run, off for simulations nobody watches
+        quality (QualityGovernor): Lowers the quality tier when frames run over budget, only
+            enabled for capped games measuring real frame times
     """
 
-    def __init__(self, screen: pygame.Surface):
-        """Initialize the game state with the given screen surface."""
+    def __init__(self, screen: pygame.Surface, seed: int = None, frame_rate: int = Constants.FRAME_RATE,
+                 fixed_frame_time: float = None, explosion_animation_images: list = None):
+        """Initialize the game state with the given screen surface.
+        Args:
+            screen (pygame.Surface): surface the game is drawn on
+            seed (int): seed for spawning randomness, None seeds from the system
+            frame_rate (int): frame rate cap, 0 runs as fast as possible
+            fixed_frame_time (float): treat every frame as taking this many milliseconds instead
+                of measuring it, which makes the number of simulation steps deterministic
+            explosion_animation_images (list): frames prepared by the loader, loaded here when None
+        """
         self.player_sprites = pygame.sprite.Group()
         self.player_bullet_sprites = pygame.sprite.Group()
         self.enemy_sprites = pygame.sprite.Group()
         self.asteroid_sprites = pygame.sprite.Group()
 
         # TODO-OPTIONAL:
-        #   keep track of score and display it onto the screen.
+        #   display the score onto the screen.
         self.score = 0
 
         self.isGameStillRunning = True
         self.clock = pygame.time.Clock()
+        self.frame_rate = frame_rate
+        self.dt = 0
+        self.fixed_frame_time = fixed_frame_time
+        self.simulation_step_ms = 1000 / Constants.SIMULATION_RATE
+        self.time_scale = Constants.BASE_TICK_RATE / Constants.SIMULATION_RATE
+        self.accumulator = 0.0
+        self.discard_frame_time = False
+        self.interpolation_alpha = 1.0
+        self.random = random.Random(seed)
+        self.wave_scheduler = WaveScheduler(loadWaves(Constants.WAVES_FILE))
         self.screen = screen
-        self.explosion_animation_images = obtainSpriteAnimationImages(Constants.EXPLOSION_IMAGE_FILE)
-
+        # Tiers change how the simulation plays out, so games with fixed frame times keep the first
+        self.quality = QualityGovernor(frame_rate, Constants.QUALITY_GOVERNOR and fixed_frame_time is None)
+        self.renderer = Renderer(screen, quality_settings=self.quality.settings)
+        self.asteroid_grid = SpatialHash(Constants.COLLISION_GRID_CELL_SIZE)
+        self.entity_store = None
+        if Constants.USE_ENTITY_STORE:
+            if EntityStore.isAvailable():
+                self.entity_store = EntityStore.EntityStore(quality_settings=self.quality.settings)
+            else:
+                print("numpy is not installed, falling back to per-sprite motion")
+        self.particles = None
+        self.starfield = None
+        self.last_ship_center = None
+        if Constants.PARTICLES:
+            if ParticleController.isAvailable():
+                self.particles = ParticleController.ParticleSystem(seed=seed, quality_settings=self.quality.settings)
+                self.starfield = ParticleController.Starfield(seed=seed)
+            else:
+                print("numpy is not installed, particles are disabled")
+
+        self.registry = EntityRegistry()
+
+        self.profiler = FrameProfiler()
+        self.profiler.addCounterSource("bullet_pool", bullet_pool.getStats)
+        self.profiler.addCounterSource("asteroid_pool", asteroid_pool.getStats)
+        self.profiler.addCounterSource("animation_frames", getAnimationFrameCacheStats)
+        self.profiler.addCounterSource("sound", sound_manager.getStats)
+        self.profiler.addCounterSource("registry", lambda: self.registry.getCounts())
+        self.profiler.addCounterSource("states", lambda: self.states.getStats())
+        self.profiler.addCounterSource("masks", getMaskCacheStats)
+        self.profiler.addCounterSource("collisions", getCollisionStats)
+        self.profiler.addCounterSource("spawning", self.wave_scheduler.getStats)
+        if self.particles is not None:
+            self.profiler.addCounterSource("particles", self.particles.getStats)
+        self.profiler.addCounterSource("quality", self.quality.getStats)
+        if Constants.PROFILER_OUTPUT_FILE:
+            self.profiler.startRecording(Constants.PROFILER_OUTPUT_FILE)
+        self.input_phases = [
+            ("handleGameEvents", self.handleGameEvents),
+        ]
+        self.simulation_phases = [
+            ("handleEnemyAndObstacleGeneration", self.handleEnemyAndObstacleGeneration),
+            ("handleSpriteMotion", self.handleSpriteMotion),
+            ("handleCamera", self.handleCamera),
+            ("handleCollisions", self.handleCollisions),
+            ("handleAnimations", self.handleAnimations),
+            ("handleDestruction", self.handleDestruction),
+            ("handleShipExplosion", self.handleShipExplosion),
+            ("handleParticles", self.handleParticles),
+        ]
+        # Sounds queued by any state are played once per frame, also when nothing is rendered
+        self.audio_phases = [
+            ("flushSounds", sound_manager.flush),
+        ]
+        self.render_enabled = True
+        self.render_phases = [
+            ("updateSprites", self.updateSprites),
+        ]
+
+        # The game starts playing once its sprites are ready
+        self.states = GameStateMachine(self)
+        if explosion_animation_images is None:
+            explosion_animation_images = loadExplosionAnimationImages()
+        self.explosion_animation_images = explosion_animation_images
         self.player_ship = Ship()
         self.crosshair = Crosshair()
         self.addPlayerSprites([self.crosshair, self.player_ship])
+        self.states.change(PLAYING)
 
     def addPlayerSprites(self, listOfSprites: List[Sprite]) -> None: 
         """Add multiple sprites to the player sprite group."""
-        self.player_sprites.add(listOfSprites)
+        for sprite in listOfSprites:
+            self.addPlayerSprite(sprite)
 
     def addPlayerSprite(self, sprite: Sprite) -> None: 
         """Add a single sprite to the player sprite group."""
         self.player_sprites.add(sprite)
+        sprite.quality_settings = self.quality.settings
+        self.registry.register(sprite)
 
     def addPlayerBulletSprites(self, sprite: List[Sprite]) -> None: 
         """Add multiple bullet sprites to the player bullet group."""
-        self.player_bullet_sprites.add(sprite)
+        for bullet in sprite:
+            self.addPlayerBulletSprite(bullet)
 
     def addPlayerBulletSprite(self, sprite: Sprite) -> None: 
         """Add a single bullet sprite to the player bullet group."""
         self.player_bullet_sprites.add(sprite)
+        sprite.quality_settings = self.quality.settings
+        self.registry.register(sprite)
+        if self.entity_store is not None:
+            self.entity_store.add(sprite, is_bullet=True)
 
     def addAsteroidSprite(self, sprite:Sprite) -> None: 
         """Add a single asteroid sprite to the asteroid group."""
         self.asteroid_sprites.add(sprite)
+        sprite.quality_settings = self.quality.settings
+        self.registry.register(sprite)
+        if self.entity_store is not None:
+            self.entity_store.add(sprite)
 
     def addAsteroidSprites(self, sprite: List[Sprite]) -> None: 
         """Add multiple asteroid sprites to the asteroid group."""
-        self.asteroid_sprites.add(sprite)
+        for asteroid in sprite:
+            self.addAsteroidSprite(asteroid)
 
     def updateSprites(self) -> None:
         """Update and render all sprites on the screen."""
-        self.screen.fill(Constants.SCREEN_COLOR)
-        for sprite in self.player_sprites: 
-            self.screen.blit(sprite.image, sprite.rect)
-
-        for sprite in self.asteroid_sprites: 
-            self.screen.blit(sprite.image, sprite.rect)
-
-        for sprite in self.player_bullet_sprites: 
-            self.screen.blit(sprite.image, sprite.rect)
-
-        self.dt = self.clock.tick(60)
-        pygame.display.flip()
+        self.renderer.render(
+            [self.player_sprites, self.asteroid_sprites, self.player_bullet_sprites],
+            [self.states.drawOverlay, self.profiler.drawOverlay],
+            self.interpolation_alpha if Constants.INTERPOLATE_RENDERING else None,
+            background=self.starfield,
+            effects=self.particles,
+        )
+
+    def consumeSimulationSteps(self) -> int:
+        """Add the last frame's time to the accumulator and take whole simulation steps out of it.
+        At most MAX_SIMULATION_STEPS_PER_FRAME steps are taken, time beyond that is dropped so
+        a slow frame cannot snowball into ever longer catch-up frames.
+        Returns:
+            int: number of simulation steps to run this frame
+        """
+        frame_time = self.dt if self.fixed_frame_time is None else self.fixed_frame_time
+        if self.discard_frame_time:
+            frame_time = 0
+            self.discard_frame_time = False
+        step = self.simulation_step_ms
+        self.accumulator = min(self.accumulator + frame_time, step * Constants.MAX_SIMULATION_STEPS_PER_FRAME)
+        steps = int(self.accumulator // step)
+        self.accumulator -= steps * step
+        self.interpolation_alpha = self.accumulator / step
+        return steps
+
+    def getFrameRate(self) -> int:
+        """Return the frame rate cap of the current state, idle states tick slower unless the game runs uncapped."""
+        idle_frame_rate = self.states.current.idle_frame_rate
+        if idle_frame_rate and self.frame_rate:
+            return min(idle_frame_rate, self.frame_rate)
+        return self.frame_rate
+
+    def runFrame(self) -> None:
+        """Run a single frame: handle input, run as many fixed simulation steps as the elapsed
+        time calls for, play the queued sounds and render, running only the phases of the current
+        game state. A state can change during any phase, the following phases are those of the
+        new state. While the profiler is enabled each phase is timed, excluding the wait for the
+        next frame.
+        """
+        getInputSource().nextFrame(self)
+        if self.profiler.enabled:
+            start = perf_counter_ns()
+            phase_ns = self.profiler.runPhases(self.states.current.input_phases)
+            steps = self.consumeSimulationSteps() if self.states.current.simulation_phases else 0
+            for _ in range(steps):
+                self.profiler.runPhases(self.states.current.simulation_phases, phase_ns)
+            self.profiler.runPhases(self.audio_phases, phase_ns)
+            if self.render_enabled:
+                self.profiler.runPhases(self.states.current.render_phases, phase_ns)
+            frame_ns = perf_counter_ns() - start
+            self.quality.update(frame_ns / 1e6)
+            self.dt = self.clock.tick(self.getFrameRate())
+            entity_counts = self.getEntityCounts()
+            entity_counts["simulation_steps"] = steps
+            self.profiler.recordFrame(frame_ns, phase_ns, self.dt, entity_counts)
+            return
+
+        start = perf_counter_ns()
+        for _, phase in self.states.current.input_phases:
+            phase()
+        # States without simulation phases, e.g. paused, stop the simulation clock
+        steps = self.consumeSimulationSteps() if self.states.current.simulation_phases else 0
+        for _ in range(steps):
+            for _, phase in self.states.current.simulation_phases:
+                phase()
+        for _, phase in self.audio_phases:
+            phase()
+        if self.render_enabled:
+            for _, phase in self.states.current.render_phases:
+                phase()
+        self.quality.update((perf_counter_ns() - start) / 1e6)
+        self.dt = self.clock.tick(self.getFrameRate())
+
+    def getEntityCounts(self) -> dict:
+        """Return the number of sprites in every sprite group and the number not drawn last frame."""
+        return {
+            "player_sprites": len(self.player_sprites),
+            "player_bullet_sprites": len(self.player_bullet_sprites),
+            "enemy_sprites": len(self.enemy_sprites),
+            "asteroid_sprites": len(self.asteroid_sprites),
+            "culled_sprites": self.renderer.culled,
+        }
+
+    def captureSnapshot(self) -> dict:
+        """Capture the simulation state so it can be restored later, e.g. to seek in a replay.
+        Sprites are cloned, sharing their images with the live ones.
+        Returns:
+            dict: the snapshot, which can be restored any number of times
+        """
+        clones = {}
+        def cloneOf(sprite):
+            if id(sprite) not in clones:
+                clones[id(sprite)] = sprite.clone()
+            return clones[id(sprite)]
+
+        return {
+            "groups": {name: [cloneOf(sprite) for sprite in getattr(self, name)] for name in SNAPSHOT_GROUPS},
+            "player_ship": cloneOf(self.player_ship),
+            "crosshair": cloneOf(self.crosshair),
+            "random": self.random.getstate(),
+            "score": self.score,
+            "wave_scheduler": self.wave_scheduler.captureState(),
+            "accumulator": self.accumulator,
+            "interpolation_alpha": self.interpolation_alpha,
+            "dt": self.dt,
+            "viewport": (getViewport().window_size, getViewport().rect.topleft),
+            "state": (self.states.current.name, self.states.paused_state and self.states.paused_state.name),
+        }
+
+    def restoreSnapshot(self, snapshot: dict) -> None:
+        """Replace the simulation state with a snapshot from captureSnapshot."""
+        clones = {}
+        def cloneOf(sprite):
+            if id(sprite) not in clones:
+                clone = sprite.clone()
+                # Clones of pooled sprites are released to the pool when killed, so count them as in use
+                if clone.pool is not None:
+                    clone.pool.adopt(clone)
+                clones[id(sprite)] = clone
+            return clones[id(sprite)]
+
+        # Killing the current sprites hands pooled ones back, keeping the shared pool counts right
+        for name in SNAPSHOT_GROUPS:
+            for sprite in getattr(self, name).sprites():
+                sprite.kill()
+        if self.entity_store is not None:
+            self.entity_store = EntityStore.EntityStore(quality_settings=self.quality.settings)
+        self.registry = EntityRegistry()
+        self.addPlayerSprites([cloneOf(sprite) for sprite in snapshot["groups"]["player_sprites"]])
+        for sprite in snapshot["groups"]["player_bullet_sprites"]:
+            self.addPlayerBulletSprite(cloneOf(sprite))
+        for sprite in snapshot["groups"]["asteroid_sprites"]:
+            self.addAsteroidSprite(cloneOf(sprite))
+        for sprite in snapshot["groups"]["enemy_sprites"]:
+            enemy = cloneOf(sprite)
+            self.enemy_sprites.add(enemy)
+            enemy.quality_settings = self.quality.settings
+            self.registry.register(enemy)
+        self.player_ship = cloneOf(snapshot["player_ship"])
+        self.crosshair = cloneOf(snapshot["crosshair"])
+
+        self.random.setstate(snapshot["random"])
+        self.score = snapshot["score"]
+        self.wave_scheduler.restoreState(snapshot["wave_scheduler"])
+        self.accumulator = snapshot["accumulator"]
+        self.interpolation_alpha = snapshot["interpolation_alpha"]
+        self.dt = snapshot["dt"]
+        viewport_size, camera = snapshot["viewport"]
+        getViewport().resize(viewport_size)
+        getViewport().rect.topleft = camera
+        # Particles are not part of the snapshot, the ones in flight belong to another moment
+        if self.particles is not None:
+            self.particles.clear()
+        self.last_ship_center = None
+        # The restored sprites already include the state's buttons
+        self.states.restore(*snapshot["state"])
+        self.renderer.requestFullRedraw()
 
     def getExplosionAnimationImage(self): 
         """Return the explosion animation frames."""
@@ -111,11 +397,23 @@ class Game():
             # Reduce asteroid health and remove bullet
             asteroid.health -= 1
             bullet.kill()
+            if self.particles is not None:
+                self.particles.emit(bullet.rect.center, Constants.HIT_PARTICLES, Constants.HIT_PARTICLE_SPEED,
+                                    Constants.HIT_PARTICLE_LIFE_MS, Constants.HIT_PARTICLE_COLORS, size=2)
 
             # Trigger explosion when health reaches zero
             if asteroid.health == 0:
-                asteroid.should_animate = True
-                asteroid.animation_images = self.getExplosionAnimationImage()
+                max_explosions = self.quality.settings["max_explosions"]
+                if max_explosions is not None and self.registry.countInState(ANIMATING) >= max_explosions:
+                    # Lower quality tiers remove the asteroid without an explosion once enough are playing
+                    asteroid.should_destroy = True
+                else:
+                    asteroid.should_animate = True
+                    asteroid.animation_images = self.getExplosionAnimationImage()
+                if self.particles is not None:
+                    self.particles.emit(asteroid.rect.center, Constants.EXPLOSION_PARTICLES, Constants.EXPLOSION_PARTICLE_SPEED,
+                                        Constants.EXPLOSION_PARTICLE_LIFE_MS, Constants.EXPLOSION_PARTICLE_COLORS, size=4)
+                self.score += Constants.ASTEROID_SCORE
                 playExplosionSound()
 
 
@@ -125,119 +423,173 @@ class Game():
             ship.animation_images = self.getExplosionAnimationImage()
             ship.health -= 1
             playExplosionSound()
+            self.states.change(DYING)
       
 
     def handleCollisions(self):
-        """Handle all collision detection and response in the game."""
-        # Handle bullet-asteroid collisions
+        """Handle all collision detection and response in the game.
+        Asteroids are bucketed into a spatial hash so each bullet and the ship are only
+        tested against the asteroids sharing a grid cell with them. With SWEPT_BULLET_COLLISIONS
+        bullets are tested along the whole path they moved this step, so a bullet moving
+        further than an asteroid is wide cannot pass through it. With MASK_COLLISIONS the
+        sprite rects only select candidates and a hit needs the images' pixels to overlap.
+        """
+        masks = Constants.MASK_COLLISIONS
+        # Masks follow the rotated silhouette, so the whole image rect is the box around it
+        rect_name = "rect" if masks else "collision_rect"
+        self.asteroid_grid.clear()
         for asteroid in self.asteroid_sprites:
-            for bullet in self.player_bullet_sprites:
-                if asteroid.collision_rect.colliderect(bullet.rect):
-                    self.handleAsteroidBulletCollision(asteroid, bullet)
+            self.asteroid_grid.insert(asteroid, getattr(asteroid, rect_name))
 
-        for sprite in self.player_sprites: 
-            if isinstance(sprite, Ship):
-                for asteroid in self.asteroid_sprites:
-                    if sprite.collision_rect.colliderect(asteroid.collision_rect):
-                        self.handleShipAsteroidCollision(sprite)
-                        self.asteroid_sprites.empty()
+        # Handle bullet-asteroid collisions, a bullet is consumed by the first asteroid it hits
+        swept = Constants.SWEPT_BULLET_COLLISIONS
+        for bullet in self.player_bullet_sprites:
+            if swept and bullet.previous_center is not None:
+                path = sweptRect(bullet.rect, bullet.previous_center)
+                candidates = self.asteroid_grid.query(path)
+                accept = None
+                if masks:
+                    accept = lambda asteroid, entry, exit: masksOverlapAlongPath(bullet, asteroid, entry, exit)
+                asteroid = findFirstSweptHit(bullet.rect, bullet.previous_center, candidates, rect_name, path, accept)
+                if asteroid is not None:
+                    self.handleAsteroidBulletCollision(asteroid, bullet)
+                continue
+            for asteroid in self.asteroid_grid.query(bullet.rect):
+                if getattr(asteroid, rect_name).colliderect(bullet.rect) and (not masks or masksOverlap(bullet, asteroid)):
+                    self.handleAsteroidBulletCollision(asteroid, bullet)
+                    break
+
+        if self.player_ship in self.player_sprites:
+            ship_rect = getattr(self.player_ship, rect_name)
+            for asteroid in self.asteroid_grid.query(ship_rect):
+                if ship_rect.colliderect(getattr(asteroid, rect_name)) and (not masks or masksOverlap(self.player_ship, asteroid)):
+                    self.handleShipAsteroidCollision(self.player_ship)
+                    for remaining in self.asteroid_sprites:
+                        remaining.kill()
+                    break
       
 
     def handleAnimations(self): 
-        """Update all sprite animations in the game."""
-        for asteroid in self.asteroid_sprites: 
-            if asteroid.should_animate: 
-                asteroid.animate()
-
-        for sprite in self.player_sprites:
-            if isinstance(sprite, Ship) and sprite.should_animate:
-                sprite.animate()
+        """Update the animations of the sprites that are animating."""
+        for sprite in self.registry.getInState(ANIMATING):
+            sprite.animate(self.simulation_step_ms)
 
     def handleDestruction(self): 
         """Remove sprites that have completed their destruction sequence."""
-        for asteroid in self.asteroid_sprites: 
-            if asteroid.should_destroy: 
-                asteroid.kill()
+        for sprite in self.registry.getInState(DESTROYING):
+            sprite.kill()
 
-        for bullet in self.player_bullet_sprites: 
-            if bullet.should_destroy: 
-                bullet.kill()
-
-        for player_sprite  in self.player_sprites: 
-            if player_sprite.should_destroy: 
-                player_sprite.kill()
+    def handleShipExplosion(self):
+        """Leave the dying state once the ship's explosion is over, flying on if it has
+        health left and ending the game if it was destroyed.
+        """
+        if self.player_ship not in self.player_sprites:
+            self.states.change(GAME_OVER)
+        elif not self.player_ship.should_animate:
+            self.states.change(PLAYING)
 
-    def handleButtonGeneration(self):
-        """Handle game reset logic and reset button management."""
-        # TODO-OPTIONAL: 
-        #   - Re-implement and clean up. 
-        #   - Add code to generate a QuitButton
-        is_player_present = False
-        is_reset_button_present = False
-
-        for sprite in self.player_sprites: 
-            if isinstance(sprite, Ship):
-                is_player_present = True
-            elif isinstance(sprite, ResetButton):
-                is_reset_button_present = True
-
-        if not is_player_present and not is_reset_button_present:
-            self.addPlayerSprite(ResetButton())   
-        elif is_player_present:
-            for sprite in self.player_sprites: 
-                if isinstance(sprite, ResetButton):
-                    sprite.kill()
+    def restartGame(self) -> None:
+        """Start a new round with a new ship after the game was over."""
+        self.player_ship = Ship()
+        self.addPlayerSprite(self.player_ship)
+        self.last_ship_center = None
+        for asteroid in self.asteroid_sprites:
+            asteroid.should_destroy = True
+        self.score = 0
+        self.wave_scheduler.reset()
        
     def handleGameEvents(self):
-        for event in pygame.event.get(): #grabs all the events in the list
+        for event in getEvents(): #grabs all the events in the list
             if event.type == QUIT: #exit button in the window.
                 self.isGameStillRunning = False
 
                 pygame.quit()
                 sys.exit()
+
+            if event.type == pygame.VIDEORESIZE:
+                getViewport().resize((event.w, event.h))
+                self.renderer.requestFullRedraw()
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggleOverlay()
+                self.renderer.requestFullRedraw()
+
+            if event.type == pygame.KEYDOWN and event.key in Constants.PAUSE_KEYS:
+                self.states.togglePause()
             
             if event.type == pygame.MOUSEBUTTONDOWN: # tell pygame to track our "mouse-events" aka if a button was clicked. 
 
-                if pygame.mouse.get_pressed()[0] and self.player_ship in self.player_sprites and self.player_ship.should_animate == False: # checks to see if the left button was clicked and making sure that the mouse is at an appropriate distance. 
+                if getMousePressed()[0] and self.states.current.name == PLAYING and self.player_ship.should_animate == False: # checks to see if the left button was clicked and making sure that the mouse is at an appropriate distance. 
                     addBullet(self, self.player_ship.rect.center, self.player_ship.angle + Constants.SHIP_ANGLE_OFFSET)
 
-                if pygame.mouse.get_pressed()[0]:
-                    for sprite in self.player_sprites: 
-                        if isinstance(sprite, ResetButton):
-                            if sprite.clicked():
-                                self.player_ship = Ship()
-                                self.addPlayerSprite(self.player_ship)
-                                for asteroid in self.asteroid_sprites:
-                                    asteroid.should_destroy = True 
-
-                        # TODO-OPTIONAL: 
-                        #    - Trigger a "quit" if the QuitButton has been "clicked" similarly to how ResetButton was "clicked"
-                        #    - Trigger a sound when buttons are clicked
+                if getMousePressed()[0]:
+                    for button in self.registry.getInState(CLICKABLE):
+                        if button.clicked():
+                            self.handleButtonClick(button)
+                            break
+
+    def handleButtonClick(self, button) -> None:
+        """Respond to a clicked button."""
+        if isinstance(button, ResetButton):
+            self.states.change(PLAYING)
+        elif isinstance(button, QuitButton):
+            self.isGameStillRunning = False
+
+        # TODO-OPTIONAL: 
+        #    - Trigger a sound when buttons are clicked
                   
     def handleSpriteMotion(self): 
+        """Advance every sprite by one simulation step."""
+        if Constants.INTERPOLATE_RENDERING:
+            # Remember where sprites were so rendering can draw them between steps
+            for group in (self.player_sprites, self.player_bullet_sprites, self.asteroid_sprites):
+                for sprite in group:
+                    sprite.previous_center = sprite.rect.center
+        elif Constants.SWEPT_BULLET_COLLISIONS:
+            # Swept collisions test bullets along the path they move this step
+            for bullet in self.player_bullet_sprites:
+                bullet.previous_center = bullet.rect.center
+
         for player_sprite in self.player_sprites: 
-            player_sprite.move()
+            player_sprite.move(self.time_scale)
+
+        if self.entity_store is not None:
+            self.entity_store.step(getWorldSize(), self.time_scale)
+            self.entity_store.syncSprites()
+            return
         
         for bullet in self.player_bullet_sprites:
-            bullet.move()
+            bullet.move(self.time_scale)
 
         for asteroid in self.asteroid_sprites: 
             if not asteroid.should_animate: 
-                asteroid.move()
+                asteroid.move(self.time_scale)
+
+    def handleCamera(self):
+        """Keep the ship in the middle of the window when the world is larger than it."""
+        if Constants.CAMERA_FOLLOWS_SHIP and self.player_ship in self.player_sprites:
+            getViewport().centerOn(self.player_ship.rect.center)
+
+    def handleParticles(self):
+        """Emit thrust behind the ship while it moves and advance every particle by one step."""
+        if self.particles is None:
+            return
+        ship = self.player_ship
+        center = ship.rect.center
+        if ship in self.player_sprites and not ship.should_animate and self.last_ship_center is not None:
+            dx, dy = self.last_ship_center[0] - center[0], self.last_ship_center[1] - center[1]
+            if dx or dy:
+                # Thrust leaves the back of the ship, opposite to the way it moved
+                direction = math.atan2(dy, dx)
+                radius = ship.collision_rect.width / 2
+                nozzle = (center[0] + math.cos(direction) * radius, center[1] + math.sin(direction) * radius)
+                self.particles.emit(nozzle, Constants.THRUST_PARTICLES, Constants.THRUST_PARTICLE_SPEED,
+                                    Constants.THRUST_PARTICLE_LIFE_MS, Constants.THRUST_PARTICLE_COLORS,
+                                    direction=direction, spread=Constants.THRUST_PARTICLE_SPREAD)
+        self.last_ship_center = center
+        self.particles.update(self.simulation_step_ms, self.time_scale)
 
     def handleEnemyAndObstacleGeneration(self): 
-        generateAsteroids(self, self.player_ship)
+        """Spawn the asteroids the current wave has due this step."""
+        self.wave_scheduler.update(self, self.simulation_step_ms)
 
-
-def initiateGameScreen():
-    """
-    Initialize and return the game screen.
-    
-    Returns:
-        pygame.Surface: The initialized game screen
-    """
-    pygame.init()
-    screen = pygame.display.set_mode(Constants.SCREEN_SIZE, pygame.RESIZABLE)
-    pygame.display.set_caption('GalagaRemix')
-    return screen
-       
\ No newline at end of file
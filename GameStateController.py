@@ -0,0 +1,193 @@
+"""
+Game State Controller Module
+Runs the game as a state machine of playing, dying, game-over and paused
+states. Each state picks the game phases that apply to it, so e.g. no
+asteroids spawn and no collisions are checked on the game-over screen, and has
+enter and exit hooks that react to transitions once instead of the game
+scanning its sprites every frame.
+"""
+
+import pygame
+import Constants
+from ButtonController import ResetButton, QuitButton
+
+PLAYING = "playing"
+DYING = "dying"
+GAME_OVER = "game_over"
+PAUSED = "paused"
+
+class GameState():
+    """
+    A state of the game: the phases it runs and what happens when it is entered or left.
+    Phases are named after the game's phases, so the game keeps a single list of each kind
+    and the profiler keeps timing them under the same names.
+
+    Attributes:
+        game (Game): The game the state belongs to
+        input_phases (List[tuple]): (name, method) pairs run once at the start of every frame
+        simulation_phases (List[tuple]): (name, method) pairs run once per fixed simulation step,
+            a state without any freezes the simulation clock
+        render_phases (List[tuple]): (name, method) pairs run once at the end of every frame
+    """
+
+    name = None
+    input_phase_names = ("handleGameEvents",)
+    simulation_phase_names = ()
+    render_phase_names = ("updateSprites",)
+    # Frame rate cap while in the state, None keeps the game's own
+    idle_frame_rate = None
+    # Whether the pause key pauses the game in this state
+    pausable = False
+
+    def __init__(self, game):
+        """Pick the state's phases out of the game's phase lists."""
+        self.game = game
+        self.input_phases = self.selectPhases(game.input_phases, self.input_phase_names)
+        self.simulation_phases = self.selectPhases(game.simulation_phases, self.simulation_phase_names)
+        self.render_phases = self.selectPhases(game.render_phases, self.render_phase_names)
+
+    @staticmethod
+    def selectPhases(phases: list, names: tuple) -> list:
+        """Return the phases whose name is listed, in the game's order."""
+        return [(name, phase) for name, phase in phases if name in names]
+
+    def enter(self, previous: "GameState") -> None:
+        """Called when the game switches to this state, previous is None for the first state."""
+        pass
+
+    def exit(self, next_state: "GameState") -> None:
+        """Called when the game switches away from this state."""
+        pass
+
+    def drawOverlay(self, screen: pygame.Surface):
+        """Draw on top of the sprites, returning the rect drawn or None."""
+        return None
+
+class PlayingState(GameState):
+    """The ship is flying, every phase runs."""
+
+    name = PLAYING
+    simulation_phase_names = (
+        "handleEnemyAndObstacleGeneration", "handleSpriteMotion", "handleCamera",
+        "handleCollisions", "handleAnimations", "handleDestruction", "handleParticles",
+    )
+    pausable = True
+
+    def enter(self, previous: GameState) -> None:
+        if previous is not None and previous.name == GAME_OVER:
+            self.game.restartGame()
+
+class DyingState(PlayingState):
+    """The ship was hit and is exploding, afterwards it either flies on or the game is over."""
+
+    name = DYING
+    simulation_phase_names = PlayingState.simulation_phase_names + ("handleShipExplosion",)
+
+    def enter(self, previous: GameState) -> None:
+        pass
+
+class GameOverState(GameState):
+    """The ship was destroyed. Remaining sprites finish moving and exploding while the
+    reset and quit buttons wait for a click.
+    """
+
+    name = GAME_OVER
+    simulation_phase_names = ("handleSpriteMotion", "handleAnimations", "handleDestruction", "handleParticles")
+
+    def enter(self, previous: GameState) -> None:
+        self.game.addPlayerSprites([ResetButton(), QuitButton()])
+
+    def exit(self, next_state: GameState) -> None:
+        registry = self.game.registry
+        for button in registry.getByType(ResetButton) + registry.getByType(QuitButton):
+            button.kill()
+
+class PausedState(GameState):
+    """The game is paused. Nothing is simulated and the paused screen is only redrawn when
+    needed, e.g. after a resize, while the game ticks at PAUSED_FRAME_RATE.
+    """
+
+    name = PAUSED
+    render_phase_names = ("renderPaused",)
+    idle_frame_rate = Constants.PAUSED_FRAME_RATE
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.render_phases = [("renderPaused", self.renderPaused)]
+        self.font = None
+
+    def enter(self, previous: GameState) -> None:
+        self.game.renderer.requestFullRedraw()
+
+    def exit(self, next_state: GameState) -> None:
+        # Paused time is not simulated when the game resumes
+        self.game.discard_frame_time = True
+        self.game.renderer.requestFullRedraw()
+
+    def renderPaused(self) -> None:
+        """Draw the paused screen once, and again whenever a full redraw is requested."""
+        if self.game.renderer.full_redraw_requested:
+            self.game.updateSprites()
+
+    def drawOverlay(self, screen: pygame.Surface):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 96)
+        text = self.font.render("PAUSED", True, (0, 0, 0))
+        return screen.blit(text, text.get_rect(center=screen.get_rect().center))
+
+class GameStateMachine():
+    """
+    Holds the game's states and switches between them, calling their exit and enter hooks.
+
+    Attributes:
+        states (dict): State name -> GameState
+        current (GameState): The state the game is in, None until the game has started
+        paused_state (GameState): State to resume when the game is unpaused
+        transitions (int): Number of state changes so far
+    """
+
+    def __init__(self, game):
+        """Create every state of the game. The machine is in none of them until the game
+        changes to its first state, the loading screen runs before the game is created.
+        """
+        self.states = {state.name: state for state in (
+            PlayingState(game), DyingState(game), GameOverState(game), PausedState(game)
+        )}
+        self.current = None
+        self.paused_state = None
+        self.transitions = 0
+
+    def change(self, name: str) -> None:
+        """Switch to the named state, does nothing when already in it."""
+        next_state = self.states[name]
+        if next_state is self.current:
+            return
+        previous = self.current
+        if previous is not None:
+            previous.exit(next_state)
+        self.current = next_state
+        self.transitions += 1
+        next_state.enter(previous)
+
+    def togglePause(self) -> None:
+        """Pause the game if its state allows it, or resume the state it was paused in."""
+        if self.current.name == PAUSED:
+            self.change(self.paused_state.name)
+        elif self.current.pausable:
+            self.paused_state = self.current
+            self.change(PAUSED)
+
+    def restore(self, name: str, paused_name: str = None) -> None:
+        """Put the machine into a state without running any hooks, e.g. when restoring a snapshot
+        whose sprites already reflect the state.
+        """
+        self.current = self.states[name]
+        self.paused_state = self.states[paused_name] if paused_name else None
+
+    def drawOverlay(self, screen: pygame.Surface):
+        """Draw the current state's overlay."""
+        return self.current.drawOverlay(screen)
+
+    def getStats(self) -> dict:
+        """Return the number of state changes so far."""
+        return {"transitions": self.transitions}
@@ -0,0 +1,131 @@
+"""
+Input Controller Module
+Provides the input source that every controller reads the mouse, keyboard and
+events from. The live source forwards to pygame, while a scripted source plays
+back a stream of frames or asks a policy, so the game can run without a player.
+"""
+
+import pygame
+from typing import Callable, List
+
+class PressedKeys(frozenset):
+    """Set of pressed keys that can be indexed like pygame.key.get_pressed()."""
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self
+
+class LiveInput():
+    """Reads input directly from pygame."""
+
+    def nextFrame(self, game) -> None:
+        """Advance to the next frame, live input has nothing to prepare."""
+        pass
+
+    def getEvents(self) -> list:
+        return pygame.event.get()
+
+    def getMousePos(self) -> tuple:
+        return pygame.mouse.get_pos()
+
+    def getMousePressed(self) -> tuple:
+        return pygame.mouse.get_pressed()
+
+    def getKeysPressed(self):
+        return pygame.key.get_pressed()
+
+class ScriptedInput():
+    """
+    Feeds input from a list of frames or from a policy called once per frame.
+
+    A frame is a dict with any of the keys:
+        mouse_pos (tuple): (x, y) position of the mouse
+        buttons (tuple): pressed state of the (left, middle, right) buttons
+        keys (iterable): pygame key constants held down
+        clicks (iterable): mouse buttons pressed down during the frame, e.g. (1,)
+        key_presses (iterable): pygame key constants pressed down during the frame
+    Missing keys keep the value of the previous frame, except clicks and key presses.
+    """
+
+    def __init__(self, frames: List[dict] = None, policy: Callable = None):
+        """Initialize the scripted input.
+        Args:
+            frames (List[dict]): frames to play back, the last frame repeats once exhausted
+            policy (Callable): called as policy(frame_index, game) and returning a frame dict
+        """
+        self.frames = frames or []
+        self.policy = policy
+        self.frame_index = -1
+        self.mouse_pos = (0, 0)
+        self.buttons = (False, False, False)
+        self.keys = PressedKeys()
+        self.clicks = ()
+        self.key_presses = ()
+
+    def nextFrame(self, game) -> None:
+        """Advance to the next scripted frame.
+        Args:
+            game (Game): the game being driven, passed on to the policy
+        """
+        self.frame_index += 1
+        if self.policy is not None:
+            frame = self.policy(self.frame_index, game)
+        elif self.frame_index < len(self.frames):
+            frame = self.frames[self.frame_index]
+        else:
+            frame = {}
+
+        self.mouse_pos = tuple(frame.get("mouse_pos", self.mouse_pos))
+        self.keys = PressedKeys(frame.get("keys", self.keys))
+        self.clicks = tuple(frame.get("clicks", ()))
+        self.key_presses = tuple(frame.get("key_presses", ()))
+        buttons = frame.get("buttons", self.buttons)
+        # A click implies the button is held during the frame it happened
+        self.buttons = tuple(bool(buttons[i]) or (i + 1) in self.clicks for i in range(3))
+
+    def getEvents(self) -> list:
+        # Drain the real queue so QUIT and window events are still delivered
+        events = pygame.event.get()
+        for button in self.clicks:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=self.mouse_pos))
+        for key in self.key_presses:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+        return events
+
+    def getMousePos(self) -> tuple:
+        return self.mouse_pos
+
+    def getMousePressed(self) -> tuple:
+        return self.buttons
+
+    def getKeysPressed(self) -> PressedKeys:
+        return self.keys
+
+input_source = LiveInput()
+
+def setInputSource(source) -> None:
+    """Replace the input source every controller reads from.
+    Args:
+        source: a LiveInput, ScriptedInput or any object with the same methods
+    """
+    global input_source
+    input_source = source
+
+def getInputSource():
+    """Return the current input source."""
+    return input_source
+
+def getEvents() -> list:
+    """Return the events of the current frame."""
+    return input_source.getEvents()
+
+def getMousePos() -> tuple:
+    """Return the (x, y) position of the mouse."""
+    return input_source.getMousePos()
+
+def getMousePressed() -> tuple:
+    """Return the pressed state of the (left, middle, right) mouse buttons."""
+    return input_source.getMousePressed()
+
+def getKeysPressed():
+    """Return the pressed state of the keyboard, indexable by pygame key constants."""
+    return input_source.getKeysPressed()
@@ -0,0 +1,170 @@
+"""
+Loading Controller Module
+Opens the window first and then runs the slow startup steps, importing the game
+modules, decoding images, slicing the explosion sheet, initializing audio and
+decoding sounds, concurrently on a thread pool while a loading screen shows
+their progress. Time to the first loading frame and the first game frame is
+measured from process start.
+"""
+
+import os
+import sys
+import importlib
+import pygame
+import Constants
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+from AssetController import loadImage, prerenderRotations
+from AnimationController import obtainSpriteAnimationImages, warmAnimationFrames, getCommonAnimationSizes
+from SoundController import initializeAudio, loadSounds
+from ViewportController import getViewport
+
+def initiateGameScreen(headless: bool = False):
+    """
+    Initialize and return the game screen.
+    The mixer is left alone, it is initialized by the loader so that a blocked audio
+    device cannot hold up the window.
+
+    Args:
+        headless (bool): use SDL's dummy video and audio drivers so no window or
+            audio device is needed. Must be requested before pygame is initialized.
+
+    Returns:
+        pygame.Surface: The initialized game screen
+    """
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode(Constants.SCREEN_SIZE, pygame.RESIZABLE)
+    pygame.display.set_caption('GalagaRemix')
+    getViewport().resize(screen.get_size())
+    return screen
+
+def loadExplosionAnimationImages() -> list:
+    """Slice the explosion sheet and prepare its frames at the common sizes."""
+    explosion_animation_images = obtainSpriteAnimationImages(Constants.EXPLOSION_IMAGE_FILE)
+    if Constants.WARM_ANIMATION_FRAMES:
+        warmAnimationFrames(explosion_animation_images, getCommonAnimationSizes())
+    return explosion_animation_images
+
+def preloadImages() -> None:
+    """Decode every image that is only ever used at a single size into the image cache.
+    With mask collisions on, the ship and bullet rotations are rendered along with their masks.
+    """
+    ship_image = loadImage(Constants.SHIP_IMAGE_FILE, Constants.SHIP_DIMMENSION)
+    bullet_image = loadImage(Constants.BULLET_IMAGE_FILE, Constants.BULLET_DIMMENSIONS)
+    loadImage(Constants.CROSSHAIR_IMAGE_FILE, Constants.CROSSHAIR_DIMMENSIONS)
+    loadImage(Constants.RESET_BUTTON_IMAGE, Constants.RESET_BUTTON_DIMMENSION)
+    if Constants.MASK_COLLISIONS:
+        # Games start on the first quality tier, so its step is the one sprites rotate by
+        angle_step = Constants.QUALITY_TIERS[0]["rotation_angle_step"]
+        prerenderRotations(ship_image, angle_step)
+        prerenderRotations(bullet_image, angle_step)
+
+def loadAudio() -> bool:
+    """Initialize the mixer and decode the sounds, returning False when running silently."""
+    return initializeAudio() and loadSounds()
+
+class Loader():
+    """
+    Runs named startup tasks concurrently on a thread pool.
+
+    Attributes:
+        tasks (Dict[str, Callable]): Task name -> function to run
+        futures (dict): Task name -> future of the running task
+        timings (dict): Task name -> milliseconds the task took
+    """
+
+    def __init__(self, tasks: Dict[str, Callable], max_workers: int = Constants.LOADING_THREADS):
+        """Initialize a loader that has not started yet."""
+        self.tasks = tasks
+        self.max_workers = max_workers
+        self.futures = {}
+        self.timings = {}
+        self.executor = None
+
+    def start(self) -> None:
+        """Submit every task to the thread pool."""
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="loader")
+        for name, task in self.tasks.items():
+            self.futures[name] = self.executor.submit(self.runTask, name, task)
+        # Worker threads exit once the queued tasks are done
+        self.executor.shutdown(wait=False)
+
+    def runTask(self, name: str, task: Callable):
+        """Run a task and record how long it took."""
+        start = perf_counter()
+        try:
+            return task()
+        finally:
+            self.timings[name] = (perf_counter() - start) * 1000
+
+    def getProgress(self) -> float:
+        """Return the fraction of tasks that have finished."""
+        if not self.futures:
+            return 0.0
+        return sum(future.done() for future in self.futures.values()) / len(self.futures)
+
+    def isDone(self) -> bool:
+        """Return True once every task has finished."""
+        return all(future.done() for future in self.futures.values())
+
+    def getResult(self, name: str):
+        """Wait for a task and return its result, re-raising any error it raised."""
+        return self.futures[name].result()
+
+def createGameLoader() -> Loader:
+    """Return a loader for everything the game needs before its first frame."""
+    return Loader({
+        "modules": lambda: importlib.import_module("GameController"),
+        "explosion_animation_images": loadExplosionAnimationImages,
+        "images": preloadImages,
+        "audio": loadAudio,
+    })
+
+def drawLoadingScreen(screen: pygame.Surface, progress: float, font: pygame.font.Font) -> None:
+    """Draw a progress bar with a caption in the middle of the screen and present it."""
+    screen_width, screen_height = screen.get_size()
+    bar = pygame.Rect(0, 0, screen_width // 3, 24)
+    bar.center = (screen_width // 2, screen_height // 2)
+
+    screen.fill(Constants.SCREEN_COLOR)
+    caption = font.render(f"Loading... {round(progress * 100)}%", True, (0, 0, 0))
+    screen.blit(caption, caption.get_rect(midbottom=(bar.centerx, bar.top - 10)))
+    pygame.draw.rect(screen, (0, 0, 0), bar, 2)
+    filled = bar.inflate(-8, -8)
+    filled.width = round(filled.width * progress)
+    pygame.draw.rect(screen, (0, 0, 0), filled)
+    pygame.display.flip()
+
+def runLoadingScreen(screen: pygame.Surface, loader: Loader, startup_times: dict, process_start: float) -> None:
+    """Start the loader and draw the loading screen until every task is done.
+    Args:
+        screen (pygame.Surface): surface to draw the loading screen on
+        loader (Loader): loader to start and wait for
+        startup_times (dict): filled with time_to_loading_frame_ms and loading_ms
+        process_start (float): perf_counter value when the process started
+    """
+    loader.start()
+    # The default font ships with pygame, unlike SysFont it needs no font lookup
+    font = pygame.font.Font(None, 36)
+    clock = pygame.time.Clock()
+    loading_start = perf_counter()
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        done = loader.isDone()
+        drawLoadingScreen(screen, loader.getProgress(), font)
+        if "time_to_loading_frame_ms" not in startup_times:
+            startup_times["time_to_loading_frame_ms"] = (perf_counter() - process_start) * 1000
+        if done:
+            break
+        clock.tick(Constants.LOADING_SCREEN_FRAME_RATE)
+    startup_times["loading_ms"] = (perf_counter() - loading_start) * 1000
+    for name, elapsed in loader.timings.items():
+        startup_times[f"{name}_ms"] = elapsed
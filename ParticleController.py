@@ -0,0 +1,230 @@
+"""
+Particle Controller Module
+Particle effects kept in NumPy arrays instead of one sprite per particle:
+debris of destroyed asteroids, sparks of bullet hits, the ship's thrust and a
+background starfield. A ParticleSystem advances every particle with a few
+vectorized operations per simulation step and hands the renderer a single
+batched blit sequence of small cached squares, fading each particle towards the
+background colour over its lifetime.
+Particles are purely visual and draw from their own random generator, so they
+never change how the game plays out.
+Requires numpy; isAvailable() reports whether it can be used.
+"""
+
+import math
+import pygame
+import Constants
+from QualityController import DEFAULT_QUALITY_SETTINGS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Particle images keyed by (packed 0xRRGGBB colour, size), shared by every system
+_particle_images = {}
+
+def isAvailable() -> bool:
+    """Return True if numpy is installed and particle systems can be created."""
+    return numpy is not None
+
+def getParticleImage(color_key: int, size: int) -> pygame.Surface:
+    """Return the cached square image of a particle.
+    Args:
+        color_key (int): colour packed as 0xRRGGBB
+        size (int): side length in pixels
+    Returns:
+        pygame.Surface: the particle image
+    """
+    key = (color_key, size)
+    image = _particle_images.get(key)
+    if image is None:
+        image = pygame.Surface((size, size))
+        image.fill(((color_key >> 16) & 255, (color_key >> 8) & 255, color_key & 255))
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        _particle_images[key] = image
+    return image
+
+def packColors(colors) -> "numpy.ndarray":
+    """Pack an (n, 3) array of RGB colours into 0xRRGGBB integers."""
+    colors = colors.astype(numpy.int64)
+    return (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+
+class ParticleSystem():
+    """
+    Short-lived particles stored as a structure of arrays.
+
+    Live particles occupy the first count slots of every array; dead ones are
+    compacted away once per update, so emitting and updating never loop in Python.
+
+    Attributes:
+        capacity (int): Maximum number of live particles, emissions beyond it are dropped
+        count (int): Number of live particles
+        drag (float): Fraction of its velocity a particle keeps per BASE_TICK_RATE tick
+        random (numpy.random.Generator): Randomness of the emitted particles
+        stats (dict): Counters of emitted and dropped particles
+        quality_settings (dict): Quality tier settings of the game, providing the particle density
+    """
+
+    FIELDS = ("x", "y", "velocity_x", "velocity_y", "life", "max_life")
+
+    def __init__(self, capacity: int = Constants.PARTICLE_CAPACITY, seed: int = None, drag: float = Constants.PARTICLE_DRAG,
+                 quality_settings: dict = DEFAULT_QUALITY_SETTINGS):
+        """Allocate arrays for the given number of particles.
+        Args:
+            capacity (int): maximum number of live particles
+            seed (int): seed of the particles' randomness, None seeds it from the system
+            drag (float): fraction of its velocity a particle keeps per BASE_TICK_RATE tick
+            quality_settings (dict): quality tier settings of the game, thinning out emissions
+        """
+        self.quality_settings = quality_settings
+        self.capacity = capacity
+        self.count = 0
+        self.drag = drag
+        self.random = numpy.random.default_rng(seed)
+        self.stats = {"emitted": 0, "dropped": 0}
+        for field in self.FIELDS:
+            setattr(self, field, numpy.zeros(capacity, dtype=numpy.float64))
+        self.color = numpy.zeros((capacity, 3), dtype=numpy.uint8)
+        self.size = numpy.zeros(capacity, dtype=numpy.int64)
+
+    def emit(self, center: tuple, amount: int, speed: tuple, life_ms: tuple, colors: tuple,
+             size: int = 3, direction: float = 0.0, spread: float = 2 * math.pi) -> None:
+        """Add a burst of particles, thinned out by the quality tier's particle density.
+        Args:
+            center (tuple): world point the particles start at
+            amount (int): number of particles at full quality
+            speed (tuple): (min, max) pixels per BASE_TICK_RATE tick
+            life_ms (tuple): (min, max) lifetime in milliseconds
+            colors (tuple): RGB colours picked from at random
+            size (int): side length of the particles in pixels
+            direction (float): angle in radians the burst is centered on
+            spread (float): angle in radians the particles are scattered over
+        """
+        amount = int(amount * self.quality_settings["particle_density"])
+        free = self.capacity - self.count
+        if amount > free:
+            self.stats["dropped"] += amount - free
+            amount = free
+        if amount <= 0:
+            return
+        random = self.random
+        angles = direction + random.uniform(-spread / 2, spread / 2, amount)
+        speeds = random.uniform(speed[0], speed[1], amount)
+        lives = random.uniform(life_ms[0], life_ms[1], amount)
+        start, end = self.count, self.count + amount
+        self.x[start:end] = center[0] - size // 2
+        self.y[start:end] = center[1] - size // 2
+        self.velocity_x[start:end] = numpy.cos(angles) * speeds
+        self.velocity_y[start:end] = numpy.sin(angles) * speeds
+        self.life[start:end] = lives
+        self.max_life[start:end] = lives
+        self.color[start:end] = numpy.asarray(colors, dtype=numpy.uint8)[random.integers(len(colors), size=amount)]
+        self.size[start:end] = size
+        self.count = end
+        self.stats["emitted"] += amount
+
+    def update(self, elapsed_ms: float, time_scale: float = 1.0) -> None:
+        """Advance every particle by one simulation step and drop the expired ones.
+        Args:
+            elapsed_ms (float): simulation time the step covers
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
+        """
+        count = self.count
+        if not count:
+            return
+        self.x[:count] += self.velocity_x[:count] * time_scale
+        self.y[:count] += self.velocity_y[:count] * time_scale
+        drag = self.drag ** time_scale
+        self.velocity_x[:count] *= drag
+        self.velocity_y[:count] *= drag
+        self.life[:count] -= elapsed_ms
+
+        alive = self.life[:count] > 0
+        alive_count = int(alive.sum())
+        if alive_count == count:
+            return
+        for name in self.FIELDS + ("color", "size"):
+            array = getattr(self, name)
+            array[:alive_count] = array[:count][alive]
+        self.count = alive_count
+
+    def clear(self) -> None:
+        """Remove every particle, e.g. when the game jumps to a snapshot."""
+        self.count = 0
+
+    def getBlitSequence(self, viewport) -> list:
+        """Build the blit sequence of the particles inside the viewport, in screen coordinates.
+        Particles fade towards SCREEN_COLOR in PARTICLE_FADE_STEPS steps so only a few
+        images per colour are ever created.
+        Returns:
+            list: (image, rect) pairs
+        """
+        count = self.count
+        if not count:
+            return []
+        offset_x, offset_y = viewport.getOffset()
+        screen_width, screen_height = viewport.size
+        x = self.x[:count].astype(numpy.int64) - offset_x
+        y = self.y[:count].astype(numpy.int64) - offset_y
+        size = self.size[:count]
+        visible = (x > -size) & (x < screen_width) & (y > -size) & (y < screen_height)
+        if not visible.any():
+            return []
+        x, y, size = x[visible], y[visible], size[visible]
+
+        steps = Constants.PARTICLE_FADE_STEPS
+        age = 1 - self.life[:count][visible] / self.max_life[:count][visible]
+        fade = (numpy.minimum((age * steps).astype(numpy.int64), steps - 1) / steps)[:, None]
+        colors = self.color[:count][visible] * (1 - fade) + numpy.asarray(Constants.SCREEN_COLOR) * fade
+        color_keys = packColors(colors)
+
+        Rect = pygame.Rect
+        return [(getParticleImage(color_key, side), Rect(left, top, side, side))
+                for color_key, side, left, top in zip(color_keys.tolist(), size.tolist(), x.tolist(), y.tolist())]
+
+    def getStats(self) -> dict:
+        """Return the number of live particles and the emitted and dropped counters."""
+        return dict(self.stats, live=self.count, images=len(_particle_images))
+
+class Starfield():
+    """
+    Static stars behind every sprite. Stars are placed at fractions of the world size,
+    so they cover the world whatever its size, and the blit sequence is only rebuilt
+    when the world size or the camera changes.
+
+    Attributes:
+        positions (numpy.ndarray): (n, 2) star positions as fractions of the world size
+        color_keys (list): Packed colour of every star
+        sizes (list): Side length of every star in pixels
+    """
+
+    def __init__(self, stars: int = Constants.STARFIELD_STARS, seed: int = None):
+        """Scatter the stars.
+        Args:
+            stars (int): number of stars
+            seed (int): seed of the star positions, None seeds them from the system
+        """
+        random = numpy.random.default_rng(seed)
+        self.positions = random.random((stars, 2))
+        colors = numpy.asarray(Constants.STAR_COLORS, dtype=numpy.uint8)[random.integers(len(Constants.STAR_COLORS), size=stars)]
+        self.color_keys = packColors(colors).tolist()
+        self.sizes = random.integers(Constants.STAR_SIZES[0], Constants.STAR_SIZES[1] + 1, size=stars).tolist()
+        self.cache_key = None
+        self.blit_sequence = []
+
+    def getBlitSequence(self, viewport) -> list:
+        """Return the blit sequence of the stars inside the viewport, in screen coordinates."""
+        cache_key = (viewport.world_size, viewport.getOffset(), viewport.size)
+        if cache_key == self.cache_key:
+            return self.blit_sequence
+        self.cache_key = cache_key
+        offset_x, offset_y = viewport.getOffset()
+        screen_width, screen_height = viewport.size
+        points = (self.positions * viewport.world_size).astype(numpy.int64) - (offset_x, offset_y)
+        visible = ((points[:, 0] >= 0) & (points[:, 0] < screen_width) & (points[:, 1] >= 0) & (points[:, 1] < screen_height)).tolist()
+        self.blit_sequence = [(getParticleImage(color_key, side), pygame.Rect(left, top, side, side))
+                              for (left, top), color_key, side, shown in zip(points.tolist(), self.color_keys, self.sizes, visible)
+                              if shown]
+        return self.blit_sequence
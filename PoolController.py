@@ -0,0 +1,82 @@
+"""
+Pool Controller Module
+Provides bounded free lists of sprites so that dead bullets and asteroids are
+reinitialized in place instead of being reallocated for every shot and wave.
+"""
+
+from typing import Callable
+
+class SpritePool():
+    """
+    Bounded free list of sprites of a single type.
+
+    Pooled sprites must implement reset(*args), taking the same arguments as their
+    constructor, and are returned to the pool by Sprite.kill.
+
+    Attributes:
+        factory (Callable): Creates a new sprite when the free list is empty
+        capacity (int): Maximum number of dead sprites kept for reuse
+        free (list): Dead sprites waiting to be reused
+        hits (int): Acquisitions served from the free list
+        misses (int): Acquisitions that had to create a new sprite
+        discards (int): Released sprites dropped because the free list was full
+        in_use (int): Sprites handed out and not yet released
+        high_water_mark (int): Largest number of sprites in use at once
+    """
+
+    def __init__(self, factory: Callable, capacity: int):
+        """Initialize an empty pool.
+        Args:
+            factory (Callable): creates a new sprite from the acquire arguments
+            capacity (int): maximum number of dead sprites kept for reuse
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.discards = 0
+        self.in_use = 0
+        self.high_water_mark = 0
+
+    def acquire(self, *args):
+        """Return a sprite initialized with the given arguments, reusing a dead one if possible."""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.factory(*args)
+            sprite.pool = self
+            self.misses += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water_mark:
+            self.high_water_mark = self.in_use
+        return sprite
+
+    def adopt(self, sprite) -> None:
+        """Count a copy of a pooled sprite, e.g. one restored from a snapshot, as handed out."""
+        sprite.pool = self
+        self.in_use += 1
+        if self.in_use > self.high_water_mark:
+            self.high_water_mark = self.in_use
+
+    def release(self, sprite) -> None:
+        """Take back a dead sprite, keeping it for reuse unless the free list is full."""
+        self.in_use -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(sprite)
+        else:
+            self.discards += 1
+
+    def getStats(self) -> dict:
+        """Return the pool counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "discards": self.discards,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water_mark": self.high_water_mark,
+        }
@@ -0,0 +1,193 @@
+"""
+Profiler Controller Module
+Times every phase of a frame with perf_counter_ns, keeps a rolling window of
+frame and phase times and entity counts, draws them in a toggleable overlay and
+optionally streams one row per frame to a CSV or JSONL file.
+"""
+
+import csv
+import json
+import pygame
+import Constants
+from time import perf_counter_ns
+from collections import deque
+from typing import Callable, List
+
+def percentile(ordered_samples: list, fraction: float) -> float:
+    """Return the sample at the given fraction of an already sorted list."""
+    if not ordered_samples:
+        return 0.0
+    return ordered_samples[min(len(ordered_samples) - 1, int(len(ordered_samples) * fraction))]
+
+class FrameProfiler():
+    """
+    Collects per-phase frame timings. Does nothing unless enabled, so the game loop
+    only pays for a single attribute check per frame when profiling is off.
+
+    Attributes:
+        enabled (bool): Whether frames are being timed
+        overlay_visible (bool): Whether the statistics overlay is drawn
+        frame_index (int): Number of frames recorded so far
+        frame_times (deque): Rolling window of frame times in nanoseconds
+        phase_times (dict): Phase name -> rolling window of phase times in nanoseconds
+        entity_counts (dict): Group name -> entity count of the last recorded frame
+    """
+
+    def __init__(self, window: int = Constants.PROFILER_WINDOW):
+        """Initialize a disabled profiler.
+        Args:
+            window (int): number of frames kept for the percentile statistics
+        """
+        self.enabled = Constants.PROFILER_ENABLED
+        self.overlay_visible = False
+        self.window = window
+        self.frame_index = 0
+        self.frame_times = deque(maxlen=window)
+        self.phase_times = {}
+        self.entity_counts = {}
+        self.counter_sources = {}
+        self.output_file = None
+        self.csv_writer = None
+        self.overlay_surface = None
+        self.overlay_font = None
+
+    def addCounterSource(self, name: str, source: Callable[[], dict]) -> None:
+        """Register a function whose counters are included in summaries and exported rows.
+        Args:
+            name (str): prefix for the counters, e.g. "bullet_pool"
+            source (Callable): returns a dict of counter name -> number
+        """
+        self.counter_sources[name] = source
+
+    def toggleOverlay(self) -> None:
+        """Show or hide the overlay, profiling is enabled while it is visible."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        self.overlay_surface = None
+
+    def startRecording(self, path: str) -> None:
+        """Stream one row per frame to a file, CSV if the path ends in .csv and JSONL otherwise.
+        Args:
+            path (str): file to write
+        """
+        self.stopRecording()
+        self.enabled = True
+        self.output_file = open(path, "w", newline="")
+        self.csv_writer = None
+
+    def stopRecording(self) -> None:
+        """Stop streaming rows and close the output file."""
+        if self.output_file is not None:
+            self.output_file.close()
+        self.output_file = None
+        self.csv_writer = None
+
+    def runPhases(self, phases: List[tuple], timings: dict = None) -> dict:
+        """Run the given phases, timing each one.
+        Args:
+            phases (List[tuple]): (name, function) pairs in execution order
+            timings (dict): timings to add to, so phases run several times per frame accumulate
+        Returns:
+            dict: phase name -> elapsed nanoseconds
+        """
+        if timings is None:
+            timings = {}
+        for name, phase in phases:
+            start = perf_counter_ns()
+            phase()
+            timings[name] = timings.get(name, 0) + perf_counter_ns() - start
+        return timings
+
+    def recordFrame(self, frame_ns: int, phase_ns: dict, dt_ms: int, entity_counts: dict) -> None:
+        """Add a frame to the rolling window and stream it to the output file.
+        Args:
+            frame_ns (int): time the whole frame took
+            phase_ns (dict): phase name -> time the phase took
+            dt_ms (int): milliseconds reported by the game clock for this frame
+            entity_counts (dict): group name -> number of entities
+        """
+        self.frame_index += 1
+        self.frame_times.append(frame_ns)
+        for name, elapsed in phase_ns.items():
+            samples = self.phase_times.get(name)
+            if samples is None:
+                samples = self.phase_times[name] = deque(maxlen=self.window)
+            samples.append(elapsed)
+        self.entity_counts = entity_counts
+
+        if self.output_file is not None:
+            row = {"frame": self.frame_index, "dt_ms": dt_ms, "frame_ms": frame_ns / 1e6}
+            for name, elapsed in phase_ns.items():
+                row[name + "_ms"] = elapsed / 1e6
+            row.update(entity_counts)
+            row.update(self.getCounters())
+            self.writeRow(row)
+
+    def writeRow(self, row: dict) -> None:
+        """Write a row to the output file in its format."""
+        if not self.output_file.name.endswith(".csv"):
+            self.output_file.write(json.dumps(row) + "\n")
+            return
+        if self.csv_writer is None:
+            self.csv_writer = csv.DictWriter(self.output_file, fieldnames=list(row), extrasaction="ignore")
+            self.csv_writer.writeheader()
+        self.csv_writer.writerow(row)
+
+    def getCounters(self) -> dict:
+        """Return the current values of every registered counter source."""
+        counters = {}
+        for source_name, source in self.counter_sources.items():
+            for name, value in source().items():
+                counters[f"{source_name}_{name}"] = value
+        return counters
+
+    def getSummary(self) -> dict:
+        """Return p50/p95/p99 frame and phase times in milliseconds along with entity counts."""
+        def stats(samples):
+            ordered = sorted(samples)
+            return {
+                "p50_ms": percentile(ordered, 0.50) / 1e6,
+                "p95_ms": percentile(ordered, 0.95) / 1e6,
+                "p99_ms": percentile(ordered, 0.99) / 1e6,
+            }
+        return {
+            "frames": self.frame_index,
+            "frame": stats(self.frame_times),
+            "phases": {name: stats(samples) for name, samples in self.phase_times.items()},
+            "entities": dict(self.entity_counts),
+            "counters": self.getCounters(),
+        }
+
+    def drawOverlay(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the statistics overlay in the top-left corner of a surface.
+        The text is only re-rendered every PROFILER_OVERLAY_REFRESH frames.
+        Returns:
+            pygame.Rect: the area drawn, or None if the overlay is hidden
+        """
+        if not self.overlay_visible:
+            return None
+        if self.overlay_surface is None or self.frame_index % Constants.PROFILER_OVERLAY_REFRESH == 0:
+            self.overlay_surface = self.renderOverlay()
+        return surface.blit(self.overlay_surface, (0, 0))
+
+    def renderOverlay(self) -> pygame.Surface:
+        """Render the overlay text onto a new translucent surface."""
+        if self.overlay_font is None:
+            self.overlay_font = pygame.font.SysFont("monospace", 16)
+        summary = self.getSummary()
+        lines = ["{:<34}{:>7}{:>7}{:>7}".format("ms", "p50", "p95", "p99")]
+        for name, stats in [("frame", summary["frame"])] + list(summary["phases"].items()):
+            lines.append("{:<34}{:>7.2f}{:>7.2f}{:>7.2f}".format(name, stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]))
+        for name, count in list(summary["entities"].items()) + list(summary["counters"].items()):
+            lines.append("{:<34}{:>7}".format(name, count))
+
+        line_height = self.overlay_font.get_linesize()
+        rendered = [self.overlay_font.render(line, True, (255, 255, 255)) for line in lines]
+        overlay = pygame.Surface(
+            (max(text.get_width() for text in rendered) + 10, line_height * len(rendered) + 10), pygame.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 160))
+        for i, text in enumerate(rendered):
+            overlay.blit(text, (5, 5 + i * line_height))
+        return overlay
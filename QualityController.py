@@ -0,0 +1,110 @@
+"""
+Quality Controller Module
+Holds the game's quality settings and a governor that watches the rolling
+frame time and steps through the QUALITY_TIERS to stay within the frame
+budget. A tier is lowered when frames run over budget and raised again only
+once they are well under it, with every change held for a minimum number of
+frames, so the quality does not flicker between two tiers. Tier changes are
+logged and counted.
+
+Every governor keeps its own settings, which its game hands to the sprites,
+renderer and particle systems it owns, so games in one process never change
+each other's quality.
+"""
+
+import Constants
+from collections import deque
+
+# Settings of the top tier, used by everything that does not belong to a game
+DEFAULT_QUALITY_SETTINGS = dict(Constants.QUALITY_TIERS[0])
+
+class QualityGovernor():
+    """
+    Lowers and raises the quality tier based on the mean time frames took to run.
+    The time waited for the next frame is not included, so the governor sees the
+    headroom left in the frame budget.
+
+    Attributes:
+        enabled (bool): Whether tiers change, a disabled governor keeps the top tier
+        settings (dict): Settings of the current tier, updated in place so holders of the dict see changes
+        budget_ms (float): Milliseconds a frame may take at the target frame rate
+        tier (int): Index of the current tier in QUALITY_TIERS, 0 being the best quality
+        frame_times (deque): Rolling window of frame times in milliseconds
+        frames_since_change (int): Frames run since the tier last changed
+        changes (list): (frame, old tier, new tier, mean frame ms) of every tier change
+        tier_frames (list): Number of frames run at every tier
+    """
+
+    def __init__(self, frame_rate: int, enabled: bool = Constants.QUALITY_GOVERNOR, window: int = Constants.QUALITY_WINDOW):
+        """Initialize a governor at the top tier.
+        Args:
+            frame_rate (int): the game's target frame rate, the budget is one frame of it
+            enabled (bool): whether tiers change
+            window (int): number of frames the mean frame time is taken over
+        """
+        self.enabled = enabled and frame_rate > 0
+        self.budget_ms = 1000 / frame_rate if frame_rate else 0.0
+        self.frame_times = deque(maxlen=window)
+        self.frame_time_sum = 0.0
+        self.frame_index = 0
+        self.changes = []
+        self.tier_frames = [0] * len(Constants.QUALITY_TIERS)
+        self.settings = {}
+        self.setTier(0)
+
+    def setTier(self, tier: int) -> None:
+        """Switch to a tier and start measuring it afresh."""
+        self.tier = tier
+        self.settings.update(Constants.QUALITY_TIERS[tier])
+        self.frame_times.clear()
+        self.frame_time_sum = 0.0
+        self.frames_since_change = 0
+
+    def setEnabled(self, enabled: bool) -> None:
+        """Turn the governor on or off, going back to the top tier when turned off."""
+        self.enabled = enabled and self.budget_ms > 0
+        if not self.enabled and self.tier != 0:
+            self.changeTier(0)
+
+    def update(self, frame_ms: float) -> None:
+        """Record the time a frame took and change the tier when the mean calls for it.
+        Args:
+            frame_ms (float): milliseconds the frame's phases took
+        """
+        self.frame_index += 1
+        self.tier_frames[self.tier] += 1
+        if not self.enabled:
+            return
+        frame_times = self.frame_times
+        if len(frame_times) == frame_times.maxlen:
+            self.frame_time_sum -= frame_times[0]
+        frame_times.append(frame_ms)
+        self.frame_time_sum += frame_ms
+        self.frames_since_change += 1
+        if len(frame_times) < frame_times.maxlen or self.frames_since_change < Constants.QUALITY_HOLD_FRAMES:
+            return
+
+        mean_ms = self.frame_time_sum / len(frame_times)
+        if mean_ms > self.budget_ms * Constants.QUALITY_DOWNGRADE_RATIO and self.tier < len(Constants.QUALITY_TIERS) - 1:
+            self.changeTier(self.tier + 1, mean_ms)
+        elif mean_ms < self.budget_ms * Constants.QUALITY_UPGRADE_RATIO and self.tier > 0:
+            self.changeTier(self.tier - 1, mean_ms)
+
+    def changeTier(self, tier: int, mean_ms: float = 0.0) -> None:
+        """Switch to another tier, logging and counting the change."""
+        self.changes.append((self.frame_index, self.tier, tier, mean_ms))
+        if Constants.PRINT_QUALITY_CHANGES:
+            print(f"Quality tier {self.tier} -> {tier} at frame {self.frame_index}, "
+                  f"mean frame {mean_ms:.1f} ms of a {self.budget_ms:.1f} ms budget")
+        self.setTier(tier)
+
+    def getStats(self) -> dict:
+        """Return the current tier, the number of downgrades and upgrades and the frames run at every tier."""
+        stats = {
+            "tier": self.tier,
+            "downgrades": sum(1 for _, old, new, _ in self.changes if new > old),
+            "upgrades": sum(1 for _, old, new, _ in self.changes if new < old),
+        }
+        for tier, frames in enumerate(self.tier_frames):
+            stats[f"tier_{tier}_frames"] = frames
+        return stats
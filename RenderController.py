@@ -0,0 +1,232 @@
+"""
+Render Controller Module
+Draws sprite groups onto the screen. In dirty-rectangle mode only the areas
+sprites covered last frame and cover this frame are erased and sent to the
+display, falling back to a full redraw when too much of the screen changed.
+Sprites outside the viewport are skipped and the rest are drawn at their
+position relative to the camera. Particle layers are drawn behind or in front
+of the sprites from the blit sequences they build themselves. When the viewport has a logical size, or at a
+render scale below 1, the frame is drawn onto an offscreen canvas and presented
+to the window with a single scale.
+"""
+
+import pygame
+import Constants
+from ViewportController import getViewport
+from AssetController import getScaledImage
+from QualityController import DEFAULT_QUALITY_SETTINGS
+from typing import Callable, List
+
+class Renderer():
+    """
+    Renders sprite groups either with full-frame redraws or with dirty rectangles.
+
+    Attributes:
+        screen (pygame.Surface): Surface everything is drawn onto
+        use_dirty_rects (bool): Whether dirty-rectangle mode is enabled
+        previous_rects (List[pygame.Rect]): Areas drawn during the last frame
+        full_redraw_requested (bool): Forces the next frame to redraw the whole screen
+        last_frame_was_full (bool): Whether the last rendered frame was a full redraw
+        last_camera_offset (tuple): Camera offset of the last rendered frame
+        culled (int): Number of sprites skipped for being outside the viewport last frame
+        quality_settings (dict): Quality tier settings of the game, providing the render scale
+        canvas (pygame.Surface): Offscreen frame used while frames are scaled to the window
+        last_present_rect (pygame.Rect): Window area the last scaled frame was presented in
+    """
+
+    def __init__(self, screen: pygame.Surface, use_dirty_rects: bool = Constants.USE_DIRTY_RECT_RENDERING,
+                 quality_settings: dict = DEFAULT_QUALITY_SETTINGS):
+        """Initialize the renderer for the given screen surface."""
+        self.screen = screen
+        self.use_dirty_rects = use_dirty_rects
+        self.quality_settings = quality_settings
+        self.previous_rects = []
+        self.full_redraw_requested = True
+        self.last_frame_was_full = True
+        self.last_camera_offset = None
+        self.culled = 0
+        self.canvas = None
+        self.present_surface = None
+        self.last_present_rect = None
+
+    def requestFullRedraw(self) -> None:
+        """Redraw the whole screen on the next frame, e.g. after the window was resized."""
+        self.full_redraw_requested = True
+
+    def render(self, sprite_groups: List[pygame.sprite.Group], overlays: List[Callable] = (), alpha: float = None,
+               background=None, effects=None) -> None:
+        """Draw every sprite of the given groups and present the frame.
+        Args:
+            sprite_groups (List[pygame.sprite.Group]): groups to draw, in back to front order
+            overlays (List[Callable]): functions drawing on top of the sprites, returning the
+                rect they drew or None
+            alpha (float): how far between its previous and current position each sprite is
+                drawn, None draws sprites at their current position
+            background: static layer drawn behind the sprites, providing getBlitSequence(viewport).
+                It is redrawn every frame but never added to the dirty rects since it does not move
+            effects: layer drawn in front of the sprites, providing getBlitSequence(viewport)
+        """
+        viewport = getViewport()
+        if alpha is None:
+            blit_sequence = self.visibleSprites(sprite_groups, viewport)
+        else:
+            blit_sequence = self.interpolateSprites(sprite_groups, alpha, viewport)
+        if effects is not None:
+            blit_sequence += effects.getBlitSequence(viewport)
+        background_sequence = background.getBlitSequence(viewport) if background is not None else []
+
+        # Everything on screen shifts when the camera moves
+        camera_offset = viewport.getOffset()
+        if camera_offset != self.last_camera_offset:
+            self.last_camera_offset = camera_offset
+            self.full_redraw_requested = True
+
+        render_scale = self.quality_settings["render_scale"]
+        if render_scale != 1.0 or viewport.isScaled():
+            self.renderScaled(background_sequence + blit_sequence, overlays, render_scale, viewport)
+            return
+        if self.last_present_rect is not None:
+            # Back from scaled frames, dirty rects start over from a full redraw
+            self.last_present_rect = None
+            self.previous_rects = []
+            self.full_redraw_requested = True
+
+        if not self.use_dirty_rects:
+            self.screen.fill(Constants.SCREEN_COLOR)
+            self.screen.blits(background_sequence, doreturn=False)
+            self.screen.blits(blit_sequence, doreturn=False)
+            self.drawOverlays(overlays)
+            pygame.display.flip()
+            return
+
+        if self.full_redraw_requested or self.isDirtyAreaTooLarge(blit_sequence):
+            self.screen.fill(Constants.SCREEN_COLOR)
+            self.screen.blits(background_sequence, doreturn=False)
+            self.previous_rects = self.screen.blits(blit_sequence) + self.drawOverlays(overlays)
+            pygame.display.flip()
+            self.full_redraw_requested = False
+            self.last_frame_was_full = True
+            return
+
+        # Erase where sprites were, draw where they are and present only those areas
+        for rect in self.previous_rects:
+            self.screen.fill(Constants.SCREEN_COLOR, rect)
+        # Restores the background wherever it was erased, areas that are presented anyway
+        self.screen.blits(background_sequence, doreturn=False)
+        current_rects = self.screen.blits(blit_sequence) + self.drawOverlays(overlays)
+        pygame.display.update(self.previous_rects + current_rects)
+        self.previous_rects = current_rects
+        self.last_frame_was_full = False
+
+    def renderScaled(self, blit_sequence: list, overlays: List[Callable], scale: float, viewport) -> None:
+        """Draw the sprites onto a canvas scale times the viewport's screen size, scale it into
+        the window's present rect in a single scale and draw the overlays on top at the window's
+        resolution.
+        Args:
+            blit_sequence (list): (image, rect) pairs in screen coordinates
+            overlays (List[Callable]): functions drawing on top of the sprites
+            scale (float): factor applied to both sides of the screen
+            viewport (Viewport): provides the screen size and the present rect
+        """
+        screen_width, screen_height = viewport.size
+        canvas_size = (max(1, round(screen_width * scale)), max(1, round(screen_height * scale)))
+        if self.canvas is None or self.canvas.get_size() != canvas_size:
+            self.canvas = pygame.Surface(canvas_size).convert(self.screen)
+        present_rect = viewport.present_rect.clip(self.screen.get_rect())
+        if present_rect != self.last_present_rect:
+            # Clear the letterbox bars, which no frame draws over
+            self.screen.fill(Constants.SCREEN_COLOR)
+            self.present_surface = self.screen.subsurface(present_rect)
+            self.last_present_rect = present_rect
+        self.full_redraw_requested = False
+
+        self.canvas.fill(Constants.SCREEN_COLOR)
+        if scale == 1.0:
+            self.canvas.blits(blit_sequence, doreturn=False)
+        else:
+            self.canvas.blits([(getScaledImage(image, scale), (round(rect.x * scale), round(rect.y * scale)))
+                               for image, rect in blit_sequence], doreturn=False)
+        if Constants.SMOOTH_PRESENT and self.canvas.get_bitsize() >= 24:
+            pygame.transform.smoothscale(self.canvas, present_rect.size, self.present_surface)
+        else:
+            pygame.transform.scale(self.canvas, present_rect.size, self.present_surface)
+        self.drawOverlays(overlays, self.present_surface)
+        pygame.display.flip()
+        self.last_frame_was_full = True
+
+    def visibleSprites(self, sprite_groups: List[pygame.sprite.Group], viewport) -> list:
+        """Build the blit sequence of the sprites inside the viewport, in screen coordinates.
+        Returns:
+            list: (image, rect) pairs
+        """
+        view = viewport.rect
+        offset_x, offset_y = view.topleft
+        if offset_x or offset_y:
+            blit_sequence = [(sprite.image, sprite.rect.move(-offset_x, -offset_y))
+                             for group in sprite_groups for sprite in group if view.colliderect(sprite.rect)]
+        else:
+            blit_sequence = [(sprite.image, sprite.rect)
+                             for group in sprite_groups for sprite in group if view.colliderect(sprite.rect)]
+        self.culled = sum(len(group) for group in sprite_groups) - len(blit_sequence)
+        return blit_sequence
+
+    def interpolateSprites(self, sprite_groups: List[pygame.sprite.Group], alpha: float, viewport) -> list:
+        """Build the blit sequence with every sprite drawn between its previous and current center.
+        Sprites that jumped further than INTERPOLATION_SNAP_DISTANCE, e.g. by wrapping around
+        the screen, are drawn at their current position. Sprites outside the viewport are skipped.
+        Returns:
+            list: (image, rect) pairs in screen coordinates
+        """
+        lag = 1 - alpha
+        snap_distance = Constants.INTERPOLATION_SNAP_DISTANCE
+        view = viewport.rect
+        offset_x, offset_y = view.topleft
+        blit_sequence = []
+        culled = 0
+        for group in sprite_groups:
+            for sprite in group:
+                previous = sprite.previous_center
+                rect = sprite.rect
+                if previous is not None and sprite.interpolate:
+                    dx, dy = rect.centerx - previous[0], rect.centery - previous[1]
+                    if (dx or dy) and abs(dx) < snap_distance and abs(dy) < snap_distance:
+                        rect = rect.move(-round(dx * lag), -round(dy * lag))
+                if not view.colliderect(rect):
+                    culled += 1
+                    continue
+                if offset_x or offset_y:
+                    rect = rect.move(-offset_x, -offset_y)
+                blit_sequence.append((sprite.image, rect))
+        self.culled = culled
+        return blit_sequence
+
+    def drawOverlays(self, overlays: List[Callable], surface: pygame.Surface = None) -> List[pygame.Rect]:
+        """Draw the overlays onto the screen, or onto another surface such as the present rect.
+        Returns:
+            List[pygame.Rect]: the areas the overlays drew
+        """
+        surface = self.screen if surface is None else surface
+        rects = []
+        for overlay in overlays:
+            rect = overlay(surface)
+            if rect is not None:
+                rects.append(rect)
+        return rects
+
+    def isDirtyAreaTooLarge(self, blit_sequence: list) -> bool:
+        """Estimate whether erasing and updating rects would cost more than a full redraw.
+        Args:
+            blit_sequence (list): (image, rect) pairs about to be drawn
+        Returns:
+            bool: True if the dirty area exceeds DIRTY_RECT_FULL_REDRAW_RATIO of the screen
+        """
+        screen_width, screen_height = self.screen.get_size()
+        limit = screen_width * screen_height * Constants.DIRTY_RECT_FULL_REDRAW_RATIO
+        dirty_area = 0
+        for rect in self.previous_rects:
+            dirty_area += rect.width * rect.height
+        for _, rect in blit_sequence:
+            dirty_area += rect.width * rect.height
+            if dirty_area > limit:
+                return True
+        return dirty_area > limit
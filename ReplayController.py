@@ -0,0 +1,298 @@
+"""
+Replay Controller Module
+Records the input of a game into a compact binary stream, the seed and window
+size once followed by one small record per frame holding the frame time, the
+WASD key bitmask, the mouse position, the mouse buttons, pause key presses and
+window resizes, and plays it back through the same input source interface the
+game reads from. Replays run uncapped without rendering, seek through snapshot
+checkpoints and render only the frames of interest.
+
+Usage:
+    python ReplayController.py replay.bin --render-from 1200 --render-to 1260 --output-dir frames
+"""
+
+import os
+import sys
+import atexit
+import struct
+import argparse
+import pygame
+import Constants
+from InputController import ScriptedInput, PressedKeys
+
+REPLAY_MAGIC = b"GRRP"
+REPLAY_VERSION = 1
+# magic, version, seed, simulation rate, window width and height, world width and height (0 follows the window)
+REPLAY_HEADER = struct.Struct("<4sHQHHHHH")
+# frame time in ms, flags, key bitmask, mouse x and y, held buttons (bits 0-2) and clicked buttons (bits 3-7)
+REPLAY_FRAME = struct.Struct("<dBBhhB")
+# new window width and height, present when the frame's FLAG_RESIZE is set
+REPLAY_RESIZE = struct.Struct("<HH")
+FLAG_RESIZE = 1
+# set when a pause key was pressed during the frame
+FLAG_PAUSE = 2
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+# Range of the signed 16-bit mouse coordinates of a frame record
+MOUSE_COORDINATE_RANGE = (-2 ** 15, 2 ** 15 - 1)
+
+class RecordingInput():
+    """
+    Wraps an input source, freezing its state once per frame and writing it to a replay file.
+    The game reads the frozen state, so the replay reproduces exactly what it saw.
+
+    Attributes:
+        source: The wrapped input source, usually a LiveInput
+        output_file: The replay file being written
+        frame (dict): Input of the current frame, written when the next frame starts
+    """
+
+    def __init__(self, source, path: str, seed: int, window_size: tuple, world_size: tuple = None):
+        """Start a replay file.
+        Args:
+            source: input source to record
+            path (str): replay file to write
+            seed (int): seed the recorded game was created with
+            window_size (tuple): (width, height) of the window
+            world_size (tuple): (width, height) of the world, None when it follows the window
+        """
+        if not 0 <= seed < 2 ** 64:
+            raise ValueError(f"Replay seeds must fit in 64 unsigned bits, got {seed}")
+        self.source = source
+        self.output_file = open(path, "wb")
+        world_width, world_height = world_size or (0, 0)
+        self.output_file.write(REPLAY_HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, seed, Constants.SIMULATION_RATE, *window_size, world_width, world_height
+        ))
+        self.frame = None
+        self.frames_written = 0
+        atexit.register(self.close)
+
+    def nextFrame(self, game) -> None:
+        """Write the previous frame and advance the wrapped source."""
+        self.writeFrame()
+        self.source.nextFrame(game)
+        self.frame = {
+            "frame_time": game.dt if game.fixed_frame_time is None else game.fixed_frame_time,
+            "clicks": [],
+            "resize": None,
+            "pause": False,
+        }
+        self.freezeState()
+
+    def freezeState(self) -> None:
+        """Read the mouse and keyboard state the game will see for the rest of the frame.
+        The mouse position is rounded and clamped to what a frame record holds, so the
+        recorded game sees exactly the position its replay will.
+        """
+        low, high = MOUSE_COORDINATE_RANGE
+        self.mouse_pos = tuple(min(high, max(low, round(coordinate))) for coordinate in self.source.getMousePos())
+        self.buttons = tuple(self.source.getMousePressed()[:3])
+        keys = self.source.getKeysPressed()
+        self.keys = PressedKeys(key for key in RECORDED_KEYS if keys[key])
+
+    def getEvents(self) -> list:
+        events = self.source.getEvents()
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and 1 <= event.button <= 5:
+                self.frame["clicks"].append(event.button)
+            elif event.type == pygame.VIDEORESIZE:
+                self.frame["resize"] = (event.w, event.h)
+            elif event.type == pygame.KEYDOWN and event.key in Constants.PAUSE_KEYS:
+                # Pressing a pause key twice in one frame toggles back
+                self.frame["pause"] = not self.frame["pause"]
+        # Events update pygame's mouse and keyboard state
+        self.freezeState()
+        return events
+
+    def getMousePos(self) -> tuple:
+        return self.mouse_pos
+
+    def getMousePressed(self) -> tuple:
+        return self.buttons
+
+    def getKeysPressed(self) -> PressedKeys:
+        return self.keys
+
+    def writeFrame(self) -> None:
+        """Append the current frame to the replay file."""
+        if self.frame is None or self.output_file.closed:
+            return
+        key_bits = sum(1 << i for i, key in enumerate(RECORDED_KEYS) if key in self.keys)
+        button_bits = sum(1 << i for i, pressed in enumerate(self.buttons) if pressed)
+        for button in self.frame["clicks"]:
+            button_bits |= 1 << (button + 2)
+        resize = self.frame["resize"]
+        flags = (FLAG_RESIZE if resize else 0) | (FLAG_PAUSE if self.frame["pause"] else 0)
+        self.output_file.write(REPLAY_FRAME.pack(
+            self.frame["frame_time"], flags, key_bits, *self.mouse_pos, button_bits
+        ))
+        if resize:
+            self.output_file.write(REPLAY_RESIZE.pack(*resize))
+        self.frame = None
+        self.frames_written += 1
+
+    def close(self) -> None:
+        """Write the last frame and close the replay file."""
+        if not self.output_file.closed:
+            self.writeFrame()
+            self.output_file.close()
+
+def readReplay(path: str) -> tuple:
+    """Read a replay file.
+    Returns:
+        tuple: (header dict, list of frame dicts in the ScriptedInput format with frame_time and resize)
+    """
+    with open(path, "rb") as input_file:
+        data = input_file.read()
+    magic, version, seed, simulation_rate, width, height, world_width, world_height = REPLAY_HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+        raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay")
+    header = {
+        "seed": seed,
+        "simulation_rate": simulation_rate,
+        "window_size": (width, height),
+        "world_size": (world_width, world_height) if world_width else None,
+    }
+
+    frames = []
+    offset = REPLAY_HEADER.size
+    while offset + REPLAY_FRAME.size <= len(data):
+        frame_time, flags, key_bits, mouse_x, mouse_y, button_bits = REPLAY_FRAME.unpack_from(data, offset)
+        offset += REPLAY_FRAME.size
+        resize = None
+        if flags & FLAG_RESIZE:
+            resize = REPLAY_RESIZE.unpack_from(data, offset)
+            offset += REPLAY_RESIZE.size
+        frames.append({
+            "frame_time": frame_time,
+            "resize": resize,
+            "keys": [key for i, key in enumerate(RECORDED_KEYS) if key_bits & (1 << i)],
+            "mouse_pos": (mouse_x, mouse_y),
+            "buttons": tuple(bool(button_bits & (1 << i)) for i in range(3)),
+            "clicks": tuple(button for button in range(1, 6) if button_bits & (1 << (button + 2))),
+            "key_presses": (Constants.PAUSE_KEYS[0],) if flags & FLAG_PAUSE else (),
+        })
+    return header, frames
+
+class ReplayInput(ScriptedInput):
+    """
+    Plays back recorded frames, including their frame times and window resizes.
+    Only QUIT is taken from the real event queue, so the replay cannot be disturbed.
+    """
+
+    resize = None
+
+    def nextFrame(self, game) -> None:
+        super().nextFrame(game)
+        frame = self.frames[min(self.frame_index, len(self.frames) - 1)] if self.frames else {}
+        game.dt = frame.get("frame_time", game.dt)
+        # Recorded buttons already are what the game saw, clicks included
+        self.buttons = tuple(frame.get("buttons", self.buttons))
+        self.resize = frame.get("resize") if self.frame_index < len(self.frames) else None
+
+    def getEvents(self) -> list:
+        events = [event for event in pygame.event.get() if event.type == pygame.QUIT]
+        if self.resize:
+            width, height = self.resize
+            events.append(pygame.event.Event(pygame.VIDEORESIZE, w=width, h=height, size=(width, height)))
+        for button in self.clicks:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=self.mouse_pos))
+        for key in self.key_presses:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+        return events
+
+class Replayer():
+    """
+    Runs a recorded game headless, keeping snapshot checkpoints to seek quickly.
+
+    Attributes:
+        header (dict): Seed, simulation rate and window and world sizes of the recording
+        frames (list): Recorded input frames
+        game (Game): The game being replayed
+        input_source (ReplayInput): Feeds the recorded frames to the game
+        frame_index (int): Number of frames replayed so far
+        checkpoints (dict): Frame index -> snapshot taken before that frame ran
+        checkpoint_interval (int): Frames between two checkpoints
+    """
+
+    def __init__(self, path: str, checkpoint_interval: int = Constants.REPLAY_CHECKPOINT_INTERVAL):
+        """Create the recorded game on a headless screen of the recorded window size."""
+        from Simulation import enableHeadlessDrivers
+        enableHeadlessDrivers()
+        from GameController import Game, initiateGameScreen
+        from InputController import setInputSource
+        from ViewportController import Viewport, setViewport
+
+        self.header, self.frames = readReplay(path)
+        if self.header["simulation_rate"] != Constants.SIMULATION_RATE:
+            raise ValueError(f"Replay was recorded at SIMULATION_RATE {self.header['simulation_rate']}, "
+                             f"the game runs at {Constants.SIMULATION_RATE}")
+        initiateGameScreen(headless=True)
+        screen = pygame.display.set_mode(self.header["window_size"])
+        setViewport(Viewport(self.header["window_size"], self.header["world_size"]))
+        self.input_source = ReplayInput(self.frames)
+        setInputSource(self.input_source)
+
+        self.game = Game(screen, seed=self.header["seed"], frame_rate=0)
+        self.game.render_enabled = False
+        self.frame_index = 0
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = {}
+
+    def step(self) -> None:
+        """Replay one frame, taking a checkpoint first when one is due."""
+        if self.frame_index % self.checkpoint_interval == 0 and self.frame_index not in self.checkpoints:
+            self.checkpoints[self.frame_index] = self.game.captureSnapshot()
+        self.game.runFrame()
+        self.frame_index += 1
+
+    def seek(self, frame_index: int) -> None:
+        """Move to just before the given frame, restoring the closest earlier checkpoint
+        when seeking backwards and fast-forwarding from there without rendering.
+        """
+        if frame_index < self.frame_index:
+            checkpoint = max(index for index in self.checkpoints if index <= frame_index)
+            self.game.restoreSnapshot(self.checkpoints[checkpoint])
+            self.frame_index = checkpoint
+            self.input_source.frame_index = checkpoint - 1
+        while self.frame_index < frame_index:
+            self.step()
+
+    def renderFrames(self, start: int, end: int, output_dir: str = None) -> None:
+        """Replay frames start to end, rendering them and optionally saving each one as a PNG.
+        Args:
+            start (int): first frame to render
+            end (int): frame to stop before
+            output_dir (str): directory to save frame_NNNNNN.png files to
+        """
+        self.seek(start)
+        self.game.render_enabled = True
+        self.game.renderer.requestFullRedraw()
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        try:
+            while self.frame_index < end:
+                self.step()
+                if output_dir:
+                    pygame.image.save(self.game.screen, os.path.join(output_dir, f"frame_{self.frame_index - 1:06d}.png"))
+        finally:
+            self.game.render_enabled = False
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded game headless and render frames of interest.")
+    parser.add_argument("replay", help="replay file written with REPLAY_RECORD_FILE or Simulation.py --record")
+    parser.add_argument("--render-from", type=int, help="first frame to render")
+    parser.add_argument("--render-to", type=int, help="frame to stop rendering before")
+    parser.add_argument("--output-dir", help="save rendered frames as PNGs in this directory")
+    args = parser.parse_args()
+
+    replayer = Replayer(args.replay)
+    if args.render_from is not None:
+        replayer.renderFrames(args.render_from, args.render_to or args.render_from + 1, args.output_dir)
+    replayer.seek(len(replayer.frames))
+    game = replayer.game
+    print(f"Replayed {replayer.frame_index} frames with seed {replayer.header['seed']}: score {game.score}, "
+          f"{len(game.asteroid_sprites)} asteroids, ship health {game.player_ship.health}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,8 @@ import pygame
 import Constants
 from Sprites import Sprite
 from BulletController import addBullet
+from InputController import getKeysPressed
+from ViewportController import getWorldSize
 
 class Ship(Sprite):
     """Represents the player's ship in the game."""
@@ -18,48 +20,55 @@ class Ship(Sprite):
         self.initializePosition()
         self.velocity = Constants.SHIP_VELOCITY
         self.dimmensions = Constants.SHIP_DIMMENSION
-        self.health = 3
+        self.health = Constants.SHIP_HEALTH
         
     def initializePosition(self) -> None:
         """Set initial ship position"""
           # Create a smaller collision rectangle
-        self.rect.center = pygame.display.get_surface().get_rect().center
+        self.rect.center = pygame.Rect((0, 0), getWorldSize()).center
+        # Sub-pixel position, the rect is derived from it so fractional steps are not truncated
+        self.position = pygame.math.Vector2(self.rect.center)
         self.collision_rect = pygame.Rect(0, 0, self.rect.width * 0.4, self.rect.height * 0.4)
         self.collision_rect.center = self.rect.center
         self.collision_rect.center = self.rect.center
 
-    def move(self) -> None: 
+    def move(self, time_scale: float = 1.0) -> None: 
         """Update ship position based on keyboard input and screen boundaries.
         
         Args:
-            gameStat: The game state object containing screen dimensions and animation images
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
         """
         if not self.should_animate: 
             self.pointTowardsMousePointer(Constants.SHIP_ANGLE_OFFSET)
-            self.handleMovement()
+            self.handleMovement(time_scale)
         # Update collision rectangle position
         self.collision_rect.center = self.rect.center
 
-    def handleMovement(self) -> None:
-        """Handle ship movement based on key presses"""
-        curr_x, curr_y = self.rect.center
+    def handleMovement(self, time_scale: float = 1.0) -> None:
+        """Handle ship movement based on key presses
+        Args:
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
+        """
+        velocity = self.velocity * time_scale
+        curr_x, curr_y = self.position
 
-        width_of_screen, height_of_screen = pygame.display.get_surface().get_size()
+        width_of_screen, height_of_screen = getWorldSize()
 
-        keys = pygame.key.get_pressed()
+        keys = getKeysPressed()
         
         # Handle movement based on key presses and screen boundaries
         if keys[pygame.K_a] and curr_x >= 0:  # Left
-            self.rect.x -= self.velocity         
+            self.position.x -= velocity         
         if keys[pygame.K_d] and curr_x <= width_of_screen:  # Right
-            self.rect.x += self.velocity 
+            self.position.x += velocity 
         if keys[pygame.K_w] and curr_y >= 0:  # Up
-            self.rect.y -= self.velocity
+            self.position.y -= velocity
         if keys[pygame.K_s] and curr_y <= height_of_screen:  # Down
-            self.rect.y += self.velocity
+            self.position.y += velocity
+        self.rect.center = self.position
 
-    def animate(self):
-        super().animate()
+    def animate(self, elapsed_ms: float = 1000 / Constants.BASE_TICK_RATE):
+        super().animate(elapsed_ms)
         if self.health >= 0: 
             self.should_destroy = False
         elif self.health < -1: 
@@ -0,0 +1,122 @@
+"""
+Simulation Module
+Runs the game headless with SDL's dummy drivers, a scripted input source and a
+single seed driving all spawning randomness, so frames can be simulated as fast
+as the CPU allows and timed reproducibly.
+
+Usage:
+    python Simulation.py --frames 1000 --seed 7
+"""
+
+import os
+import time
+import json
+import argparse
+from statistics import mean, median
+
+def enableHeadlessDrivers() -> None:
+    """Select SDL's dummy video and audio drivers for running without a display or audio device."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+def summarizeFrameTimes(frame_times: list) -> dict:
+    """Summarize a list of frame durations.
+    Args:
+        frame_times (list): frame durations in seconds
+    Returns:
+        dict: frame count, total time and frame time statistics in milliseconds
+    """
+    if not frame_times:
+        return {"frames": 0, "total_seconds": 0.0}
+    ordered = sorted(frame_times)
+    total = sum(frame_times)
+    return {
+        "frames": len(frame_times),
+        "total_seconds": total,
+        "fps": len(frame_times) / total if total else 0.0,
+        "mean_ms": mean(frame_times) * 1000,
+        "median_ms": median(frame_times) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def createHeadlessGame(seed: int = 0, input_source=None, frame_rate: int = 0):
+    """Create a game on a headless screen driven by a scripted input source.
+    Args:
+        seed (int): seed for all spawning randomness
+        input_source: input source to install, defaults to an idle ScriptedInput
+        frame_rate (int): frame rate cap, 0 runs uncapped
+    Returns:
+        Game: the newly created game
+    """
+    enableHeadlessDrivers()
+    # Imported here so the dummy drivers are selected before pygame and the mixer initialize
+    from GameController import Game, initiateGameScreen
+    from InputController import ScriptedInput, setInputSource
+
+    import Constants
+
+    screen = initiateGameScreen(headless=True)
+    setInputSource(input_source if input_source is not None else ScriptedInput())
+    # Every frame advances exactly one simulation step, however long it really took
+    return Game(screen, seed=seed, frame_rate=frame_rate, fixed_frame_time=1000 / Constants.SIMULATION_RATE)
+
+def runSimulation(frames: int, seed: int = 0, input_source=None, frame_rate: int = 0, profile_output: str = None,
+                  record_output: str = None) -> dict:
+    """Run a number of frames headless and report how long they took.
+    Args:
+        frames (int): number of frames to simulate
+        seed (int): seed for all spawning randomness
+        input_source: input source to install, defaults to an idle ScriptedInput
+        frame_rate (int): frame rate cap, 0 runs uncapped
+        profile_output (str): stream per-phase timings to this CSV or JSONL file
+        record_output (str): record the input into this replay file
+    Returns:
+        dict: frame time statistics along with the seed, final entity counts and,
+            when profiling, the per-phase summary
+    """
+    game = createHeadlessGame(seed, input_source, frame_rate)
+    recorder = None
+    if record_output:
+        from InputController import getInputSource, setInputSource
+        from ReplayController import RecordingInput
+        from ViewportController import getViewport
+        import Constants
+        recorder = RecordingInput(getInputSource(), record_output, seed, getViewport().window_size, Constants.WORLD_SIZE)
+        setInputSource(recorder)
+    if profile_output:
+        game.profiler.startRecording(profile_output)
+    frame_times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.runFrame()
+        frame_times.append(time.perf_counter() - start)
+
+    if recorder is not None:
+        recorder.close()
+
+    report = summarizeFrameTimes(frame_times)
+    report.update({
+        "seed": seed,
+        "asteroids": len(game.asteroid_sprites),
+        "bullets": len(game.player_bullet_sprites),
+    })
+    if game.profiler.enabled:
+        report["profile"] = game.profiler.getSummary()
+        game.profiler.stopRecording()
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game headless and report frame timings.")
+    parser.add_argument("--frames", type=int, default=1000, help="number of frames to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="seed for spawning randomness")
+    parser.add_argument("--frame-rate", type=int, default=0, help="frame rate cap, 0 for uncapped")
+    parser.add_argument("--profile-output", help="stream per-phase timings to this .csv or .jsonl file")
+    parser.add_argument("--record", help="record the input into this replay file")
+    args = parser.parse_args()
+    report = runSimulation(args.frames, args.seed, frame_rate=args.frame_rate, profile_output=args.profile_output,
+                           record_output=args.record)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,61 @@
+"""
+Sound Controller Module
+Initializes the mixer and decodes the game's sounds when asked to rather than on
+import. When no audio device is available, or it does not respond within
+AUDIO_INIT_TIMEOUT seconds, the game keeps running silently.
+"""
+
+import threading
+import pygame
 from pygame import mixer
-from Constants import PLAYER_LASER_SOUND_FILE, ENEMY_LASER_SOUND_FILE, EXPLOSION_SOUND_FILE
-# Initialize the mixer
-mixer.init()
+from Constants import PLAYER_LASER_SOUND_FILE, ENEMY_LASER_SOUND_FILE, EXPLOSION_SOUND_FILE, AUDIO_INIT_TIMEOUT
+
+audio_available = False
+player_laser_sound = None
+enemy_laser_sound = None
+explosion_sound = None
+
+def initializeAudio(timeout: float = AUDIO_INIT_TIMEOUT) -> bool:
+    """Initialize the mixer, giving up if the audio device does not respond in time.
+    Args:
+        timeout (float): seconds to wait for the audio device
+    Returns:
+        bool: True if audio is available, False if the game runs silently
+    """
+    global audio_available
+    errors = []
+
+    def initializeMixer():
+        try:
+            mixer.init()
+        except pygame.error as e:
+            errors.append(e)
 
-player_laser_sound = mixer.Sound(PLAYER_LASER_SOUND_FILE)
-enemy_laser_sound = mixer.Sound(ENEMY_LASER_SOUND_FILE)
-explosion_sound = mixer.Sound(EXPLOSION_SOUND_FILE)
+    # A blocked audio device can hang mixer.init forever, so it runs on a thread that may be abandoned
+    init_thread = threading.Thread(target=initializeMixer, name="mixer-init", daemon=True)
+    init_thread.start()
+    init_thread.join(timeout)
 
-def playPlayerLaserShot():
-    mixer.Sound.play(player_laser_sound)
+    if init_thread.is_alive():
+        print(f"Audio device did not respond within {timeout} seconds, running without sound")
+    elif errors:
+        print(f"Audio is unavailable ({errors[0]}), running without sound")
+    else:
+        audio_available = True
+    return audio_available
 
-def playExplosionSound(): 
-    mixer.Sound.play(explosion_sound)
+def loadSounds() -> bool:
+    """Decode the game's sounds, does nothing when audio is unavailable.
+    Returns:
+        bool: True if the sounds were loaded
+    """
+    global player_laser_sound, enemy_laser_sound, explosion_sound
+    if not audio_available:
+        return False
+    player_laser_sound = mixer.Sound(PLAYER_LASER_SOUND_FILE)
+    enemy_laser_sound = mixer.Sound(ENEMY_LASER_SOUND_FILE)
+    explosion_sound = mixer.Sound(EXPLOSION_SOUND_FILE)
+    return True
 
-# TODO-OPTIONAL: 
-#    - Create a sound function that plays when a button is "clicked"
\ No newline at end of file
+# TODO-OPTIONAL:
+#    - Create a sound function that plays when a button is "clicked"
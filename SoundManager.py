@@ -0,0 +1,126 @@
+"""
+Sound Manager Module
+Mixes the game's sounds through a fixed budget of reserved channels per sound
+category. Requests are queued during the frame and flushed once per frame, so
+many identical requests coalesce into a single louder play, plays closer
+together than a category's minimum interval are dropped, and a full category
+steals the channel of its oldest or lower priority voice.
+"""
+
+import pygame
+import Constants
+import SoundController
+from pygame import mixer
+
+class SoundManager():
+    """
+    Voice-limited mixer on top of the sounds loaded by SoundController.
+
+    Attributes:
+        categories (dict): Category name -> settings from Constants.SOUND_CATEGORIES
+        pending (dict): Category name -> number of requests queued this frame
+        channels (dict): Category name -> reserved channels, empty until audio is available
+        voices (dict): Channel -> (priority, start time) of the sound it last played
+        last_play_ms (dict): Category name -> time the category last started playing
+        stats (dict): Counters of requested, played, coalesced, throttled, dropped and stolen plays
+    """
+
+    def __init__(self, categories: dict = Constants.SOUND_CATEGORIES):
+        """Initialize a manager whose channels are allocated once audio is available."""
+        self.categories = categories
+        self.pending = {}
+        self.channels = {}
+        self.voices = {}
+        self.last_play_ms = {}
+        self.stats = {"requested": 0, "played": 0, "coalesced": 0, "throttled": 0, "dropped": 0, "stolen": 0}
+
+    def request(self, category: str) -> None:
+        """Queue a play of a category's sound for the end of the frame."""
+        self.stats["requested"] += 1
+        self.pending[category] = self.pending.get(category, 0) + 1
+
+    def allocateChannels(self) -> None:
+        """Reserve every category's channels so plays outside the manager cannot take them."""
+        total = sum(settings["channels"] for settings in self.categories.values())
+        mixer.set_num_channels(max(mixer.get_num_channels(), total))
+        mixer.set_reserved(total)
+        index = 0
+        for name, settings in self.categories.items():
+            self.channels[name] = [mixer.Channel(index + i) for i in range(settings["channels"])]
+            index += settings["channels"]
+
+    def flush(self, now_ms: int = None) -> None:
+        """Play the requests queued this frame, once per category.
+        Args:
+            now_ms (int): current time in milliseconds, defaults to pygame.time.get_ticks()
+        """
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        if not SoundController.audio_available:
+            return
+        if not self.channels:
+            self.allocateChannels()
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+
+        for category, count in pending.items():
+            self.stats["coalesced"] += count - 1
+            settings = self.categories[category]
+            last_play = self.last_play_ms.get(category)
+            if last_play is not None and now_ms - last_play < settings["min_interval_ms"]:
+                self.stats["throttled"] += 1
+                continue
+            sound = getattr(SoundController, settings["sound"])
+            if sound is None:
+                continue
+
+            channel = self.findChannel(category, settings["priority"])
+            if channel is None:
+                self.stats["dropped"] += 1
+                continue
+            channel.play(sound)
+            channel.set_volume(min(1.0, settings["volume"] + Constants.SOUND_COALESCE_VOLUME_STEP * (count - 1)))
+            self.voices[channel] = (settings["priority"], now_ms)
+            self.last_play_ms[category] = now_ms
+            self.stats["played"] += 1
+
+    def findChannel(self, category: str, priority: int):
+        """Return an idle channel of the category, otherwise steal the voice with the lowest
+        priority, oldest first, among the category's own channels and the channels of lower
+        priority categories.
+        Returns:
+            mixer.Channel: the channel to play on, or None if every candidate outranks the request
+        """
+        for channel in self.channels[category]:
+            if not channel.get_busy():
+                return channel
+
+        victim = None
+        victim_rank = None
+        for name, channels in self.channels.items():
+            if name != category and self.categories[name]["priority"] >= priority:
+                continue
+            for channel in channels:
+                if not channel.get_busy():
+                    continue
+                rank = self.voices.get(channel, (0, 0))
+                if victim_rank is None or rank < victim_rank:
+                    victim, victim_rank = channel, rank
+
+        if victim is not None:
+            victim.stop()
+            self.stats["stolen"] += 1
+        return victim
+
+    def getStats(self) -> dict:
+        """Return the mixing counters."""
+        return dict(self.stats)
+
+sound_manager = SoundManager()
+
+def playPlayerLaserShot():
+    sound_manager.request("laser")
+
+def playExplosionSound():
+    sound_manager.request("explosion")
@@ -4,9 +4,16 @@ Provides base sprite functionality and utility functions for game objects.
 Handles rotation, angle calculations, and trajectory computations.
 """
 
+import copy
 from math import sqrt, atan2, degrees, radians, cos, sin
 from pygame.sprite import Sprite
 import pygame
+import Constants
+from AnimationController import getAnimationFrames
+from AssetController import loadImage, getRotatedImage
+from QualityController import DEFAULT_QUALITY_SETTINGS
+from ViewportController import getWorldMousePos
+from EntityRegistry import ANIMATING, DESTROYING
 
 def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate the Euclidean distance between two points.
@@ -22,24 +29,26 @@ def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """
     return sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
-def rotate(sprite: Sprite, angle_change: int, offset=0):
+def rotate(sprite: Sprite, angle_change: int, offset=0, update_image: bool = True):
     """Rotate a sprite's image by the given angle.
     
     Args:
         sprite (Sprite): The sprite to rotate
         angle_change (int): The angle to rotate by in degrees
         offset (int, optional): Additional angle offset. Defaults to 0.
+        update_image (bool, optional): Whether the image follows the new angle now, the angle
+            is always updated. Defaults to True.
     """
     # Update the angle
     sprite.angle += angle_change + offset
     # Keep angle between 0 and 360 degrees
     sprite.angle = sprite.angle % 360
-    # Rotate the image
-    sprite.image = pygame.transform.rotate(sprite.original_image, sprite.angle)
+    if not update_image:
+        return
+    # Rotate the image, reusing a cached surface for the quantized angle
+    sprite.image = getRotatedImage(sprite.original_image, sprite.angle, sprite.quality_settings["rotation_angle_step"])
     # Get the new rect and maintain the center position
-    old_center = sprite.rect.center
-    sprite.rect = sprite.image.get_rect()
-    sprite.rect.center = old_center
+    sprite.rect = sprite.image.get_rect(center=sprite.rect.center)
 
 def calculateAngleToTarget(origin_x, origin_y, target_x, target_y, old_angle, offset=0): 
     """Calculate the angle needed to point from origin to target.
@@ -85,25 +94,92 @@ class Sprite(Sprite):
     def __init__(self):
         """Initialize the sprite with default properties."""
         super().__init__()
+        self.entity_store = None
+        self.pool = None
+        self.position = None
+        self.resetState()
+
+    def resetState(self) -> None:
+        """Reset rotation, animation and destruction state, e.g. before a pooled sprite is reused."""
         self.angle = 0
         self.should_animate = False
         self.should_destroy = False
         self.animation_images = None
+        self.animation_frames = None
         self.animation_idx = 0
+        self.animation_time = 0
+        self.previous_center = None
+
+    # Whether rendering may draw the sprite between its previous and current position
+    interpolate = True
+    # Quality tier settings of the game the sprite belongs to, the game replaces them when adding it
+    quality_settings = DEFAULT_QUALITY_SETTINGS
+    # Whether the sprite is indexed as clickable by the entity registry
+    clickable = False
+    # Entity registry indexing the sprite, set while the sprite is in the game
+    registry = None
+    _should_animate = False
+    _should_destroy = False
+
+    @property
+    def should_animate(self) -> bool:
+        """Whether the sprite is playing its explosion animation."""
+        return self._should_animate
+
+    @should_animate.setter
+    def should_animate(self, value: bool) -> None:
+        self._should_animate = value
+        if self.registry is not None:
+            self.registry.setState(self, ANIMATING, value)
 
-    def move(self) -> None:
+    @property
+    def should_destroy(self) -> bool:
+        """Whether the sprite is removed from the game during the next destruction phase."""
+        return self._should_destroy
+
+    @should_destroy.setter
+    def should_destroy(self, value: bool) -> None:
+        self._should_destroy = value
+        if self.registry is not None:
+            self.registry.setState(self, DESTROYING, value)
+
+    def move(self, time_scale: float = 1.0) -> None:
         """Base movement method that should be overridden by subclasses that need movement.
         This method provides a common interface for sprite movement in the game.
         Subclasses should implement their specific movement logic by overriding this method.
+        Args:
+            time_scale (float): length of the simulation step relative to a BASE_TICK_RATE tick
         """
         pass
 
+    def placeAt(self, center: tuple) -> None:
+        """Move the sprite's rect, sub-pixel position and collision rect to a new center.
+        Args:
+            center (tuple): the new (x, y) center
+        """
+        self.rect.center = center
+        self.position = pygame.math.Vector2(center)
+        self.previous_center = None
+        if hasattr(self, "collision_rect"):
+            self.collision_rect.center = self.rect.center
+
+    def clone(self) -> "Sprite":
+        """Return an independent copy for game snapshots. Images are shared, while rects,
+        positions and group membership are not.
+        """
+        duplicate = copy.copy(self)
+        # Starts the copy outside of every group
+        super(Sprite, duplicate).__init__()
+        for name, value in vars(self).items():
+            if isinstance(value, (pygame.Rect, pygame.math.Vector2)):
+                setattr(duplicate, name, value.copy())
+        duplicate.entity_store = None
+        duplicate.registry = None
+        return duplicate
+
     def initializeImage(self, image_file: str, dimmenions: tuple):
-        """Initialize the ship's image and rect"""
-        self.original_image = pygame.transform.scale(
-            pygame.image.load(image_file), 
-            dimmenions
-        )
+        """Initialize the sprite's image and rect from the shared image cache."""
+        self.original_image = loadImage(image_file, dimmenions)
         self.image = self.original_image
         self.rect = self.image.get_rect()
   
@@ -119,7 +195,7 @@ class Sprite(Sprite):
         Args:
             offset: Additional angle offset
         """
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = getWorldMousePos()
         # Calculate angle from sprite to mouse (origin to target)
         self.angle = calculateAngleToTarget(
             self.rect.center[0], 
@@ -130,17 +206,15 @@ class Sprite(Sprite):
             offset
         )
         
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
+        self.image = getRotatedImage(self.original_image, self.angle, self.quality_settings["rotation_angle_step"])
+        self.rect = self.image.get_rect(center=self.rect.center)
 
     def calculateTrajectoryToMouse(self): 
         """Calculate a normalized vector pointing towards the mouse.
         Returns:
             tuple: Normalized (x, y) vector pointing towards mouse position
         """
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = getWorldMousePos()
         # Calculate vector from bullet to mouse (target - origin)
         v_x = mouse_x - self.rect.x
         v_y = mouse_y - self.rect.y
@@ -182,33 +256,41 @@ class Sprite(Sprite):
     def kill(self) -> None:
         """
         Destroys sprite, takes it out of any groups it is in and deletes it for memory allocation.
+        Pooled sprites are handed back to their pool to be reused.
         """
+        was_alive = self.alive()
+        if self.entity_store is not None:
+            self.entity_store.remove(self)
+        if self.registry is not None:
+            self.registry.unregister(self)
         super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
         del self
 
-    def animate(self):
+    def animate(self, elapsed_ms: float = 1000 / Constants.BASE_TICK_RATE):
         """
         Handles the explosion animation sequence for an asteroid.
-        When triggered, cycles through explosion animation frames and marks the asteroid for destruction
-        when the animation completes.
+        When triggered, plays back explosion frames prepared once for the sprite's size and angle,
+        advancing by elapsed time, and marks the asteroid for destruction when the animation completes.
+        Args:
+            elapsed_ms (float): milliseconds of simulation time since the last call
         """
+        if self.animation_frames is None:
+            self.animation_frames = getAnimationFrames(self.animation_images, self.dimmensions, self.angle)
+
         # Check if we have more frames to animate
-        if int(self.animation_idx) - 1 < len(self.animation_images):
-            # Get the current frame and apply transformations
-            current_frame = self.animation_images[int(self.animation_idx) - 1]
-            self.image = pygame.transform.scale(
-                pygame.transform.rotate(current_frame, self.angle),
-                self.dimmensions
-            )
-
-            # Maintain the asteroid's position during animation
-            old_image_rect_center = self.rect.center
-            self.rect = self.image.get_rect()
-            self.rect.center = old_image_rect_center
-            # Advance to next frame
-            self.animation_idx += 1
+        self.animation_idx = int(self.animation_time / Constants.ANIMATION_FRAME_DURATION_MS)
+        if self.animation_idx < len(self.animation_frames):
+            # Show the current frame, maintaining the sprite's position during animation
+            self.image = self.animation_frames[self.animation_idx]
+            self.rect = self.image.get_rect(center=self.rect.center)
+            # Lower quality tiers skip frames, which also makes explosions end sooner
+            self.animation_time += elapsed_ms * self.quality_settings["animation_frame_step"]
         else:
             # Animation complete - mark for destruction
             self.should_animate = False
             self.should_destroy = True
-            self.animation_idx = 0
\ No newline at end of file
+            self.animation_idx = 0
+            self.animation_time = 0
+            self.animation_frames = None
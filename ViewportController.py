@@ -0,0 +1,130 @@
+"""
+Viewport Controller Module
+Keeps the size of the world and of the window, which are only updated when the
+window is resized rather than queried from the display by every sprite, and the
+camera position that maps world coordinates to screen coordinates. The world
+matches the window unless WORLD_SIZE is set, in which case the camera can
+scroll across a larger playfield.
+
+When LOGICAL_SIZE is set the game is drawn at that size whatever the window's
+size, and frames are scaled into the window's present rect. Screen coordinates
+are then logical coordinates, and window points such as the mouse position are
+mapped back through the same transform.
+"""
+
+import pygame
+import Constants
+from InputController import getMousePos
+
+class Viewport():
+    """
+    Visible part of the world and the transform between world and screen coordinates.
+
+    Attributes:
+        size (tuple): (width, height) of the screen the game is drawn at
+        window_size (tuple): (width, height) of the window
+        world_size (tuple): (width, height) of the playfield sprites move in
+        rect (pygame.Rect): Visible area in world coordinates, its top-left is the camera offset
+        present_rect (pygame.Rect): Area of the window frames are presented in
+        fixed_world_size (tuple): World size independent of the window, None follows the window
+        logical_size (tuple): Screen size independent of the window, None follows the window
+    """
+
+    def __init__(self, size: tuple, world_size: tuple = Constants.WORLD_SIZE, logical_size: tuple = Constants.LOGICAL_SIZE):
+        """Initialize a viewport looking at the top-left corner of the world.
+        Args:
+            size (tuple): (width, height) of the window
+            world_size (tuple): (width, height) of the world, None makes it match the screen
+            logical_size (tuple): (width, height) the game is drawn at, None makes it match the window
+        """
+        self.fixed_world_size = world_size
+        self.logical_size = logical_size
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.resize(size)
+
+    def resize(self, size: tuple) -> None:
+        """Update the window size, called when the window is created or resized."""
+        self.window_size = tuple(size)
+        self.size = self.window_size if self.logical_size is None else tuple(self.logical_size)
+        self.world_size = self.size if self.fixed_world_size is None else tuple(self.fixed_world_size)
+        self.rect.size = self.size
+        self.present_rect = self.fitPresentRect()
+        self.clampCamera()
+
+    def fitPresentRect(self) -> pygame.Rect:
+        """Return the area of the window the screen is scaled into, centered and letterboxed
+        when PRESENT_KEEP_ASPECT is set.
+        """
+        window_width, window_height = self.window_size
+        if self.logical_size is None or not Constants.PRESENT_KEEP_ASPECT:
+            return pygame.Rect((0, 0), self.window_size)
+        scale = min(window_width / self.size[0], window_height / self.size[1])
+        present_rect = pygame.Rect(0, 0, max(1, round(self.size[0] * scale)), max(1, round(self.size[1] * scale)))
+        present_rect.center = (window_width // 2, window_height // 2)
+        return present_rect
+
+    def isScaled(self) -> bool:
+        """Return True if frames are drawn at a logical size and scaled to the window."""
+        return self.logical_size is not None
+
+    def centerOn(self, point: tuple) -> None:
+        """Move the camera so the given world point is in the middle of the window."""
+        self.rect.center = point
+        self.clampCamera()
+
+    def clampCamera(self) -> None:
+        """Keep the camera inside the world, or at its origin when the window is larger."""
+        world_width, world_height = self.world_size
+        self.rect.x = max(0, min(self.rect.x, world_width - self.rect.width))
+        self.rect.y = max(0, min(self.rect.y, world_height - self.rect.height))
+
+    def getOffset(self) -> tuple:
+        """Return the world coordinates of the window's top-left corner."""
+        return self.rect.topleft
+
+    def worldToScreen(self, point: tuple) -> tuple:
+        """Convert a world point to screen coordinates."""
+        return (point[0] - self.rect.x, point[1] - self.rect.y)
+
+    def screenToWorld(self, point: tuple) -> tuple:
+        """Convert a screen point to world coordinates."""
+        return (point[0] + self.rect.x, point[1] + self.rect.y)
+
+    def windowToScreen(self, point: tuple) -> tuple:
+        """Convert a window point, such as the mouse position, to screen coordinates."""
+        if self.logical_size is None:
+            return point
+        present = self.present_rect
+        return (round((point[0] - present.x) * self.size[0] / present.width),
+                round((point[1] - present.y) * self.size[1] / present.height))
+
+    def screenToWindow(self, point: tuple) -> tuple:
+        """Convert a screen point to window coordinates, the inverse of windowToScreen."""
+        if self.logical_size is None:
+            return point
+        present = self.present_rect
+        return (present.x + round(point[0] * present.width / self.size[0]),
+                present.y + round(point[1] * present.height / self.size[1]))
+
+    def isVisible(self, rect: pygame.Rect) -> bool:
+        """Return True if any part of a world rect is inside the window."""
+        return self.rect.colliderect(rect)
+
+viewport = Viewport(Constants.SCREEN_SIZE)
+
+def setViewport(new_viewport: Viewport) -> None:
+    """Replace the viewport every controller reads the world and window sizes from."""
+    global viewport
+    viewport = new_viewport
+
+def getViewport() -> Viewport:
+    """Return the current viewport."""
+    return viewport
+
+def getWorldSize() -> tuple:
+    """Return the (width, height) of the world."""
+    return viewport.world_size
+
+def getWorldMousePos() -> tuple:
+    """Return the mouse position in world coordinates."""
+    return viewport.screenToWorld(viewport.windowToScreen(getMousePos()))
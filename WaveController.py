@@ -0,0 +1,144 @@
+"""
+Wave Controller Module
+Schedules asteroid spawning from wave definitions loaded from a JSON file.
+Waves are driven by simulation time, each one rolling how long until its next
+batch and how many asteroids the batch holds. A batch is released a few
+asteroids at a time over the wave's spread instead of in a single step, is
+held back while the live asteroid cap is reached or frames take longer than
+their budget, and spawns held back for too long are shed.
+
+Waves file format:
+    {"waves": [{"start_s": 0, "interval_s": [5, 13], "amount": [5, 10], "spread_s": 1.5}, ...]}
+"""
+
+import json
+import Constants
+from collections import deque
+from AsteroidController import createAsteroid
+
+WAVE_KEYS = ("start_s", "interval_s", "amount", "spread_s")
+
+def loadWaves(path: str) -> list:
+    """Load and validate wave definitions.
+    Args:
+        path (str): JSON file of waves
+    Returns:
+        list: wave dicts sorted by start_s, times converted to milliseconds under *_ms keys
+    """
+    with open(path) as waves_file:
+        data = json.load(waves_file)
+    waves = []
+    for index, wave in enumerate(data.get("waves", ())):
+        missing = [key for key in WAVE_KEYS if key not in wave]
+        if missing:
+            raise ValueError(f"Wave {index} in {path} is missing {', '.join(missing)}")
+        waves.append({
+            "start_ms": wave["start_s"] * 1000,
+            "interval_ms": (wave["interval_s"][0] * 1000, wave["interval_s"][1] * 1000),
+            "amount": tuple(wave["amount"]),
+            "spread_ms": wave["spread_s"] * 1000,
+        })
+    if not waves:
+        raise ValueError(f"{path} defines no waves")
+    return sorted(waves, key=lambda wave: wave["start_ms"])
+
+class WaveScheduler():
+    """
+    Spawns asteroids for one game on simulation time.
+
+    Attributes:
+        waves (list): Wave definitions from loadWaves
+        elapsed_ms (float): Simulation time since the game (re)started
+        next_batch_ms (float): Simulation time the next batch is due
+        pending (deque): Simulation times at which the asteroids of rolled batches are due, oldest first
+        frame_time_ms (float): Smoothed frame time the load shedding compares against its budget
+        stats (dict): Counters of batches, scheduled, spawned and shed asteroids, and of steps
+            a due spawn was deferred by the live cap or the frame time budget
+    """
+
+    def __init__(self, waves: list):
+        """Initialize a scheduler at the start of the first wave."""
+        self.waves = waves
+        self.stats = {"batches": 0, "scheduled": 0, "spawned": 0, "deferred": 0, "shed": 0}
+        self.reset()
+
+    def reset(self) -> None:
+        """Start over from the first wave, e.g. when a new round starts."""
+        self.elapsed_ms = 0.0
+        self.next_batch_ms = None
+        self.pending = deque()
+        self.frame_time_ms = 0.0
+
+    def getWave(self) -> dict:
+        """Return the wave in effect at the current time."""
+        current = self.waves[0]
+        for wave in self.waves:
+            if wave["start_ms"] > self.elapsed_ms:
+                break
+            current = wave
+        return current
+
+    def rollBatch(self, rng) -> None:
+        """Queue the asteroids of a batch of the current wave spread over its spread, and roll when the next is due."""
+        wave = self.getWave()
+        amount = rng.randint(*wave["amount"])
+        for index in range(amount):
+            self.pending.append(self.elapsed_ms + wave["spread_ms"] * index / amount)
+        self.next_batch_ms = self.elapsed_ms + rng.uniform(*wave["interval_ms"])
+        self.stats["batches"] += 1
+        self.stats["scheduled"] += amount
+
+    def isOverBudget(self) -> bool:
+        """Return True while frames take longer than SPAWN_FRAME_TIME_BUDGET_MS on average."""
+        return self.frame_time_ms > Constants.SPAWN_FRAME_TIME_BUDGET_MS
+
+    def update(self, game, elapsed_ms: float) -> None:
+        """Advance by one simulation step and add the asteroids that are due to the game.
+        Args:
+            game (Game): the game to spawn into, providing the ship, the seeded randomness and the frame time
+            elapsed_ms (float): simulation time the step covers
+        """
+        # The frame time the simulation is driven by, so replays and fixed-step games shed identically
+        frame_time = game.dt if game.fixed_frame_time is None else game.fixed_frame_time
+        self.frame_time_ms += (frame_time - self.frame_time_ms) * Constants.SPAWN_FRAME_TIME_SMOOTHING
+        self.elapsed_ms += elapsed_ms
+        if self.next_batch_ms is None:
+            self.next_batch_ms = self.elapsed_ms + game.random.uniform(*self.getWave()["interval_ms"])
+        if self.elapsed_ms >= self.next_batch_ms:
+            self.rollBatch(game.random)
+
+        pending = self.pending
+        # Spawns held back for too long are dropped rather than arriving all at once later
+        while pending and self.elapsed_ms - pending[0] > Constants.SPAWN_MAX_DEFER_MS:
+            pending.popleft()
+            self.stats["shed"] += 1
+
+        released = 0
+        while pending and pending[0] <= self.elapsed_ms and released < Constants.SPAWNS_PER_STEP:
+            if len(game.asteroid_sprites) >= Constants.MAX_LIVE_ASTEROIDS or self.isOverBudget():
+                self.stats["deferred"] += 1
+                break
+            pending.popleft()
+            game.addAsteroidSprite(createAsteroid(game.player_ship, game.random))
+            released += 1
+            self.stats["spawned"] += 1
+
+    def captureState(self) -> dict:
+        """Return the scheduler's progress for a game snapshot."""
+        return {
+            "elapsed_ms": self.elapsed_ms,
+            "next_batch_ms": self.next_batch_ms,
+            "pending": list(self.pending),
+            "frame_time_ms": self.frame_time_ms,
+        }
+
+    def restoreState(self, state: dict) -> None:
+        """Continue from progress returned by captureState."""
+        self.elapsed_ms = state["elapsed_ms"]
+        self.next_batch_ms = state["next_batch_ms"]
+        self.pending = deque(state["pending"])
+        self.frame_time_ms = state["frame_time_ms"]
+
+    def getStats(self) -> dict:
+        """Return the spawn counters along with the queue length and the smoothed frame time."""
+        return dict(self.stats, pending=len(self.pending), frame_time_ms=self.frame_time_ms)
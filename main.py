@@ -1,27 +1,50 @@
 """
 Main entry point for the Galaga Remix game.
-This module initializes the game and runs the main game loop.
+This module opens the window, shows the loading screen while assets and audio
+load in the background, and runs the main game loop.
 """
 
-from GameController import Game, initiateGameScreen
+from time import perf_counter
+PROCESS_START = perf_counter()
+
+import random
+import pygame
+import Constants
+from LoadingController import initiateGameScreen, createGameLoader, runLoadingScreen
 
 
 def main():
     """Initialize and run the main game loop."""
-    # Initialize game screen and state
+    # Open the window right away and load everything else behind the loading screen
     SCREEN = initiateGameScreen()
-    game = Game(SCREEN)
-    
+    startup_times = {}
+    loader = createGameLoader()
+    runLoadingScreen(SCREEN, loader, startup_times, PROCESS_START)
+
+    Game = loader.getResult("modules").Game
+    seed = None
+    if Constants.REPLAY_RECORD_FILE:
+        from InputController import getInputSource, setInputSource
+        from ReplayController import RecordingInput
+        from ViewportController import getViewport
+        # A replay needs the seed, so pick one instead of letting the game seed itself
+        seed = random.SystemRandom().randrange(2 ** 63)
+        setInputSource(RecordingInput(getInputSource(), Constants.REPLAY_RECORD_FILE, seed,
+                                      getViewport().window_size, Constants.WORLD_SIZE))
+    game = Game(SCREEN, seed=seed, explosion_animation_images=loader.getResult("explosion_animation_images"))
+    if Constants.REPLAY_RECORD_FILE:
+        # Quality tiers change how the game plays out, a replay could not reproduce them
+        game.quality.setEnabled(False)
+    game.runFrame()
+    startup_times["time_to_first_frame_ms"] = (perf_counter() - PROCESS_START) * 1000
+    game.profiler.addCounterSource("startup", lambda: startup_times)
+    if Constants.PRINT_STARTUP_TIMES:
+        print("Startup: " + ", ".join(f"{name} {elapsed:.0f}" for name, elapsed in startup_times.items()))
+
     # Main game loop
     while game.isGameStillRunning:
-        game.handleGameEvents()
-        game.handleEnemyAndObstacleGeneration()
-        game.handleSpriteMotion()
-        game.handleCollisions()
-        game.handleAnimations()
-        game.handleDestruction()
-        game.handleButtonGeneration()
-        game.updateSprites()
+        game.runFrame()
+    pygame.quit()
 
 
 if __name__ == "__main__":